@@ -0,0 +1,242 @@
+# ================================================================
+# Ajuste direto do modelo WSGG contra a emitância LBL
+# ε(T,S) = Σ_j a_j(T) (1 − e^{−k_j p S}),   a_j(T) = Σ_i b_{j,i} T^i
+# Otimiza juntos os k_j e os b_{j,i} (mínimos quadrados não lineares
+# com jacobiano analítico); o polinômio é ajustado em T/T_ref e os
+# coeficientes são devolvidos na forma em T bruto usada no CFD
+# ================================================================
+
+import argparse
+from dataclasses import dataclass, field
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from leitura_espectros import ler_colunas
+from metricas_wsgg import calcular_erros, imprimir_tabela
+from modelo_wsgg import ModeloWSGG
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+N_CINZAS = 4        # número de gases cinzas (sem contar a janela transparente)
+GRAU = 4            # grau dos polinômios a_j(T)  (T, T², T³, T⁴ como em regression_multiple.py)
+PRESSAO_ATM = 1.0   # pressão parcial do absorvedor [atm]
+PENALIDADE = 10.0   # peso das restrições físicas dos a_j no ajuste
+# ---------------------------------------------------------------
+
+
+@dataclass
+class AjusteWSGG:
+    """Resultado do ajuste: k_j [1/(atm·m)] e b_{j,i} (a_j(T) = Σ_i b_{j,i} T^i)."""
+    k: np.ndarray
+    b: np.ndarray
+    pressao: float
+    T: np.ndarray
+    S: np.ndarray
+    eps_lbl: np.ndarray
+    eps_wsgg: np.ndarray
+    custo: float
+    erros: dict = field(default_factory=dict)
+
+    def pesos(self, T) -> np.ndarray:
+        """a_j(T) para cada gás cinza → (..., n_cinzas)."""
+        return _polinomio(np.asarray(T, dtype=float), self.b)
+
+    def emitancia(self, T, S, pressao: float | None = None) -> np.ndarray:
+        """ε nas combinações T × S → (n_T, n_S)."""
+        p = self.pressao if pressao is None else pressao
+        A = -np.expm1(-np.multiply.outer(p * np.atleast_1d(S), self.k))   # (n_S, J)
+        return self.pesos(np.atleast_1d(T)) @ A.T
+
+    def modelo(self) -> ModeloWSGG:
+        """Avaliador vetorizado (ModeloWSGG) com os coeficientes ajustados."""
+        return ModeloWSGG(self.k, self.b)
+
+
+def _polinomio(x: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Σ_i b_{j,i} x^i para todos os j (Horner) → (..., J)."""
+    out = np.zeros(np.shape(x) + (b.shape[0],))
+    for i in range(b.shape[1] - 1, -1, -1):
+        out = out * np.asarray(x)[..., None] + b[:, i]
+    return out
+
+
+def _base(T: np.ndarray, T_ref: float, grau: int) -> np.ndarray:
+    """Matriz (n_T, grau+1) com (T/T_ref)^i — bem condicionada."""
+    return (T / T_ref)[:, None] ** np.arange(grau + 1)
+
+
+def _b_para_T_bruto(b_esc: np.ndarray, T_ref: float) -> np.ndarray:
+    """Converte b da base (T/T_ref)^i para a base T^i."""
+    return b_esc / T_ref ** np.arange(b_esc.shape[1])
+
+
+def _b_linear(P: np.ndarray, A: np.ndarray, eps: np.ndarray, peso: np.ndarray) -> np.ndarray:
+    """b ótimo com k fixo: ε[t,s] = Σ_{j,i} P[t,i] A[s,j] b[j,i] (mínimos quadrados lineares)."""
+    Phi = np.einsum("ti,sj->tsji", P, A).reshape(eps.size, -1)
+    sol, *_ = np.linalg.lstsq(Phi * peso.reshape(-1, 1), (eps * peso).ravel(), rcond=None)
+    return sol.reshape(A.shape[1], P.shape[1])
+
+
+def ajustar_wsgg(T, S, eps_lbl, n_cinzas: int = N_CINZAS, grau: int = GRAU,
+                 pressao: float = PRESSAO_ATM, relativo: bool = True,
+                 k0=None, penalidade: float = PENALIDADE) -> AjusteWSGG:
+    """
+    Ajusta k_j e b_{j,i} à tabela de emitância LBL.
+
+    T       : (n_T,) temperaturas [K]
+    S       : (n_S,) percursos [m]
+    eps_lbl : (n_T, n_S) emitância LBL
+    relativo: minimiza o erro relativo (peso 1/ε_LBL) em vez do absoluto
+    k0      : chute inicial de k_j; padrão: log-espaçado no intervalo de p·S
+    penalidade: peso das restrições a_j(T) >= 0 e Σ a_j(T) <= 1
+
+    Com n_S <= n_cinzas os k_j ficam mal determinados pelos dados (vários
+    conjuntos de k reproduzem a tabela); use mais percursos ou fixe k0.
+    """
+    T = np.asarray(T, dtype=float)
+    S = np.asarray(S, dtype=float)
+    eps_lbl = np.asarray(eps_lbl, dtype=float)
+    if eps_lbl.shape != (T.size, S.size):
+        raise ValueError(f"eps_lbl deve ter forma (n_T, n_S) = ({T.size}, {S.size}).")
+
+    T_ref = T.max()
+    P = _base(T, T_ref, grau)                       # (n_T, I+1)
+    pS = pressao * S                                # (n_S,)
+    peso = 1.0 / eps_lbl if relativo else np.ones_like(eps_lbl)
+    J, I1 = n_cinzas, grau + 1
+
+    if k0 is None:
+        k0 = np.geomspace(0.3 / pS.max(), 3.0 / pS.min(), J)
+    log_k0 = np.log(np.asarray(k0, dtype=float))
+    b0 = _b_linear(P, -np.expm1(-np.outer(pS, np.exp(log_k0))), eps_lbl, peso)
+
+    def desempacotar(x):
+        return np.exp(x[:J]), x[J:].reshape(J, I1)
+
+    def residuos(x):
+        k, b = desempacotar(x)
+        A = -np.expm1(-np.outer(pS, k))             # (n_S, J)
+        a = P @ b.T                                 # (n_T, J)
+        r = ((a @ A.T - eps_lbl) * peso).ravel()
+        # penalidade física: a_j(T) >= 0 e Σ_j a_j(T) <= 1 nas temperaturas da tabela
+        neg = penalidade * np.minimum(a, 0.0).ravel()
+        exc = penalidade * np.maximum(a.sum(axis=1) - 1.0, 0.0)
+        return np.concatenate([r, neg, exc])
+
+    def jacobiano(x):
+        k, b = desempacotar(x)
+        E = np.exp(-np.outer(pS, k))                # (n_S, J)
+        A = 1.0 - E
+        a = P @ b.T                                 # (n_T, J)
+        # ∂ε/∂ln k_j = a_j(T) · k_j p S · e^{−k_j p S}
+        d_logk = a[:, None, :] * (np.outer(pS, k) * E)[None, :, :]
+        # ∂ε/∂b_{j,i} = (T/T_ref)^i · (1 − e^{−k_j p S})
+        d_b = np.einsum("ti,sj->tsji", P, A).reshape(T.size, S.size, J * I1)
+        jac = (np.concatenate([d_logk, d_b], axis=2) * peso[:, :, None]).reshape(T.size * S.size, -1)
+        # linhas das penalidades: só dependem de b (∂a_j/∂b_{j,i} = (T/T_ref)^i)
+        j_neg = np.zeros((T.size, J, J + J * I1))
+        for j in range(J):
+            j_neg[:, j, J + j * I1: J + (j + 1) * I1] = P * (a[:, j] < 0)[:, None]
+        j_exc = np.zeros((T.size, J + J * I1))
+        j_exc[:, J:] = np.tile(P, J) * (a.sum(axis=1) > 1.0)[:, None]
+        return np.vstack([jac, penalidade * j_neg.reshape(T.size * J, -1), penalidade * j_exc])
+
+    # k_j limitado a [0,01/(p S_max), 100/(p S_min)]: fora disso o gás cinza é
+    # transparente ou opaco em todos os percursos e os a_j ficam indeterminados
+    lim = np.full(J * I1, np.inf)
+    inf = np.concatenate([np.full(J, np.log(0.01 / pS.max())), -lim])
+    sup = np.concatenate([np.full(J, np.log(100.0 / pS.min())), lim])
+    x0 = np.concatenate([np.clip(log_k0, inf[:J] + 1e-9, sup[:J] - 1e-9), b0.ravel()])
+    sol = least_squares(residuos, x0, jac=jacobiano, bounds=(inf, sup), method="trf",
+                        x_scale="jac", ftol=1e-12, xtol=1e-12, gtol=1e-12, max_nfev=2000)
+    k, b_esc = desempacotar(sol.x)
+    ordem = np.argsort(k)
+    k, b_esc = k[ordem], b_esc[ordem]
+
+    b = _b_para_T_bruto(b_esc, T_ref)
+    A = -np.expm1(-np.outer(pS, k))
+    eps_wsgg = P @ b_esc.T @ A.T
+    erros = {s: calcular_erros(eps_lbl[:, i], eps_wsgg[:, i]) for i, s in enumerate(S)}
+    return AjusteWSGG(k, b, pressao, T, S, eps_lbl, eps_wsgg, float(sol.cost), erros)
+
+# ===================== REGRESSÃO DOS a_j(T) (VÁRIOS ALVOS, UMA FATORAÇÃO) =====================
+
+def ajustar_polinomios(T, Y, grau: int = GRAU) -> tuple:
+    """
+    Ajusta Y[:, j] ≈ Σ_i c_{j,i} T^i para todos os alvos j de uma só vez.
+
+    A regressão é resolvida numa única fatoração (SVD, np.linalg.lstsq) da
+    base de Chebyshev em T normalizado para [-1, 1], bem condicionada, em
+    vez da base [1, T, …, T⁴] (valores até ~1e12). Os coeficientes são
+    convertidos de volta para a forma em T bruto esperada pelo CFD.
+
+    Retorna (coef (n_alvos, grau+1) na ordem [const, T, T², …],
+             valores ajustados (n_T, n_alvos), R² (n_alvos,)).
+    """
+    T = np.asarray(T, dtype=float)
+    Y = np.asarray(Y, dtype=float)
+    Y2 = Y.reshape(len(T), -1)
+    alfa = 2.0 / (T.max() - T.min())
+    beta = -(T.max() + T.min()) / (T.max() - T.min())
+    x = alfa * T + beta                                   # T → [-1, 1]
+
+    V = np.polynomial.chebyshev.chebvander(x, grau)       # (n_T, grau+1)
+    c_cheb, *_ = np.linalg.lstsq(V, Y2, rcond=None)       # (grau+1, n_alvos)
+    ajustados = V @ c_cheb
+
+    # Chebyshev em x → potências de x → potências de T (x = αT + β)
+    x_de_T = np.polynomial.Polynomial([beta, alfa])
+    coef = np.zeros((Y2.shape[1], grau + 1))
+    for j in range(Y2.shape[1]):
+        p = np.polynomial.Polynomial(np.polynomial.chebyshev.cheb2poly(c_cheb[:, j]))(x_de_T)
+        coef[j, :len(p.coef)] = p.coef
+
+    ss_res = np.sum((Y2 - ajustados) ** 2, axis=0)
+    ss_tot = np.sum((Y2 - Y2.mean(axis=0)) ** 2, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r2 = 1.0 - ss_res / ss_tot
+    return coef, ajustados, r2
+
+# ===================== VALIDAÇÃO (mesma comparação de emission_wsgg.py) =====================
+
+def validar(ajuste: AjusteWSGG) -> None:
+    """Imprime, para cada percurso, a tabela LBL × WSGG e as métricas de erro."""
+    for i, s in enumerate(ajuste.S):
+        imprimir_tabela(ajuste.T, ajuste.eps_lbl[:, i], ajuste.eps_wsgg[:, i],
+                        ajuste.erros[s], f"Percurso S = {s:g} m".replace(".", ","))
+
+
+def imprimir_coeficientes(ajuste: AjusteWSGG) -> None:
+    """Coeficientes no formato do CFD: k_j e b_{j,i} (a_j = Σ b_{j,i} T^i)."""
+    print("\n" + "="*70)
+    print(f"COEFICIENTES WSGG  (p = {ajuste.pressao:g} atm)")
+    print("="*70)
+    cab = " | ".join(f"{'b_' + str(i):>13}" for i in range(ajuste.b.shape[1]))
+    print(f"{'j':>2} | {'k_j [1/atm·m]':>13} | {cab}")
+    print("-"*70)
+    for j, (kj, bj) in enumerate(zip(ajuste.k, ajuste.b), start=1):
+        print(f"{j:>2} | {kj:13.6e} | " + " | ".join(f"{v:13.6e}" for v in bj))
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Ajuste WSGG (k_j e b_{j,i}) contra emitância LBL.")
+    ap.add_argument("tabela", help="arquivo texto: 1ª coluna T [K], demais colunas ε LBL por percurso")
+    ap.add_argument("--S", type=float, nargs="+", required=True, help="percursos [m] das colunas da tabela")
+    ap.add_argument("--cinzas", type=int, default=N_CINZAS, help="número de gases cinzas")
+    ap.add_argument("--grau", type=int, default=GRAU, help="grau dos polinômios a_j(T)")
+    ap.add_argument("--pressao", type=float, default=PRESSAO_ATM, help="pressão parcial [atm]")
+    ap.add_argument("--absoluto", action="store_true", help="minimiza o erro absoluto (padrão: relativo)")
+    args = ap.parse_args(argv)
+
+    tab = ler_colunas(args.tabela)
+    if tab.shape[1] != len(args.S) + 1:
+        ap.error(f"a tabela tem {tab.shape[1] - 1} colunas de ε, mas --S tem {len(args.S)} valores.")
+    ajuste = ajustar_wsgg(tab[:, 0], args.S, tab[:, 1:], args.cinzas, args.grau,
+                          args.pressao, relativo=not args.absoluto)
+    validar(ajuste)
+    imprimir_coeficientes(ajuste)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+# ================================================================
+# Executor de etapas em DAG com cache de artefatos por conteúdo
+# Cada etapa declara arquivos de entrada, etapas de que depende e
+# parâmetros; a chave da etapa é o SHA-256 de (nome, código da
+# função, hash dos módulos que ela chama, versão, parâmetros, hash do
+# conteúdo das entradas, chaves das dependências). As saídas ficam em
+# <armazem>/<chave>/ e só as etapas cuja chave não existe no armazém
+# são recalculadas
+# ================================================================
+
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import shutil
+import sys
+from dataclasses import dataclass, field
+from typing import Callable
+
+from renderizar_figuras import hash_com_memoria
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+ARMAZEM_PADRAO = "artefatos"
+ARQ_ETAPA = "etapa.json"       # metadados gravados em cada artefato
+ARQ_HASHES = "hashes.json"     # hashes das entradas externas (reaproveitados por tamanho/mtime)
+# ---------------------------------------------------------------
+
+
+@dataclass
+class Etapa:
+    """
+    funcao(entradas, parametros, saida): lê `entradas` {apelido: caminho} —
+    arquivos externos ou diretórios dos artefatos das dependências — e grava
+    os resultados no diretório `saida`.
+    """
+    nome: str
+    funcao: Callable
+    entradas: dict = field(default_factory=dict)      # {apelido: arquivo externo}
+    depende: dict = field(default_factory=dict)       # {apelido: nome da etapa}
+    parametros: dict = field(default_factory=dict)    # valores serializáveis em JSON
+    versao: str = "1"                                 # altere para invalidar à mão
+    modulos: list = field(default_factory=list)       # módulos chamados (nomes): o código entra na chave
+
+
+def arquivos_de_modulos(modulos) -> dict:
+    """
+    {nome: arquivo .py} dos `modulos` (nomes ou objetos módulo) e, recursivamente,
+    dos módulos do mesmo diretório que eles importam (import ou from ... import).
+    """
+    arquivos = {}
+    pilha = [importlib.import_module(m) if isinstance(m, str) else m for m in modulos]
+    while pilha:
+        mod = pilha.pop()
+        arq = getattr(mod, "__file__", None)
+        if not arq or mod.__name__ in arquivos:
+            continue
+        arquivos[mod.__name__] = os.path.realpath(arq)
+        pasta = os.path.dirname(arquivos[mod.__name__])
+        for valor in vars(mod).values():
+            nome_dep = getattr(valor, "__module__", None)
+            dep = valor if inspect.ismodule(valor) else \
+                sys.modules.get(nome_dep) if isinstance(nome_dep, str) else None
+            arq_dep = getattr(dep, "__file__", None)
+            if arq_dep and dep.__name__ not in arquivos \
+                    and os.path.dirname(os.path.realpath(arq_dep)) == pasta:
+                pilha.append(dep)
+    return arquivos
+
+
+class Pipeline:
+    """DAG de etapas com armazém de artefatos endereçado pela chave de cada etapa."""
+
+    def __init__(self, armazem: str = ARMAZEM_PADRAO):
+        self.armazem = os.path.abspath(armazem)
+        self.etapas = {}
+        self._chaves = {}
+        self._hashes = None
+
+    def etapa(self, nome: str, funcao: Callable, entradas=None, depende=None,
+              parametros=None, versao: str = "1", modulos=None) -> str:
+        """
+        Registra uma etapa; retorna o nome (para usar em `depende` das seguintes).
+        modulos: módulos que `funcao` chama (ex.: ["emitancia_lbl"]); o conteúdo deles e
+        dos módulos locais que importam entra na chave, então corrigir o código
+        recalcula a etapa sem mexer em `versao`.
+        """
+        if nome in self.etapas:
+            raise ValueError(f"etapa '{nome}' já registrada.")
+        self.etapas[nome] = Etapa(nome, funcao, dict(entradas or {}), dict(depende or {}),
+                                  dict(parametros or {}), versao, list(modulos or []))
+        self._chaves.clear()
+        return nome
+
+    # ---------------------- chaves ----------------------
+
+    def _hash_entrada(self, arq: str) -> str:
+        if self._hashes is None:
+            try:
+                with open(os.path.join(self.armazem, ARQ_HASHES), "r", encoding="utf-8") as f:
+                    self._hashes = json.load(f)
+            except (OSError, ValueError):
+                self._hashes = {}
+        arq = os.path.abspath(arq)
+        registro = self._hashes.get(arq)
+        sha = hash_com_memoria(arq, registro)
+        st = os.stat(arq)
+        self._hashes[arq] = {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha}
+        return sha
+
+    def _gravar_hashes(self) -> None:
+        if self._hashes is None:
+            return
+        os.makedirs(self.armazem, exist_ok=True)
+        arq = os.path.join(self.armazem, ARQ_HASHES)
+        with open(arq + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(self._hashes, f, indent=1, sort_keys=True)
+        os.replace(arq + ".tmp", arq)
+
+    def chave(self, nome: str, _visitando: tuple = ()) -> str:
+        """SHA-256 da etapa: muda se o código (função e módulos), a versão, os parâmetros, as entradas ou qualquer dependência mudar."""
+        if nome in self._chaves:
+            return self._chaves[nome]
+        if nome in _visitando:
+            raise ValueError(f"ciclo no DAG: {' → '.join(_visitando + (nome,))}.")
+        if nome not in self.etapas:
+            raise KeyError(f"etapa '{nome}' não registrada.")
+        e = self.etapas[nome]
+        descricao = {
+            "nome": e.nome,
+            "codigo": inspect.getsource(e.funcao),
+            "modulos": {m: self._hash_entrada(a) for m, a in arquivos_de_modulos(e.modulos).items()},
+            "versao": e.versao,
+            "parametros": e.parametros,
+            "entradas": {k: self._hash_entrada(v) for k, v in e.entradas.items()},
+            "depende": {k: self.chave(v, _visitando + (nome,)) for k, v in e.depende.items()},
+        }
+        texto = json.dumps(descricao, sort_keys=True, default=repr)
+        self._chaves[nome] = hashlib.sha256(texto.encode()).hexdigest()
+        return self._chaves[nome]
+
+    def caminho(self, nome: str) -> str:
+        """Diretório do artefato da etapa (existe só depois de executada)."""
+        return os.path.join(self.armazem, self.chave(nome))
+
+    def atualizada(self, nome: str) -> bool:
+        return os.path.exists(os.path.join(self.caminho(nome), ARQ_ETAPA))
+
+    # ---------------------- execução ----------------------
+
+    def ordem(self, alvos=None) -> list:
+        """Etapas necessárias para `alvos` (padrão: todas) em ordem topológica."""
+        ordem, vistos = [], set()
+
+        def visitar(nome, caminho=()):
+            if nome in caminho:
+                raise ValueError(f"ciclo no DAG: {' → '.join(caminho + (nome,))}.")
+            if nome in vistos:
+                return
+            for dep in self.etapas[nome].depende.values():
+                visitar(dep, caminho + (nome,))
+            vistos.add(nome)
+            ordem.append(nome)
+
+        for nome in (self.etapas if alvos is None else alvos):
+            visitar(nome)
+        return ordem
+
+    def _executar_etapa(self, nome: str) -> None:
+        e = self.etapas[nome]
+        final = self.caminho(nome)
+        tmp = f"{final}.tmp{os.getpid()}"
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        entradas = {k: os.path.abspath(v) for k, v in e.entradas.items()}
+        entradas.update({k: self.caminho(v) for k, v in e.depende.items()})
+        try:
+            e.funcao(entradas, dict(e.parametros), tmp)
+            meta = {"nome": nome, "chave": self.chave(nome), "versao": e.versao,
+                    "parametros": e.parametros, "entradas": entradas,
+                    "modulos": sorted(arquivos_de_modulos(e.modulos))}
+            with open(os.path.join(tmp, ARQ_ETAPA), "w", encoding="utf-8") as f:
+                json.dump(meta, f, indent=1, sort_keys=True, default=repr)
+            if os.path.exists(final):          # artefato incompleto de uma execução interrompida
+                shutil.rmtree(final)
+            os.replace(tmp, final)
+        except BaseException:
+            shutil.rmtree(tmp, ignore_errors=True)
+            raise
+
+    def executar(self, alvos=None, forcar: bool = False, aviso: Callable | None = None) -> dict:
+        """
+        Executa as etapas desatualizadas necessárias para `alvos`.
+        Retorna {etapa: "reaproveitada" | "calculada"}; aviso(nome, situacao) a cada etapa.
+        """
+        situacao = {}
+        try:
+            for nome in self.ordem(alvos):
+                if not forcar and self.atualizada(nome):
+                    situacao[nome] = "reaproveitada"
+                else:
+                    self._executar_etapa(nome)
+                    situacao[nome] = "calculada"
+                if aviso:
+                    aviso(nome, situacao[nome])
+        finally:
+            self._gravar_hashes()
+        return situacao
+
+    def orfaos(self) -> list:
+        """Artefatos do armazém que não pertencem a nenhuma etapa atual (podem ser apagados)."""
+        if not os.path.isdir(self.armazem):
+            return []
+        atuais = {self.chave(n) for n in self.etapas}
+        return sorted(os.path.join(self.armazem, d) for d in os.listdir(self.armazem)
+                      if os.path.isdir(os.path.join(self.armazem, d)) and d not in atuais)
@@ -0,0 +1,86 @@
+# ================================================================
+# Benchmark da convolução (convolucao.py): direta × FFT overlap-add
+# Mede as duas para núcleos de 3 … 1e5 pontos num espectro de 1e6
+# pontos e indica o tamanho de núcleo em que a FFT passa a ganhar
+# (valor a usar em convolucao.PONTOS_CRUZAMENTO)
+# ================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+from convolucao import PONTOS_CRUZAMENTO, convoluir
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS = 1_000_000
+NUCLEOS = [3, 7, 15, 31, 47, 63, 95, 127, 255, 511, 1023, 4095, 16383, 65535]
+DIRETA_ATE = 16383          # acima disso a convolução direta é pulada (lenta demais)
+REPETICOES = 3
+# ---------------------------------------------------------------
+
+
+def melhor_tempo(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - t0)
+    return min(tempos)
+
+
+def verificar_formas() -> None:
+    """Saída com o tamanho de y nos dois métodos, inclusive com núcleo maior que o sinal."""
+    rng = np.random.default_rng(1)
+    for n in (1, 30, 200):
+        y = rng.uniform(0.0, 1.0, n)
+        for m in (1, 3, 51, 101, 301):
+            k = np.exp(-np.linspace(-3.0, 3.0, m) ** 2)
+            for bordas in ("normalizar", "zero"):
+                r_dir = convoluir(y, k, "direta", bordas)
+                r_fft = convoluir(y, k, "fft", bordas)
+                assert r_dir.shape == r_fft.shape == y.shape, (n, m, r_dir.shape, r_fft.shape)
+                assert np.allclose(r_dir, r_fft), (n, m, bordas)
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark convolução direta × FFT overlap-add.")
+    ap.add_argument("--pontos", type=float, default=PONTOS)
+    ap.add_argument("--nucleos", type=int, nargs="+", default=NUCLEOS, help="tamanhos de núcleo (ímpares)")
+    ap.add_argument("--direta-ate", type=int, default=DIRETA_ATE)
+    ap.add_argument("--repeticoes", type=int, default=REPETICOES)
+    args = ap.parse_args(argv)
+
+    verificar_formas()
+    rng = np.random.default_rng(0)
+    y = rng.uniform(0.0, 1.0, int(args.pontos))
+    print(f"Espectro de {y.size:.0e} pontos; cruzamento configurado: {PONTOS_CRUZAMENTO} pontos")
+    print(f"{'núcleo':>7} | {'direta [s]':>10} | {'FFT [s]':>10} | {'mais rápida':>11} | {'máx. dif.':>9}")
+    print("-" * 60)
+    vencedoras = []
+    for m in args.nucleos:
+        k = np.exp(-np.linspace(-3.0, 3.0, m) ** 2)
+        k /= k.sum()
+        t_fft = melhor_tempo(lambda: convoluir(y, k, "fft"), args.repeticoes)
+        if m <= args.direta_ate:
+            t_dir = melhor_tempo(lambda: convoluir(y, k, "direta"), args.repeticoes)
+            dif = np.max(np.abs(convoluir(y, k, "direta") - convoluir(y, k, "fft")))
+            txt_dir, txt_dif = f"{t_dir:10.4f}", f"{dif:9.1e}"
+            vencedora = "direta" if t_dir <= t_fft else "FFT"
+        else:
+            txt_dir, txt_dif, vencedora = f"{'—':>10}", f"{'—':>9}", "FFT"
+        print(f"{m:7d} | {txt_dir} | {t_fft:10.4f} | {vencedora:>11} | {txt_dif}")
+        vencedoras.append((m, vencedora))
+
+    # menor núcleo a partir do qual a FFT vence em todos os tamanhos maiores
+    cruzamento = None
+    for m, v in reversed(vencedoras):
+        if v != "FFT":
+            break
+        cruzamento = m
+    if cruzamento is not None:
+        print(f"\nA FFT passa a ganhar a partir de ~{cruzamento} pontos de núcleo.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# ================================================================
+# Benchmark da decimação para gráficos (decimacao.py)
+# Desenha um espectro sintético de 1e6–1e7 pontos em eixo log com
+# ax.plot (completo) e com plotar_decimado, e compara o tempo de
+# renderização (Agg), o tamanho do SVG e a diferença em pixels
+# ================================================================
+
+import argparse
+import io
+import time
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+
+from decimacao import plotar_decimado
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS = 1_000_000
+NU_MIN, NU_MAX = 50.0, 12100.0
+REPETICOES = 3
+# ---------------------------------------------------------------
+
+
+def espectro_sintetico(n: int, seed: int = 0) -> tuple:
+    """σ(ν) log-normal com bandas largas e linhas estreitas isoladas."""
+    rng = np.random.default_rng(seed)
+    x = np.linspace(NU_MIN, NU_MAX, n)
+    y = np.exp(rng.normal(-50.0, 3.0, n) + 5.0 * np.sin(x / 300.0))
+    y[rng.integers(0, n, 20)] *= 1e6
+    return x, y
+
+
+def figura(x, y, decimado: bool):
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    if decimado:
+        plotar_decimado(ax, x, y, color="#0072B2", lw=1.0)
+    else:
+        ax.plot(x, y, color="#0072B2", lw=1.0)
+    ax.set_yscale("log")
+    ax.set_xlim(NU_MIN, NU_MAX)
+    return fig
+
+
+def medir(x, y, decimado: bool, repeticoes: int) -> tuple:
+    """(melhor tempo de criar + desenhar [s], bytes do SVG, imagem RGB)."""
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        fig = figura(x, y, decimado)
+        fig.canvas.draw()
+        tempos.append(time.perf_counter() - t0)
+        plt.close(fig)
+    fig = figura(x, y, decimado)
+    fig.canvas.draw()
+    img = np.asarray(fig.canvas.buffer_rgba())[..., :3].astype(int)
+    svg = io.BytesIO()
+    fig.savefig(svg, format="svg")
+    plt.close(fig)
+    return min(tempos), svg.tell(), img
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark ax.plot completo × envelope mín/máx.")
+    ap.add_argument("--pontos", type=float, default=PONTOS)
+    ap.add_argument("--repeticoes", type=int, default=REPETICOES)
+    args = ap.parse_args(argv)
+
+    x, y = espectro_sintetico(int(args.pontos))
+    t_c, svg_c, img_c = medir(x, y, False, args.repeticoes)
+    t_d, svg_d, img_d = medir(x, y, True, args.repeticoes)
+    dif = np.abs(img_c - img_d).max(axis=2)
+
+    print(f"Espectro de {x.size:.0e} pontos (eixo log)")
+    print(f"{'traço':>10} | {'desenho [s]':>11} | {'SVG [kB]':>9}")
+    print("-" * 37)
+    print(f"{'completo':>10} | {t_c:11.4f} | {svg_c / 1024:9.0f}")
+    print(f"{'decimado':>10} | {t_d:11.4f} | {svg_d / 1024:9.0f}")
+    print(f"\nAceleração: {t_c / t_d:.1f}×; pixels com diferença > 25%: {100 * np.mean(dif > 64):.3f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# ================================================================
+# Benchmark dos leitores de texto: np.loadtxt × leitura_espectros
+# Gera arquivos sintéticos (formato .xsec de 2 colunas e κ HITRAN de
+# 1 coluna) com 1e5 … 1e8 linhas e mede o tempo de cada leitor
+# ================================================================
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from leitura_espectros import ler_colunas, ler_xsec
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+LINHAS = [1e5, 1e6, 1e7]          # use --linhas 1e5 1e6 1e7 1e8 para o caso maior
+LOADTXT_ATE = 1e7                 # acima disso o np.loadtxt é pulado (lento demais)
+FORMATOS = {
+    "xsec (2 col.)": "%12.6f %13.6E",   # nu, sigma (layout dos .xsec do ExoMol)
+    "HITRAN (1 col.)": "%.6E",          # κ em 1 coluna
+}
+# ---------------------------------------------------------------
+
+
+def gerar_arquivo(arq: str, n: int, fmt: str, bloco: int = 1_000_000) -> None:
+    """Grava `n` linhas sintéticas (nu crescente e valores log-distribuídos) em blocos."""
+    rng = np.random.default_rng(0)
+    ncols = len(fmt.split())
+    with open(arq, "wb") as f:
+        for i0 in range(0, n, bloco):
+            m = min(bloco, n - i0)
+            nu = 50.0 + 0.01 * np.arange(i0, i0 + m)
+            y = 10.0 ** rng.uniform(-30, -18, m)
+            dados = np.column_stack([nu, y]) if ncols == 2 else y[:, None]
+            np.savetxt(f, dados, fmt=fmt)
+
+
+def cronometrar(func, *args):
+    t0 = time.perf_counter()
+    r = func(*args)
+    return time.perf_counter() - t0, r
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark np.loadtxt × ler_colunas.")
+    ap.add_argument("--linhas", type=float, nargs="+", default=LINHAS)
+    ap.add_argument("--loadtxt-ate", type=float, default=LOADTXT_ATE,
+                    help="maior nº de linhas em que o np.loadtxt é medido")
+    ap.add_argument("--dir", default=None, help="diretório dos arquivos temporários")
+    args = ap.parse_args(argv)
+
+    print(f"{'arquivo':>16} | {'linhas':>9} | {'MB':>8} | {'loadtxt [s]':>11} | "
+          f"{'ler_colunas [s]':>15} | {'ganho':>6} | {'máx. erro rel.':>14} | {'memmap [s]':>10}")
+    print("-" * 110)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        for nome, fmt in FORMATOS.items():
+            for n in (int(x) for x in args.linhas):
+                arq = os.path.join(tmp, f"sintetico_{n}.txt")
+                gerar_arquivo(arq, n, fmt)
+                mb = os.path.getsize(arq) / 2**20
+
+                t_rapido, rapido = cronometrar(ler_colunas, arq)
+                if n <= args.loadtxt_ate:
+                    t_loadtxt, ref = cronometrar(lambda: np.loadtxt(arq, ndmin=2))
+                    erro = np.max(np.abs(rapido - ref) / np.abs(ref))
+                    txt_loadtxt, txt_ganho, txt_erro = f"{t_loadtxt:11.3f}", f"{t_loadtxt / t_rapido:5.1f}x", f"{erro:14.2e}"
+                    del ref
+                else:
+                    txt_loadtxt, txt_ganho, txt_erro = f"{'—':>11}", f"{'—':>6}", f"{'—':>14}"
+
+                # 2ª abertura pelo cache .npy (np.memmap) do ler_xsec
+                t_memmap = float("nan")
+                if len(fmt.split()) == 2:
+                    ler_xsec(arq)
+                    t_memmap, _ = cronometrar(ler_xsec, arq)
+
+                print(f"{nome:>16} | {n:9.0e} | {mb:8.1f} | {txt_loadtxt} | {t_rapido:15.3f} | "
+                      f"{txt_ganho} | {txt_erro} | {t_memmap:10.4f}")
+                del rapido
+                for sufixo in ("", ".cache.npy", ".cache.json"):
+                    if os.path.exists(arq + sufixo):
+                        os.remove(arq + sufixo)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# ================================================================
+# Benchmark do perfil de Voigt (perfil_voigt.py)
+# Avaliações por segundo e erro relativo máximo de cada método
+# frente ao scipy.special.wofz, em pares (x, y) aleatórios que cobrem
+# do regime Doppler (y → 0) ao Lorentz (y ≫ 1) e as asas distantes
+# ================================================================
+
+import argparse
+import time
+
+import numpy as np
+from scipy.special import wofz
+
+from perfil_voigt import funcao_voigt
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PARES = [1e5, 1e6, 1e7]
+METODOS = {
+    "weideman (N=32)": dict(metodo="weideman", n_termos=32),
+    "weideman (N=24)": dict(metodo="weideman", n_termos=24),
+    "humlicek (W4)": dict(metodo="humlicek"),
+    "referencia": dict(metodo="referencia"),
+}
+X_MAX = 100.0               # |x| máximo (asas)
+Y_MIN, Y_MAX = 1e-4, 1e2    # faixa log-uniforme de y = γ/(σ√2)
+# ---------------------------------------------------------------
+
+
+def pares_aleatorios(n: int, semente: int = 0) -> tuple:
+    """x concentrado perto do centro (|x| ~ u³·X_MAX) e y log-uniforme."""
+    rng = np.random.default_rng(semente)
+    x = X_MAX * rng.uniform(-1.0, 1.0, n) * rng.uniform(0.0, 1.0, n) ** 3
+    y = 10.0 ** rng.uniform(np.log10(Y_MIN), np.log10(Y_MAX), n)
+    return x, y
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Benchmark do perfil de Voigt × scipy.special.wofz.")
+    ap.add_argument("--pares", type=float, nargs="+", default=PARES)
+    args = ap.parse_args(argv)
+
+    print(f"{'método':>16} | {'pares':>9} | {'tempo [s]':>10} | {'Mavaliações/s':>13} | "
+          f"{'ganho':>6} | {'máx. erro rel.':>14}")
+    print("-" * 86)
+    for n in (int(v) for v in args.pares):
+        x, y = pares_aleatorios(n)
+        t0 = time.perf_counter()
+        ref = wofz(x + 1j * y).real
+        t_wofz = time.perf_counter() - t0
+        for nome, kw in METODOS.items():
+            t0 = time.perf_counter()
+            K = funcao_voigt(x, y, **kw)
+            t = time.perf_counter() - t0
+            erro = np.max(np.abs(K - ref) / ref)
+            print(f"{nome:>16} | {n:9.0e} | {t:10.4f} | {n / t / 1e6:13.1f} | "
+                  f"{t_wofz / t:5.1f}x | {erro:14.2e}")
+        print(f"{'wofz (direto)':>16} | {n:9.0e} | {t_wofz:10.4f} | {n / t_wofz / 1e6:13.1f} | "
+              f"{1.0:5.1f}x | {0.0:14.2e}")
+        print("-" * 86)
+
+
+if __name__ == "__main__":
+    main()
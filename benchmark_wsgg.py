@@ -0,0 +1,84 @@
+# ================================================================
+# Micro-benchmark do avaliador WSGG (modelo_wsgg.ModeloWSGG)
+# Mede avaliações de ε(T, S, p) por segundo em campos de 1e4 … 1e7
+# pontos, com e sem buffer de saída pré-alocado (out=), e a vazão
+# (células/s) da consulta para CFD (consulta_cfd.ConsultaCFD)
+# ================================================================
+
+import argparse
+import time
+
+import numpy as np
+
+from consulta_cfd import ConsultaCFD
+from modelo_wsgg import ModeloWSGG
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS = [1e4, 1e5, 1e6, 1e7]
+REPETICOES = 5
+CELULAS = [1e6, 1e7]               # use --celulas 1e8 para o caso maior (~8 GB entre campos e buffers)
+THREADS = [1, 2, 4]
+# Coeficientes ilustrativos (4 gases cinzas, polinômios de grau 4 em T bruto)
+K = [0.15, 0.55, 4.5, 25.0]
+B = [[ 1.255e-01,  9.782e-04, -2.786e-06,  2.484e-09, -7.452e-13],
+     [ 7.719e-01, -1.625e-03,  3.185e-07,  2.000e-09, -1.098e-12],
+     [-5.675e-01,  4.583e-03, -7.466e-06,  4.899e-09, -1.182e-12],
+     [ 1.206e+00, -6.990e-03,  1.540e-05, -1.336e-08,  4.046e-12]]
+# ---------------------------------------------------------------
+
+
+def melhor_tempo(func, repeticoes: int) -> float:
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        func()
+        tempos.append(time.perf_counter() - t0)
+    return min(tempos)
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Micro-benchmark do avaliador WSGG.")
+    ap.add_argument("--pontos", type=float, nargs="+", default=PONTOS)
+    ap.add_argument("--repeticoes", type=int, default=REPETICOES)
+    ap.add_argument("--celulas", type=float, nargs="+", default=CELULAS)
+    ap.add_argument("--threads", type=int, nargs="+", default=THREADS)
+    args = ap.parse_args(argv)
+
+    modelo = ModeloWSGG(K, B)
+    rng = np.random.default_rng(0)
+    print(f"{'pontos':>9} | {'sem out [s]':>11} | {'Mavaliações/s':>13} | {'com out [s]':>11} | {'Mavaliações/s':>13}")
+    print("-" * 70)
+    for n in (int(x) for x in args.pontos):
+        T = rng.uniform(400.0, 1200.0, n)
+        S = rng.uniform(0.1, 30.0, n)
+        p = rng.uniform(0.1, 1.0, n)
+        buf = np.empty(n)
+        t_novo = melhor_tempo(lambda: modelo.emitancia(T, S, p), args.repeticoes)
+        t_out = melhor_tempo(lambda: modelo.emitancia(T, S, p, out=buf), args.repeticoes)
+        print(f"{n:9.0e} | {t_novo:11.4f} | {n / t_novo / 1e6:13.1f} | {t_out:11.4f} | {n / t_out / 1e6:13.1f}")
+
+    # broadcasting: grade T × S × p sem materializar as entradas
+    T = np.linspace(400.0, 1200.0, 161)[:, None, None]
+    S = np.geomspace(0.01, 30.0, 400)[None, :, None]
+    p = np.linspace(0.1, 1.0, 10)[None, None, :]
+    t = melhor_tempo(lambda: modelo.emitancia(T, S, p), args.repeticoes)
+    n = 161 * 400 * 10
+    print(f"\nGrade 161 T × 400 S × 10 p = {n:.1e} pontos: {t:.4f} s ({n / t / 1e6:.1f} Mavaliações/s)")
+
+    # consulta CFD: a_j(T) e κ_j = k_j p por célula, buffers reutilizados
+    consulta = ConsultaCFD(modelo)
+    print(f"\n{'células':>9} | {'threads':>7} | {'tempo [s]':>10} | {'Mcélulas/s':>10}")
+    print("-" * 46)
+    for n in (int(x) for x in args.celulas):
+        T = rng.uniform(300.0, 1300.0, n)
+        p = rng.uniform(0.05, 1.0, n)
+        a, kappa = consulta.alocar(n)
+        for nt in args.threads:
+            t = melhor_tempo(lambda: consulta.avaliar(T, p, a, kappa, threads=nt), args.repeticoes)
+            print(f"{n:9.0e} | {nt:7d} | {t:10.4f} | {n / t / 1e6:10.1f}")
+        del T, p, a, kappa
+    consulta.fechar()
+
+
+if __name__ == "__main__":
+    main()
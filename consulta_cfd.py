@@ -0,0 +1,125 @@
+# ================================================================
+# Consulta WSGG para campos de células de CFD (1e6–1e8 células)
+# Para cada célula: pesos a_j(T) (Horner, T limitado à faixa do
+# ajuste) e coeficientes de absorção κ_j = k_j · p_a [1/m], gravados
+# em buffers pré-alocados; blocos opcionalmente em paralelo (threads:
+# as operações do NumPy liberam o GIL)
+# ================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from modelo_wsgg import ModeloWSGG
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+T_MIN, T_MAX = 400.0, 1200.0      # faixa de T usada no ajuste dos b_{j,i} [K]
+CELULAS_POR_BLOCO = 1 << 16       # células por bloco (cabem no cache da CPU)
+# ---------------------------------------------------------------
+
+
+class ConsultaCFD:
+    """
+    Avaliação de a_j(T) e κ_j(p) em todas as células a cada iteração radiativa.
+
+    modelo : ModeloWSGG (ex.: AjusteWSGG.modelo() ou ModeloWSGG(k, b) com os
+             coeficientes de regression_multiple.py)
+    O gás transparente (janela) tem peso a_0 = 1 − Σ_j a_j e κ_0 = 0.
+    """
+
+    def __init__(self, modelo: ModeloWSGG, T_min: float = T_MIN, T_max: float = T_MAX,
+                 celulas_por_bloco: int = CELULAS_POR_BLOCO, threads: int | None = None):
+        self.modelo = modelo
+        self.T_min, self.T_max = float(T_min), float(T_max)
+        self.celulas_por_bloco = int(celulas_por_bloco)
+        self.threads = threads
+        self._pool = None
+        self._threads_pool = 0
+
+    @property
+    def n_cinzas(self) -> int:
+        return self.modelo.n_cinzas
+
+    def alocar(self, forma, dtype=np.float64) -> tuple:
+        """
+        Buffers (a, kappa), cada um de forma (J,) + forma do campo.
+        Reutilize-os entre iterações; float32 reduz a memória à metade.
+        """
+        if isinstance(forma, (int, np.integer)):
+            forma = (forma,)
+        forma = (self.n_cinzas,) + tuple(forma)
+        return np.empty(forma, dtype=dtype), np.empty(forma, dtype=dtype)
+
+    def _bloco(self, T, p, a, kappa, s: slice) -> None:
+        """Uma faixa de células: T limitado (em kappa[-1] como rascunho), Horner, κ_j."""
+        Tc = np.clip(T[s], self.T_min, self.T_max, out=kappa[-1, s])
+        for j in range(self.n_cinzas):
+            self.modelo.peso(j, Tc, out=a[j, s])
+        for j in range(self.n_cinzas):
+            if np.ndim(p) == 0:
+                kappa[j, s] = self.modelo.k[j] * p
+            else:
+                np.multiply(p[s], self.modelo.k[j], out=kappa[j, s])
+
+    def avaliar(self, T, p, a=None, kappa=None, threads: int | None = None) -> tuple:
+        """
+        Preenche (a, kappa) para o campo de temperaturas T [K] e pressões
+        parciais p [atm] (mesma forma de T, ou escalar).
+
+        T, p, a e kappa devem ser contíguos (ordem C) para serem achatados sem
+        cópia; campos estruturados (nx, ny, nz) são tratados como vetores.
+        T e p mantêm o dtype do chamador (ex.: float32): cada bloco é convertido
+        no rascunho kappa[-1], sem cópia do campo inteiro.
+        threads > 1 divide os blocos num ThreadPoolExecutor (mantido entre chamadas).
+        """
+        T = np.asarray(T)
+        if T.dtype.kind not in "fiu":
+            raise ValueError(f"T deve ser numérico; recebido dtype {T.dtype}.")
+        if a is None or kappa is None:
+            a, kappa = self.alocar(T.shape)
+        forma = (self.n_cinzas,) + T.shape
+        if a.shape != forma or kappa.shape != forma:
+            raise ValueError(f"a e kappa devem ter forma {forma}; recebido {a.shape} e {kappa.shape}.")
+        if not (a.flags.c_contiguous and kappa.flags.c_contiguous):
+            raise ValueError("a e kappa devem ser contíguos (ordem C).")
+        if not T.flags.c_contiguous:
+            raise ValueError("T deve ser contíguo (ordem C); use np.ascontiguousarray(T).")
+        Tf = T.reshape(-1)
+        if np.ndim(p) == 0:
+            pf = float(p)
+        else:
+            pf = np.asarray(p)
+            if pf.shape != T.shape:
+                raise ValueError(f"p deve ser escalar ou ter a forma de T {T.shape}; recebido {pf.shape}.")
+            if not pf.flags.c_contiguous:
+                raise ValueError("p deve ser contíguo (ordem C); use np.ascontiguousarray(p).")
+            pf = pf.reshape(-1)
+        af = a.reshape(self.n_cinzas, -1)
+        kf = kappa.reshape(self.n_cinzas, -1)
+
+        n = Tf.size
+        blocos = [slice(i, min(i + self.celulas_por_bloco, n)) for i in range(0, n, self.celulas_por_bloco)]
+        threads = self.threads if threads is None else threads
+        if threads and threads > 1 and len(blocos) > 1:
+            if self._threads_pool != threads:
+                self.fechar()
+                self._pool, self._threads_pool = ThreadPoolExecutor(max_workers=threads), threads
+            list(self._pool.map(lambda s: self._bloco(Tf, pf, af, kf, s), blocos))
+        else:
+            for s in blocos:
+                self._bloco(Tf, pf, af, kf, s)
+        return a, kappa
+
+    def peso_transparente(self, a: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """a_0 = 1 − Σ_j a_j (janela transparente) a partir do buffer `a`."""
+        out = np.sum(a, axis=0, out=out)
+        np.subtract(1.0, out, out=out)
+        return out
+
+    def fechar(self) -> None:
+        """Encerra o pool de threads (se houver)."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool, self._threads_pool = None, 0
+
+    __call__ = avaliar
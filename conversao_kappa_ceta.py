@@ -3,20 +3,30 @@
 # A partir da relação: kappa = N(T,p) * Y_abs * sigma
 # ================================================================
 
+import argparse
+from itertools import islice
+
 import numpy as np
 
+from leitura_espectros import ler_texto, ler_xsec
+
 # --------------------- CONFIGURAÇÕES (editar) ---------------------
 FILE_XSEC = r"C:"     # entrada: nu, sigma
-FILE_OUT  = r"C:"    # saída: nu, kappa
+FILE_OUT  = r"C:"    # saída: nu, kappa  (.npy → saída binária)
 
 T_K   = 1200.0   # Temperatura [K]
 P_BAR = 1.0     # Pressão total [bar]
 Y_ABS = 1.0     # Fração molar do absorvedor (ex.: NH3 = 1.0 se gás puro)
+
+LINHAS_POR_BLOCO = 1_000_000   # modo streaming: linhas lidas/gravadas por vez
 # -----------------------------------------------------------------
 
 # Constante de Loschmidt a 296 K e 1 atm [moléculas/cm³]
 N0_296 = 2.479e19
 
+CABECALHO = "nu(cm^-1)    kappa(cm^-1)"
+FORMATO = "%.8e"
+
 def number_density(p_bar: float, T: float) -> float:
     """
     Retorna N(T,p) em [moléculas/cm³] a partir de:
@@ -27,27 +37,172 @@ def number_density(p_bar: float, T: float) -> float:
     p_atm = p_bar / 1.01325  # conversão aproximada bar → atm
     return N0_296 * p_atm * (296.0 / T)
 
-# ===================== LEITURA DO ARQUIVO XSEC =====================
+# ===================== CONVERSÃO EM MEMÓRIA =====================
+
+def converter(arq_xsec: str, arq_out: str, T: float, p_bar: float, Y: float) -> None:
+    """Lê o arquivo inteiro, calcula κ(ν̃) e grava (texto ou .npy)."""
+    # Espera-se: coluna 0 = nu [cm^-1], coluna 1 = sigma [cm²/molécula]
+    data = ler_xsec(arq_xsec)
+    nu = data[:, 0]
+    sigma = data[:, 1]
+
+    N = number_density(p_bar, T)         # [moléculas/cm³]
+    kappa = N * Y * sigma                # κ em [cm⁻¹]
+
+    out = np.column_stack([nu, kappa])
+    if _saida_binaria(arq_out):
+        np.save(arq_out, out)
+    else:
+        np.savetxt(arq_out, out, fmt=FORMATO, header=CABECALHO)
+
+# ===================== CONVERSÃO EM BLOCOS (STREAMING) =====================
+
+def _saida_binaria(arq_out: str) -> bool:
+    return str(arq_out).lower().endswith(".npy")
+
+
+def _linhas_de_dados(f):
+    """Itera apenas as linhas numéricas (ignora vazias e comentários '#')."""
+    for linha in f:
+        s = linha.lstrip()
+        if s and not s.startswith(b"#"):
+            yield linha if linha.endswith(b"\n") else linha + b"\n"
+
+
+def _contar_linhas_dados(arq: str) -> int:
+    """Conta as linhas numéricas do arquivo (necessário para pré-alocar o .npy)."""
+    n = 0
+    with open(arq, "rb") as f:
+        for linha in f:
+            s = linha.lstrip()
+            if s and not s.startswith(b"#"):
+                n += 1
+    return n
+
+
+def blocos_xsec(arq_xsec: str, linhas_por_bloco: int = LINHAS_POR_BLOCO):
+    """Gera matrizes (m, 2) com no máximo `linhas_por_bloco` linhas do arquivo texto."""
+    with open(arq_xsec, "rb") as f:
+        linhas = _linhas_de_dados(f)
+        while True:
+            bloco = list(islice(linhas, linhas_por_bloco))
+            if not bloco:
+                break
+            yield ler_texto(b"".join(bloco))
+
+
+def converter_streaming(arq_xsec: str, arq_out: str, T: float, p_bar: float, Y: float,
+                        linhas_por_bloco: int = LINHAS_POR_BLOCO) -> int:
+    """
+    Converte σ → κ lendo, calculando e gravando em blocos de tamanho fixo.
+
+    A memória usada é limitada a ~`linhas_por_bloco` linhas, independente do
+    tamanho do arquivo. Se `arq_out` termina em .npy, a saída é binária
+    (float64, colunas nu e kappa), gravada direto num np.memmap pré-alocado.
+    Retorna o número de linhas convertidas.
+    """
+    fator = number_density(p_bar, T) * Y
+
+    if _saida_binaria(arq_out):
+        n = _contar_linhas_dados(arq_xsec)
+        out = np.lib.format.open_memmap(arq_out, mode="w+", dtype=np.float64, shape=(n, 2))
+        i = 0
+        for bloco in blocos_xsec(arq_xsec, linhas_por_bloco):
+            m = len(bloco)
+            out[i:i + m, 0] = bloco[:, 0]
+            np.multiply(bloco[:, 1], fator, out=out[i:i + m, 1])
+            i += m
+        out.flush()
+        del out
+        return i
+
+    i = 0
+    with open(arq_out, "w") as f:
+        f.write(f"# {CABECALHO}\n")
+        for bloco in blocos_xsec(arq_xsec, linhas_por_bloco):
+            bloco[:, 1] *= fator
+            np.savetxt(f, bloco, fmt=FORMATO)
+            i += len(bloco)
+    return i
+
+# ===================== CONVERSÃO EM LOTE (VÁRIOS CASOS) =====================
+
+def montar_casos(T, p_bar, Y, grade: bool = False) -> np.ndarray:
+    """
+    Monta a matriz de casos (n_casos, 3) com colunas (T [K], p [bar], Y_abs).
+
+    grade=True  → produto cartesiano de todas as listas;
+    grade=False → listas combinadas elemento a elemento (listas de
+                  tamanho 1 são repetidas, como no broadcasting do NumPy).
+    """
+    T, p_bar, Y = (np.atleast_1d(np.asarray(v, dtype=float)) for v in (T, p_bar, Y))
+    if grade:
+        TT, PP, YY = np.meshgrid(T, p_bar, Y, indexing="ij")
+    else:
+        TT, PP, YY = np.broadcast_arrays(T, p_bar, Y)
+    return np.column_stack([TT.ravel(), PP.ravel(), YY.ravel()])
+
+
+def kappa_lote(sigma: np.ndarray, casos: np.ndarray) -> np.ndarray:
+    """
+    κ para todos os casos de uma vez: (n_casos, n_nu).
+    O fator N(T,p)·Y_abs é um vetor (n_casos,) aplicado por broadcasting.
+    """
+    casos = np.atleast_2d(casos)
+    fatores = number_density(casos[:, 1], casos[:, 0]) * casos[:, 2]
+    return fatores[:, None] * np.asarray(sigma)[None, :]
+
+
+def converter_lote(arq_xsec: str, arq_out: str, casos: np.ndarray) -> np.ndarray:
+    """
+    Lê σ(ν̃) uma única vez e grava κ de todos os casos num só arquivo .npz
+    com os campos `nu` (n_nu,), `kappa` (n_casos, n_nu) e `casos` (n_casos, 3).
+    """
+    data = ler_xsec(arq_xsec)
+    nu, sigma = data[:, 0], data[:, 1]
+    kappa = kappa_lote(sigma, casos)
+    np.savez(arq_out, nu=nu, kappa=kappa, casos=casos)
+    return kappa
 
-# Espera-se: coluna 0 = nu [cm^-1], coluna 1 = sigma [cm²/molécula]
-data = np.loadtxt(FILE_XSEC)
-nu = data[:, 0]
-sigma = data[:, 1]
+# ===================== LINHA DE COMANDO =====================
 
-# ===================== CÁLCULO DE κ(ν̃) =====================
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Conversão σ[cm²/molécula] → κ[cm⁻¹].")
+    ap.add_argument("entrada", nargs="?", default=FILE_XSEC, help="arquivo .xsec (nu, sigma)")
+    ap.add_argument("saida", nargs="?", default=FILE_OUT, help="arquivo de saída (.npy → binário)")
+    ap.add_argument("--T", type=float, nargs="+", default=[T_K], help="temperatura(s) [K]")
+    ap.add_argument("--P", type=float, nargs="+", default=[P_BAR], help="pressão(ões) total(is) [bar]")
+    ap.add_argument("--Y", type=float, nargs="+", default=[Y_ABS], help="fração(ões) molar(es) do absorvedor")
+    ap.add_argument("--grade", action="store_true",
+                    help="lote: usa o produto cartesiano de --T, --P e --Y")
+    ap.add_argument("--streaming", action="store_true",
+                    help="lê/converte/grava em blocos (memória limitada)")
+    ap.add_argument("--bloco", type=int, default=LINHAS_POR_BLOCO,
+                    help="linhas por bloco no modo streaming")
+    args = ap.parse_args(argv)
 
-N = number_density(P_BAR, T_K)       # [moléculas/cm³]
-kappa = N * Y_ABS * sigma            # κ em [cm⁻¹]
+    # Mais de um valor em --T/--P/--Y → modo lote (saída .npz com todos os casos)
+    if args.grade or max(len(args.T), len(args.P), len(args.Y)) > 1:
+        try:
+            casos = montar_casos(args.T, args.P, args.Y, grade=args.grade)
+        except ValueError:
+            ap.error("--T, --P e --Y devem ter o mesmo tamanho (ou tamanho 1) sem --grade.")
+        # np.savez acrescenta .npz quando falta: o nome impresso é o do arquivo gravado
+        saida = args.saida if args.saida.endswith(".npz") else args.saida + ".npz"
+        converter_lote(args.entrada, saida, casos)
+        print(f"Conversão em lote concluída ({len(casos)} casos).")
+        print(f"Arquivo gerado: {saida}")
+        return
 
-# ===================== GRAVAÇÃO DO ARQUIVO DE SAÍDA =====================
+    T, P, Y = args.T[0], args.P[0], args.Y[0]
+    if args.streaming:
+        n = converter_streaming(args.entrada, args.saida, T, P, Y, args.bloco)
+        print(f"Conversão concluída ({n} linhas, em blocos de {args.bloco}).")
+    else:
+        converter(args.entrada, args.saida, T, P, Y)
+        print("Conversão concluída.")
+    print(f"Arquivo gerado: {args.saida}")
 
-out = np.column_stack([nu, kappa])
-np.savetxt(
-    FILE_OUT,
-    out,
-    fmt="%.8e",
-    header="nu(cm^-1)    kappa(cm^-1)"
-)
 
-print("Conversão concluída.")
-print(f"Arquivo gerado: {FILE_OUT}")
+if __name__ == "__main__":
+    main()
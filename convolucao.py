@@ -0,0 +1,167 @@
+# ================================================================
+# Convolução de espectros em malha uniforme (alargamento / função
+# de instrumento): núcleos gaussiano, lorentziano, retangular,
+# triangular e sinc. Núcleos estreitos → convolução direta;
+# núcleos largos → FFT com overlap-add em blocos. A escolha é feita
+# pelo tamanho do núcleo (ver benchmark_convolucao.py)
+# ================================================================
+
+import numpy as np
+
+from espectro_uniforme import EspectroUniforme
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS_CRUZAMENTO = 31        # núcleos maiores usam FFT: benchmark_convolucao.py (1e6 pontos) põe o
+                              # cruzamento em ~31–39 pontos; depende da máquina, re-meça e ajuste
+CORTE_GAUSS = 5.0             # núcleo gaussiano truncado em ±CORTE_GAUSS·FWHM
+CORTE_LORENTZ = 50.0          # núcleo lorentziano truncado em ±CORTE_LORENTZ·FWHM
+ELEMENTOS_POR_LOTE = 1 << 22  # amostras por lote de blocos FFT (limita a memória)
+# ---------------------------------------------------------------
+
+# ===================== NÚCLEOS (ÁREA UNITÁRIA) =====================
+
+def _eixo_nucleo(passo: float, meia_largura: float) -> np.ndarray:
+    m = max(int(np.ceil(meia_largura / passo)), 0)
+    return passo * np.arange(-m, m + 1)
+
+
+def _normalizar(k: np.ndarray) -> np.ndarray:
+    return k / k.sum()
+
+
+def nucleo_gaussiano(passo: float, fwhm: float, corte: float = CORTE_GAUSS) -> np.ndarray:
+    x = _eixo_nucleo(passo, corte * fwhm)
+    return _normalizar(np.exp(-4.0 * np.log(2.0) * (x / fwhm) ** 2))
+
+
+def nucleo_lorentziano(passo: float, fwhm: float, corte: float = CORTE_LORENTZ) -> np.ndarray:
+    x = _eixo_nucleo(passo, corte * fwhm)
+    return _normalizar(1.0 / (1.0 + (2.0 * x / fwhm) ** 2))
+
+
+def nucleo_retangular(passo: float, largura: float) -> np.ndarray:
+    """Fenda retangular de largura total `largura`."""
+    x = _eixo_nucleo(passo, 0.5 * largura)
+    return _normalizar(np.where(np.abs(x) <= 0.5 * largura + 1e-12 * passo, 1.0, 0.0))
+
+
+def nucleo_triangular(passo: float, fwhm: float) -> np.ndarray:
+    """Função de aparelho triangular (monocromador com fendas iguais)."""
+    x = _eixo_nucleo(passo, fwhm)
+    return _normalizar(np.maximum(1.0 - np.abs(x) / fwhm, 0.0))
+
+
+def nucleo_sinc(passo: float, resolucao: float, lobulos: int = 20) -> np.ndarray:
+    """FTS sem apodização: sinc(2π x L), L = 1/(2·resolução), truncado em `lobulos` zeros."""
+    L = 0.5 / resolucao
+    x = _eixo_nucleo(passo, lobulos / (2.0 * L))
+    return _normalizar(np.sinc(2.0 * L * x))
+
+
+NUCLEOS = {
+    "gauss": nucleo_gaussiano,
+    "lorentz": nucleo_lorentziano,
+    "retangular": nucleo_retangular,
+    "triangular": nucleo_triangular,
+    "sinc": nucleo_sinc,
+}
+
+# ===================== CONVOLUÇÃO =====================
+
+def _direta(y: np.ndarray, k: np.ndarray) -> np.ndarray:
+    # recorte da convolução completa: mode="same" devolve max(n, m) pontos se o núcleo for maior que y
+    ini = (k.size - 1) // 2
+    return np.convolve(y, k, mode="full")[ini:ini + y.size]
+
+
+def _fft_overlap_add(y: np.ndarray, k: np.ndarray,
+                     elementos_por_lote: int = ELEMENTOS_POR_LOTE) -> np.ndarray:
+    """Convolução 'same' por overlap-add: blocos de L pontos, FFT de nfft ≥ L + m − 1."""
+    n, m = y.size, k.size
+    nfft = 1 << max(int(np.ceil(np.log2(4 * m))), 12)
+    L = nfft - m + 1                       # L ≥ m − 1: cada cauda só invade o bloco seguinte
+    K = np.fft.rfft(k, nfft)
+    nb = -(-n // L)
+    cheio = np.zeros(nb * L + m - 1)       # convolução completa (modo 'full')
+    lote = max(1, elementos_por_lote // nfft)
+    for b0 in range(0, nb, lote):
+        b1 = min(b0 + lote, nb)
+        blocos = np.zeros((b1 - b0, L))
+        trecho = y[b0 * L:b1 * L]
+        blocos.ravel()[:trecho.size] = trecho
+        r = np.fft.irfft(np.fft.rfft(blocos, nfft, axis=1) * K, nfft, axis=1)[:, :L + m - 1]
+        base = b0 * L
+        # cabeças (L pontos) sem sobreposição entre si; caudas (m − 1) somadas ao bloco seguinte
+        cheio[base:base + (b1 - b0) * L] += r[:, :L].ravel()
+        caudas = np.zeros((b1 - b0, L))
+        caudas[:, :m - 1] = r[:, L:]
+        caudas = caudas.ravel()[:(b1 - b0 - 1) * L + m - 1]
+        cheio[base + L:base + L + caudas.size] += caudas
+    ini = (m - 1) // 2
+    return cheio[ini:ini + n]
+
+
+def convoluir(y, nucleo: np.ndarray, metodo: str = "auto", bordas: str = "normalizar",
+              pontos_cruzamento: int = PONTOS_CRUZAMENTO) -> np.ndarray:
+    """
+    Convolução 'same' de y (malha uniforme) com `nucleo` (ímpar, centrado).
+
+    metodo : "auto" (direta até pontos_cruzamento pontos de núcleo, FFT acima),
+             "direta" ou "fft"
+    bordas : "normalizar" divide pela convolução de 1 (sem queda nas pontas),
+             "zero" considera y = 0 fora da malha
+    """
+    y = np.asarray(y, dtype=float)
+    k = np.asarray(nucleo, dtype=float)
+    if k.size % 2 == 0:
+        raise ValueError("o núcleo deve ter um número ímpar de pontos (centrado).")
+    if metodo == "auto":
+        metodo = "direta" if k.size <= pontos_cruzamento else "fft"
+    if metodo == "direta":
+        conv = _direta
+    elif metodo == "fft":
+        conv = _fft_overlap_add
+    else:
+        raise ValueError("metodo deve ser 'auto', 'direta' ou 'fft'.")
+    if k.size == 1:
+        return y * k[0]
+    r = conv(y, k)
+    if bordas == "normalizar":
+        h = k.size // 2
+        if y.size > 2 * h:
+            # o peso do núcleo dentro da malha só difere do total nas h primeiras/últimas amostras
+            c = np.cumsum(k)
+            r[h:-h] /= c[-1]
+            r[:h] /= c[h:2 * h]
+            r[-h:] /= c[-1] - c[:h]
+        else:
+            r /= conv(np.ones(y.size), k)
+    elif bordas != "zero":
+        raise ValueError("bordas deve ser 'normalizar' ou 'zero'.")
+    return r
+
+
+def passo_uniforme(nu: np.ndarray, tolerancia: float = 1e-6) -> float:
+    """Passo da malha `nu`; ValueError se ela não for uniforme (use reamostragem.py)."""
+    nu = np.asarray(nu, dtype=float)
+    d = np.diff(nu)
+    passo = (nu[-1] - nu[0]) / (nu.size - 1)
+    if np.max(np.abs(d - passo)) > tolerancia * abs(passo):
+        raise ValueError("malha não uniforme: reamostre antes (reamostragem.reamostrar).")
+    return float(passo)
+
+
+def alargar(espectro, forma: str = "gauss", largura: float = 1.0, **kw):
+    """
+    Convolui um espectro com o núcleo `forma` (ver NUCLEOS) de largura `largura` [cm^-1]
+    (FWHM; largura total na fenda retangular; resolução no sinc).
+    espectro: EspectroUniforme → EspectroUniforme; (nu, y) → y convoluído.
+    """
+    if forma not in NUCLEOS:
+        raise ValueError(f"forma deve ser uma de {list(NUCLEOS)}.")
+    if isinstance(espectro, EspectroUniforme):
+        k = NUCLEOS[forma](espectro.passo, largura)
+        return espectro.com_valores(convoluir(espectro.valores, k, **kw))
+    nu, y = espectro
+    k = NUCLEOS[forma](passo_uniforme(nu), largura)
+    return convoluir(y, k, **kw)
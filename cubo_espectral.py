@@ -0,0 +1,221 @@
+# ================================================================
+# Cubo espectral multi-temperatura (T × ν̃) em disco
+# Ingestão: lê um diretório de .xsec (ExoMol) ou κ (HITRAN) por
+# temperatura em paralelo e grava blocos comprimidos (zlib) num
+# único arquivo; a leitura descomprime só os blocos necessários
+# ================================================================
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from leitura_espectros import ler_xsec, ler_kappa_hitran
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS_POR_BLOCO = 65536      # amostras de ν̃ por bloco comprimido
+NIVEL_ZLIB = 6
+NU_START, NU_STOP, NU_STEP = 50.0, 10000.0, 0.01  # malha fixa do HITRAN
+# ---------------------------------------------------------------
+
+ARQ_META = "cubo.json"
+ARQ_DADOS = "dados.bin"
+ARQ_INDICE = "indice.npy"
+ARQ_NU = "nu.npy"
+
+_RE_TEMPERATURA = re.compile(r"(\d+(?:\.\d+)?)\s*K(?![A-Za-z])")
+
+
+def temperatura_do_nome(arq: str) -> float:
+    """Extrai a temperatura do nome do arquivo (ex.: '..._1200K.xsec' → 1200.0)."""
+    achados = _RE_TEMPERATURA.findall(os.path.basename(arq))
+    if not achados:
+        raise ValueError(f"Temperatura não encontrada no nome do arquivo: {arq}")
+    return float(achados[-1])
+
+# ===================== COMPRESSÃO DOS BLOCOS =====================
+
+def _comprimir(valores: np.ndarray, nivel: int = NIVEL_ZLIB) -> bytes:
+    """Comprime um bloco float64 com 'shuffle' de bytes (melhora o zlib em floats)."""
+    b = np.ascontiguousarray(valores, dtype=np.float64).view(np.uint8)
+    return zlib.compress(b.reshape(-1, 8).T.tobytes(), nivel)
+
+
+def _descomprimir(dados: bytes, n: int) -> np.ndarray:
+    b = np.frombuffer(zlib.decompress(dados), dtype=np.uint8)
+    return np.ascontiguousarray(b.reshape(8, n).T).view(np.float64).ravel()
+
+# ===================== INGESTÃO (PARALELA) =====================
+
+def _processar_arquivo(tarefa):
+    """Worker: lê um arquivo e devolve (T, assinatura da malha, blocos comprimidos)."""
+    arq, hitran, bloco, nivel = tarefa
+    if hitran:
+        valores = ler_kappa_hitran(arq, NU_START, NU_STOP, NU_STEP).valores
+        assinatura = f"{NU_START}:{NU_STEP}:{len(valores)}"
+    else:
+        data = ler_xsec(arq)
+        valores = data[:, 1]
+        assinatura = hashlib.sha1(np.ascontiguousarray(data[:, 0]).tobytes()).hexdigest()
+    blocos = [_comprimir(valores[i:i + bloco], nivel) for i in range(0, len(valores), bloco)]
+    return temperatura_do_nome(arq), assinatura, len(valores), blocos
+
+
+def ingerir_diretorio(diretorio: str, saida: str, padrao: str = "*.xsec",
+                      hitran: bool = False, bloco: int = PONTOS_POR_BLOCO,
+                      processos: int | None = None, nivel: int = NIVEL_ZLIB) -> str:
+    """
+    Lê todos os arquivos `padrao` de `diretorio` (um por temperatura, T no
+    nome do arquivo) num pool de processos e grava o cubo em `saida`.
+
+    Todos os arquivos devem compartilhar a mesma malha de ν̃.
+    hitran=True → arquivos de 1 coluna na malha fixa NU_START:NU_STEP:NU_STOP.
+    """
+    arquivos = sorted(glob.glob(os.path.join(diretorio, padrao)), key=temperatura_do_nome)
+    if not arquivos:
+        raise FileNotFoundError(f"Nenhum arquivo '{padrao}' em {diretorio}")
+    temperaturas = [temperatura_do_nome(a) for a in arquivos]
+    if len(set(temperaturas)) != len(temperaturas):
+        raise ValueError("Há mais de um arquivo para a mesma temperatura.")
+
+    os.makedirs(saida, exist_ok=True)
+    tarefas = [(a, hitran, bloco, nivel) for a in arquivos]
+    n_blocos = None
+    indice = None
+    assinatura_ref = None
+
+    # os resultados chegam na ordem das temperaturas; cada um é gravado e descartado
+    with ProcessPoolExecutor(max_workers=processos) as pool, \
+            open(os.path.join(saida, ARQ_DADOS), "wb") as f:
+        for iT, (T, assinatura, n_nu, blocos) in enumerate(pool.map(_processar_arquivo, tarefas)):
+            if assinatura_ref is None:
+                assinatura_ref, n_nu_ref, n_blocos = assinatura, n_nu, len(blocos)
+                indice = np.zeros((len(arquivos), n_blocos, 2), dtype=np.int64)
+            elif assinatura != assinatura_ref:
+                raise ValueError(f"Malha de ν̃ de {arquivos[iT]} difere da de {arquivos[0]}.")
+            for j, b in enumerate(blocos):
+                indice[iT, j] = (f.tell(), len(b))
+                f.write(b)
+
+    np.save(os.path.join(saida, ARQ_INDICE), indice)
+    meta = {
+        "temperaturas": temperaturas,
+        "n_nu": n_nu_ref,
+        "bloco": bloco,
+        "arquivos": [os.path.basename(a) for a in arquivos],
+        "grade": {"inicio": NU_START, "passo": NU_STEP} if hitran else None,
+    }
+    if not hitran:
+        np.save(os.path.join(saida, ARQ_NU), np.ascontiguousarray(ler_xsec(arquivos[0])[:, 0]))
+    with open(os.path.join(saida, ARQ_META), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1)
+    return saida
+
+# ===================== LEITURA DO CUBO =====================
+
+class CuboEspectral:
+    """
+    Leitor do cubo (temperatura × ν̃). Só descomprime os blocos que cobrem
+    o recorte pedido; os blocos recentes ficam num cache LRU.
+    """
+
+    def __init__(self, diretorio: str, blocos_em_cache: int = 64):
+        self.diretorio = diretorio
+        with open(os.path.join(diretorio, ARQ_META), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.temperaturas = np.asarray(meta["temperaturas"], dtype=float)
+        self.n_nu = int(meta["n_nu"])
+        self.bloco = int(meta["bloco"])
+        self.grade = meta["grade"]
+        self._indice = np.load(os.path.join(diretorio, ARQ_INDICE))
+        self._dados = np.memmap(os.path.join(diretorio, ARQ_DADOS), dtype=np.uint8, mode="r")
+        self._nu = None
+        if self.grade is None:
+            self._nu = np.load(os.path.join(diretorio, ARQ_NU), mmap_mode="r")
+        self._ler_bloco = lru_cache(maxsize=blocos_em_cache)(self._ler_bloco_sem_cache)
+
+    @property
+    def nu(self) -> np.ndarray:
+        """Eixo ν̃ [cm^-1] (memmap, ou materializado a partir da malha uniforme)."""
+        if self._nu is not None:
+            return self._nu
+        return self.grade["inicio"] + self.grade["passo"] * np.arange(self.n_nu, dtype=float)
+
+    def indice_temperatura(self, T: float) -> int:
+        i = np.flatnonzero(np.isclose(self.temperaturas, T))
+        if i.size == 0:
+            raise KeyError(f"T = {T:g} K não está no cubo ({self.temperaturas.tolist()}).")
+        return int(i[0])
+
+    def _ler_bloco_sem_cache(self, iT: int, j: int) -> np.ndarray:
+        ini, tam = self._indice[iT, j]
+        n = min(self.bloco, self.n_nu - j * self.bloco)
+        v = _descomprimir(self._dados[ini:ini + tam], n)
+        v.flags.writeable = False      # fica no cache LRU: vistas devolvidas não podem alterá-lo
+        return v
+
+    def _fatia(self, nu_min: float, nu_max: float) -> slice:
+        if self.grade is None:
+            i0 = int(np.searchsorted(self._nu, nu_min, side="left"))
+            i1 = int(np.searchsorted(self._nu, nu_max, side="right"))
+            return slice(i0, i1)
+        ini, passo = self.grade["inicio"], self.grade["passo"]
+        i0 = max(int(np.ceil((nu_min - ini) / passo - 1e-9)), 0)
+        i1 = min(int(np.floor((nu_max - ini) / passo + 1e-9)) + 1, self.n_nu)
+        return slice(min(i0, self.n_nu), max(i1, i0))
+
+    def _valores(self, iT: int, s: slice) -> np.ndarray:
+        if s.stop <= s.start:
+            return np.empty(0)
+        j0, j1 = s.start // self.bloco, (s.stop - 1) // self.bloco
+        partes = [self._ler_bloco(iT, j) for j in range(j0, j1 + 1)]
+        v = np.concatenate(partes) if len(partes) > 1 else partes[0]
+        v = v[s.start - j0 * self.bloco: s.stop - j0 * self.bloco]
+        v.flags.writeable = False      # somente leitura com um ou vários blocos, como os memmaps de cache
+        return v
+
+    def espectro(self, T: float) -> np.ndarray:
+        """Espectro completo (n_nu,) na temperatura tabelada T (somente leitura; copie para alterar)."""
+        return self._valores(self.indice_temperatura(T), slice(0, self.n_nu))
+
+    def banda(self, nu_min: float, nu_max: float, temperaturas=None):
+        """
+        Recorte espectral nu_min <= ν̃ <= nu_max.
+        Retorna (nu, valores) com valores de forma (n_T, m).
+        """
+        s = self._fatia(nu_min, nu_max)
+        if temperaturas is None:
+            iTs = range(len(self.temperaturas))
+        else:
+            iTs = [self.indice_temperatura(T) for T in np.atleast_1d(temperaturas)]
+        valores = np.array([self._valores(iT, s) for iT in iTs])
+        return np.asarray(self.nu[s]), valores
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Ingestão de espectros por temperatura num cubo T × ν̃.")
+    ap.add_argument("diretorio", help="diretório com um arquivo por temperatura (T no nome, ex.: 1200K)")
+    ap.add_argument("saida", help="diretório do cubo a ser criado")
+    ap.add_argument("--padrao", default="*.xsec", help="padrão glob dos arquivos")
+    ap.add_argument("--hitran", action="store_true", help="arquivos de 1 coluna (κ HITRAN, malha fixa)")
+    ap.add_argument("--processos", type=int, default=None, help="processos no pool (padrão: nº de núcleos)")
+    ap.add_argument("--bloco", type=int, default=PONTOS_POR_BLOCO, help="pontos de ν̃ por bloco")
+    args = ap.parse_args(argv)
+
+    ingerir_diretorio(args.diretorio, args.saida, args.padrao, args.hitran,
+                      args.bloco, args.processos)
+    cubo = CuboEspectral(args.saida)
+    print(f"Cubo gerado: {args.saida}")
+    print(f"Temperaturas [K]: {cubo.temperaturas.tolist()}  |  pontos de ν̃: {cubo.n_nu}")
+
+
+if __name__ == "__main__":
+    main()
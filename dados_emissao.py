@@ -0,0 +1,59 @@
+# ================================================================
+# Emitâncias LBL e WSGG tabeladas (NH3, 1 bar) usadas nas figuras
+# de emissão (figuras.py / emission_*.py), indexadas pelo percurso S [m]
+# - WSGG_AJUSTADO:     coeficientes finais (regression_multiple.py)
+# - WSGG_ANTES_AJUSTE: coeficientes antes do ajuste fino
+# ================================================================
+
+import numpy as np
+
+# Temperaturas [K]
+T = np.array([400, 500, 600, 700, 800, 900, 1000, 1100, 1200], dtype=float)
+
+# Percursos [m], na ordem das figuras
+PERCURSOS = [30.0, 10.0, 1.0, 0.1]
+
+LBL = {
+    30.0: np.array([0.958361577, 0.944575369, 0.945764245, 0.957258408,
+                    0.969664939, 0.978224689, 0.981962636, 0.981440438,
+                    0.977406643]),
+    10.0: np.array([0.9232181,   0.899221221, 0.880513683, 0.878387688,
+                    0.887063372, 0.898492561, 0.907209247, 0.910550868,
+                    0.907729893]),
+    1.0:  np.array([0.736768574, 0.728738820, 0.689337163, 0.648819171,
+                    0.615711025, 0.589812063, 0.568223816, 0.548085056,
+                    0.527424848]),
+    0.1:  np.array([0.387220855, 0.377166052, 0.343432226, 0.304996935,
+                    0.268982955, 0.237100098, 0.209243004, 0.184884430,
+                    0.163491159]),
+}
+
+WSGG_AJUSTADO = {
+    30.0: np.array([0.961863772, 0.944031294, 0.946294639, 0.959021884,
+                    0.974768347, 0.988276585, 0.996476396, 0.998484819,
+                    0.995606133]),
+    10.0: np.array([0.929416283, 0.9060775,   0.894784311, 0.893219044,
+                    0.898595317, 0.90765804,  0.916683415, 0.921478935,
+                    0.917383381]),
+    1.0:  np.array([0.742253025, 0.729281813, 0.697087719, 0.660027707,
+                    0.627435035, 0.603619259, 0.587866226, 0.574438079,
+                    0.552573258]),
+    0.1:  np.array([0.393982702, 0.381004577, 0.351176581, 0.314913474,
+                    0.27953656,  0.249273688, 0.225259249, 0.205534182,
+                    0.185045969]),
+}
+
+WSGG_ANTES_AJUSTE = {
+    30.0: np.array([0.956563951, 0.939076975, 0.937804345, 0.950052957,
+                    0.965514653, 0.977482735, 0.983889525, 0.984776294,
+                    0.980953408]),
+    10.0: np.array([0.922525416, 0.901269848, 0.884129097, 0.881187306,
+                    0.88730763,  0.89566507,  0.901816667, 0.903523524,
+                    0.900033956]),
+    1.0:  np.array([0.732625462, 0.722926708, 0.682667008, 0.642857002,
+                    0.611557302, 0.5876946,   0.567810146, 0.548861345,
+                    0.528904042]),
+    0.1:  np.array([0.384672655, 0.372207004, 0.337216301, 0.298444175,
+                    0.262596331, 0.231178968, 0.203975795, 0.180357486,
+                    0.159703304]),
+}
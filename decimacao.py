@@ -0,0 +1,110 @@
+# ================================================================
+# Decimação de espectros para gráficos (10^6–10^7 pontos por traço)
+# Cada traço é reduzido a um envelope mín/máx por coluna de pixel:
+# em cada coluna ficam o menor e o maior valor, na ordem em que
+# aparecem. O envelope não muda sob transformações monótonas (log),
+# então linhas estreitas e vales profundos continuam visíveis no
+# eixo log. Zoom/pan refazem o envelope da janela visível pelo
+# callback 'xlim_changed' do Axes
+# ================================================================
+
+import numpy as np
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+COLUNAS_MINIMAS = 2000     # colunas do envelope mesmo em eixos estreitos (savefig em dpi alto)
+# ---------------------------------------------------------------
+
+# ===================== ENVELOPE MÍN/MÁX =====================
+
+def janela(x: np.ndarray, x0: float, x1: float) -> slice:
+    """Índices de x (crescente) dentro de [x0, x1], com um ponto a mais de cada lado."""
+    i0 = max(int(np.searchsorted(x, x0, side="left")) - 1, 0)
+    i1 = min(int(np.searchsorted(x, x1, side="right")) + 1, x.size)
+    return slice(i0, i1)
+
+
+def indices_envelope(y: np.ndarray, colunas: int) -> np.ndarray:
+    """
+    Índices (crescentes) do envelope mín/máx de y em `colunas` grupos de pontos
+    consecutivos; inclui o primeiro e o último ponto. Se y já tem até 2·colunas
+    pontos, retorna todos.
+    """
+    n = y.size
+    if n <= 2 * colunas:
+        return np.arange(n)
+    por_coluna = -(-n // colunas)
+    cheias = n // por_coluna
+    # vista (cheias, por_coluna) sem cópia, também para colunas de memmap
+    blocos = y[:cheias * por_coluna].reshape(cheias, por_coluna)
+    base = np.arange(cheias) * por_coluna
+    imin = base + np.argmin(blocos, axis=1)
+    imax = base + np.argmax(blocos, axis=1)
+    partes = [[0], np.minimum(imin, imax), np.maximum(imin, imax)]
+    if cheias * por_coluna < n:
+        resto = y[cheias * por_coluna:]
+        r0 = cheias * por_coluna
+        partes += [[r0 + int(np.argmin(resto))], [r0 + int(np.argmax(resto))]]
+    partes.append([n - 1])
+    return np.unique(np.concatenate(partes))
+
+
+def decimar(x, y, x0: float | None = None, x1: float | None = None,
+            colunas: int = COLUNAS_MINIMAS) -> tuple:
+    """
+    (x, y) decimados para a janela [x0, x1] (padrão: todo o espectro).
+    x deve ser crescente; y pode ser uma coluna de np.memmap (só a janela é lida).
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    s = janela(x, x[0] if x0 is None else x0, x[-1] if x1 is None else x1)
+    xs, ys = x[s], y[s]
+    idx = indices_envelope(ys, colunas)
+    return xs[idx], ys[idx]
+
+# ===================== TRAÇO NO MATPLOTLIB =====================
+
+class TracoDecimado:
+    """
+    Linha do matplotlib que mostra o envelope mín/máx do espectro completo (x, y)
+    na janela visível; refaz o envelope quando o xlim do Axes muda (zoom, pan,
+    set_xlim, eixos compartilhados) ou a figura é redimensionada.
+    """
+
+    def __init__(self, ax, x, y, *args, colunas: int | None = None, **kw):
+        self.x = np.asarray(x)
+        self.y = np.asarray(y)
+        if self.x.size > 1 and self.x[0] > self.x[-1]:
+            self.x, self.y = self.x[::-1], self.y[::-1]
+        self._desenhar(ax, colunas, args, kw)
+
+    def _desenhar(self, ax, colunas, args, kw) -> None:
+        self.ax = ax
+        self.colunas = colunas
+        # 1º envelope: espectro inteiro (mantém os extremos globais → mesmo autoscale)
+        (self.linha,) = ax.plot(*self.dados(None, None, self._colunas()), *args, **kw)
+        # funções (não métodos) ficam com referência forte no CallbackRegistry
+        ax.callbacks.connect("xlim_changed", lambda _ax: self.atualizar())
+        ax.figure.canvas.mpl_connect("resize_event", lambda _ev: self.atualizar())
+
+    def _colunas(self) -> int:
+        if self.colunas is not None:
+            return int(self.colunas)
+        return max(int(self.ax.bbox.width), COLUNAS_MINIMAS)
+
+    def dados(self, x0: float | None, x1: float | None, colunas: int) -> tuple:
+        """(x, y) a desenhar na janela [x0, x1] (None: todo o espectro)."""
+        return decimar(self.x, self.y, x0, x1, colunas)
+
+    def atualizar(self) -> None:
+        x0, x1 = sorted(self.ax.get_xlim())
+        # set_data só marca a linha como desatualizada; o redesenho fica com quem mudou o xlim
+        self.linha.set_data(*self.dados(x0, x1, self._colunas()))
+
+
+def plotar_decimado(ax, x, y, *args, colunas: int | None = None, **kw):
+    """
+    Substituto de ax.plot(x, y, ...) para espectros grandes; retorna a Line2D.
+    colunas: nº de colunas do envelope (padrão: largura do eixo em pixels,
+    no mínimo COLUNAS_MINIMAS).
+    """
+    return TracoDecimado(ax, x, y, *args, colunas=colunas, **kw).linha
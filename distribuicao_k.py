@@ -0,0 +1,177 @@
+# ================================================================
+# Distribuição-k de espectro completo (FSK) a partir de κ(η)
+# g(k) = ∫_{κ_η < k} E_bη(T) dη / ∫ E_bη(T) dη
+# Histograma ponderado por Planck em bins de ln k comuns a todas as
+# temperaturas (O(n), sem ordenar o espectro) e quadratura de
+# Gauss–Legendre em g ∈ [0, 1]
+# ================================================================
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+from emitancia_lbl import (ELEMENTOS_POR_BLOCO, SIGMA_SB, pesos_trapezio,
+                           poder_emissivo_espectral)
+from leitura_espectros import ler_xsec
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+N_BINS = 2000          # bins de ln k
+DECADAS = 12           # k_min = k_max · 10^-DECADAS (κ menores e nulos vão ao 1º bin)
+N_GAUSS = 8            # pontos de quadratura em g
+# ---------------------------------------------------------------
+
+
+def bordas_log_k(kappa, n_bins: int = N_BINS, decadas: float = DECADAS) -> np.ndarray:
+    """Bordas log-espaçadas (n_bins + 1) cobrindo todos os espectros de `kappa`."""
+    k_max = float(np.max(kappa))
+    if not k_max > 0:
+        raise ValueError("kappa não tem valores positivos.")
+    positivos = np.asarray(kappa)[np.asarray(kappa) > 0]
+    k_min = max(float(positivos.min()), k_max * 10.0 ** -decadas)
+    if k_min == k_max:
+        k_min = k_max / 10.0
+    return np.geomspace(k_min, k_max, n_bins + 1)
+
+# ===================== DISTRIBUIÇÃO g(k) =====================
+
+@dataclass
+class DistribuicaoK:
+    """
+    g(k) acumulada nas bordas dos bins, por temperatura.
+
+    T       : (n_T,) temperaturas [K]
+    bordas  : (n_bins + 1,) bordas de k [mesma unidade de κ], comuns a todas as T
+    g       : (n_T, n_bins + 1) fração de Planck com κ < borda (g[:, -1] = 1)
+    fracao  : (n_T,) fração de σT⁴ contida na malha η
+    """
+    T: np.ndarray
+    bordas: np.ndarray
+    g: np.ndarray
+    fracao: np.ndarray
+
+    def k_de_g(self, g) -> np.ndarray:
+        """k(g) por temperatura (ln k linear em g dentro de cada bin) → (n_T, n_g)."""
+        g = np.atleast_1d(np.asarray(g, dtype=float))
+        ln_k = np.log(self.bordas)
+        return np.exp(np.array([np.interp(g, gi, ln_k) for gi in self.g]))
+
+    def quadratura(self, n_pontos: int = N_GAUSS) -> tuple:
+        """
+        Pontos de Gauss–Legendre em g ∈ [0, 1].
+        Retorna (k (n_T, n_pontos), pesos (n_pontos,)) com Σ pesos = 1.
+        """
+        x, w = np.polynomial.legendre.leggauss(n_pontos)
+        g = 0.5 * (x + 1.0)
+        return self.k_de_g(g), 0.5 * w
+
+    def emitancia(self, S, n_pontos: int = N_GAUSS) -> np.ndarray:
+        """ε(T, S) pela quadratura em g (κ em cm⁻¹, S em m) → (n_T, n_S)."""
+        k, w = self.quadratura(n_pontos)
+        S_cm = 100.0 * np.atleast_1d(np.asarray(S, dtype=float))
+        absorv = -np.expm1(-k[:, :, None] * S_cm[None, None, :])       # (n_T, n_g, n_S)
+        return self.fracao[:, None] * np.einsum("tgs,g->ts", absorv, w)
+
+
+def distribuicao_k(eta, kappa, T, bordas=None, n_bins: int = N_BINS,
+                   elementos_por_bloco: int = ELEMENTOS_POR_BLOCO) -> DistribuicaoK:
+    """
+    Distribuição g(k) ponderada por Planck para todas as temperaturas.
+
+    eta   : (n_η,) número de onda [cm⁻¹]
+    kappa : (n_T, n_η) um espectro por temperatura, ou (n_η,) um único
+            espectro ponderado em todas as T
+    T     : (n_T,) temperaturas [K]
+    bordas: bordas de k comuns, positivas e crescentes (padrão: bordas_log_k(kappa, n_bins))
+    O custo é linear em n_η: cada ponto cai num bin por aritmética em ln k
+    (np.searchsorted se as bordas não forem log-espaçadas) e os pesos de
+    Planck são acumulados com um único np.bincount por bloco.
+    """
+    eta = np.asarray(eta, dtype=float)
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    kappa = np.asarray(kappa)
+    if kappa.shape[-1] != eta.size or (kappa.ndim == 2 and kappa.shape[0] != T.size):
+        raise ValueError(f"kappa deve ter forma ({T.size}, {eta.size}) ou ({eta.size},); "
+                         f"recebido {kappa.shape}.")
+    if bordas is None:
+        bordas = bordas_log_k(kappa, n_bins)
+    bordas = np.asarray(bordas, dtype=float)
+    if bordas.ndim != 1 or bordas.size < 2 or bordas[0] <= 0 or np.any(np.diff(bordas) <= 0):
+        raise ValueError("bordas deve ser um vetor positivo e estritamente crescente (>= 2 valores).")
+    nb = bordas.size - 1
+    ln_k0 = np.log(bordas[0])
+    d_ln_k = (np.log(bordas[-1]) - ln_k0) / nb
+    log_uniforme = np.allclose(np.diff(np.log(bordas)), d_ln_k)
+    deslocamento = (nb * np.arange(T.size))[:, None]
+
+    w = pesos_trapezio(eta)
+    hist = np.zeros(T.size * nb)
+    passo = max(1, elementos_por_bloco // T.size)
+    for i0 in range(0, eta.size, passo):
+        b = slice(i0, i0 + passo)
+        peso = w[b] * poder_emissivo_espectral(eta[b], T)                  # (n_T, m)
+        k = np.atleast_2d(kappa[..., b])
+        if log_uniforme:
+            with np.errstate(divide="ignore"):
+                pos = np.floor((np.log(k) - ln_k0) / d_ln_k)
+            idx = np.clip(np.nan_to_num(pos, neginf=0.0), 0, nb - 1).astype(np.intp)
+        else:
+            idx = np.clip(np.searchsorted(bordas, k, side="right") - 1, 0, nb - 1)
+        idx = np.broadcast_to(idx + deslocamento, peso.shape)
+        hist += np.bincount(idx.ravel(), weights=peso.ravel(), minlength=T.size * nb)
+
+    hist = hist.reshape(T.size, nb)
+    total = hist.sum(axis=1)
+    g = np.zeros((T.size, nb + 1))
+    np.cumsum(hist, axis=1, out=g[:, 1:])
+    g /= total[:, None]
+    return DistribuicaoK(T, bordas, g, total / (SIGMA_SB * T**4))
+
+
+def distribuicao_de_arquivos(arquivos: dict, n_bins: int = N_BINS) -> DistribuicaoK:
+    """
+    Distribuição-k a partir de arquivos κ (nu, kappa) de conversao_kappa_ceta.py
+    com a mesma malha η. arquivos : {T [K]: caminho}.
+    """
+    T = np.array(sorted(arquivos), dtype=float)
+    dados = [ler_xsec(arquivos[t]) for t in sorted(arquivos)]
+    eta0 = dados[0][:, 0]
+    if not all(d.shape == dados[0].shape and np.array_equal(d[:, 0], eta0) for d in dados):
+        raise ValueError("Os espectros devem compartilhar a mesma malha η.")
+    return distribuicao_k(eta0, np.stack([d[:, 1] for d in dados]), T, n_bins=n_bins)
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Distribuição-k (FSK) e quadratura de Gauss a partir de κ(η).")
+    ap.add_argument("espectros", nargs="+", metavar="T=ARQUIVO",
+                    help="temperatura [K] e arquivo (nu, kappa), ex.: 1200=kappa_1200K.txt")
+    ap.add_argument("--pontos", type=int, default=N_GAUSS, help="pontos de Gauss em g")
+    ap.add_argument("--bins", type=int, default=N_BINS, help="bins de ln k")
+    ap.add_argument("--S", type=float, nargs="*", default=[],
+                    help="percursos [m] para imprimir a emitância pela quadratura")
+    args = ap.parse_args(argv)
+
+    arquivos = {}
+    for item in args.espectros:
+        t, _, arq = item.partition("=")
+        if not arq:
+            ap.error(f"use T=ARQUIVO (recebido '{item}').")
+        arquivos[float(t)] = arq
+
+    dist = distribuicao_de_arquivos(arquivos, args.bins)
+    k, w = dist.quadratura(args.pontos)
+    print("Pesos de Gauss em g: " + " ".join(f"{wi:.6f}" for wi in w))
+    print(f"{'T [K]':>6} | " + " | ".join(f"k_{i + 1} [cm^-1]".rjust(14) for i in range(args.pontos)))
+    print("-" * (9 + 17 * args.pontos))
+    for Ti, linha in zip(dist.T, k):
+        print(f"{Ti:6.0f} | " + " | ".join(f"{ki:14.6e}" for ki in linha))
+    if args.S:
+        eps = dist.emitancia(args.S, args.pontos)
+        print(f"\n{'T [K]':>6} | " + " | ".join(f"S = {s:g} m".rjust(12) for s in args.S))
+        for Ti, linha in zip(dist.T, eps):
+            print(f"{Ti:6.0f} | " + " | ".join(f"{e:12.9f}" for e in linha))
+
+
+if __name__ == "__main__":
+    main()
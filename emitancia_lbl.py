@@ -0,0 +1,125 @@
+# ================================================================
+# Emitância total linha-a-linha (LBL) a partir dos espectros κ(η)
+# ε(T,S) = ∫ (1 − e^{−κ_η S}) E_bη(T) dη / (σ T⁴)
+# Vetorizado em todas as temperaturas e percursos de uma vez, e
+# dividido em blocos ao longo de η (cada bloco cabe no cache da CPU)
+# ================================================================
+
+import numpy as np
+
+from leitura_espectros import ler_xsec
+
+# ---------------------- CONSTANTES ----------------------
+C1 = 3.741771852e-16      # 2πhc² [W·m²]
+C2 = 1.438776877          # hc/k [cm·K]
+SIGMA_SB = 5.670374419e-8 # Stefan–Boltzmann [W/(m²·K⁴)]
+
+ELEMENTOS_POR_BLOCO = 1 << 18   # n_T × n_S × pontos de η por bloco (~2 MB em float64)
+# -------------------------------------------------------
+
+
+def poder_emissivo_espectral(eta: np.ndarray, T) -> np.ndarray:
+    """
+    Poder emissivo espectral de corpo negro E_bη [W/(m²·cm⁻¹)].
+    eta em cm⁻¹; T em K (escalar ou vetor → resultado (n_T, n_η)).
+    """
+    eta = np.asarray(eta, dtype=float)
+    T = np.asarray(T, dtype=float)
+    x = C2 * eta / T[..., None] if T.ndim else C2 * eta / T
+    with np.errstate(over="ignore", divide="ignore"):
+        # C1 [W·m²] · (100 η)³ [m⁻³] · 100 [m⁻¹ por cm⁻¹] = C1·1e8·η³
+        return C1 * 1e8 * eta**3 / np.expm1(x)
+
+
+def pesos_trapezio(eta: np.ndarray) -> np.ndarray:
+    """Pesos da regra do trapézio para uma malha η qualquer (crescente)."""
+    eta = np.asarray(eta, dtype=float)
+    w = np.empty_like(eta)
+    if eta.size == 1:
+        w[:] = 0.0
+        return w
+    d = np.diff(eta)
+    w[0], w[-1] = d[0] / 2, d[-1] / 2
+    w[1:-1] = (d[:-1] + d[1:]) / 2
+    return w
+
+
+def emitancia_total(eta: np.ndarray, kappa: np.ndarray, T, S,
+                    elementos_por_bloco: int = ELEMENTOS_POR_BLOCO) -> np.ndarray:
+    """
+    Emitância total ε(T, S) para todas as temperaturas e percursos.
+
+    eta   : (n_η,) número de onda [cm⁻¹], comum a todos os espectros
+    kappa : (n_T, n_η) κ [cm⁻¹] de cada temperatura (ou (n_η,) com T escalar)
+    T     : (n_T,) temperaturas [K]
+    S     : (n_S,) comprimentos de percurso [m]
+    Retorna (n_T, n_S) (ou (n_S,) se T for escalar).
+    """
+    eta = np.asarray(eta, dtype=float)
+    escalar = np.ndim(T) == 0
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    kappa = np.atleast_2d(kappa)
+    S_cm = 100.0 * np.atleast_1d(np.asarray(S, dtype=float))   # κ em cm⁻¹ → S em cm
+    if kappa.shape != (T.size, eta.size):
+        raise ValueError(f"kappa deve ter forma (n_T, n_η) = ({T.size}, {eta.size}); "
+                         f"recebido {kappa.shape}.")
+
+    w = pesos_trapezio(eta)
+    soma = np.zeros((T.size, S_cm.size))
+    passo = max(1, elementos_por_bloco // (T.size * S_cm.size))
+    for i0 in range(0, eta.size, passo):
+        b = slice(i0, i0 + passo)
+        peso = w[b] * poder_emissivo_espectral(eta[b], T)          # (n_T, m)
+        tau = kappa[:, None, b] * S_cm[None, :, None]               # (n_T, n_S, m)
+        absorv = -np.expm1(-tau)                                    # 1 − e^{−κS}
+        soma += np.einsum("tsm,tm->ts", absorv, peso)
+
+    eps = soma / (SIGMA_SB * T[:, None] ** 4)
+    return eps[0] if escalar else eps
+
+
+def emitancia_de_arquivos(arquivos: dict, S) -> tuple:
+    """
+    Emitância a partir de arquivos κ (nu, kappa) gerados por conversao_kappa_ceta.py.
+
+    arquivos : {T [K]: caminho}. Espectros com a mesma malha são calculados
+               juntos num único passe vetorizado.
+    Retorna (T ordenadas (n_T,), ε (n_T, n_S)).
+    """
+    T = np.array(sorted(arquivos), dtype=float)
+    dados = [ler_xsec(arquivos[t]) for t in sorted(arquivos)]
+    eta0 = dados[0][:, 0]
+    if all(d.shape == dados[0].shape and np.array_equal(d[:, 0], eta0) for d in dados):
+        kappa = np.stack([d[:, 1] for d in dados])
+        return T, emitancia_total(eta0, kappa, T, S)
+    eps = np.array([emitancia_total(d[:, 0], d[:, 1], t, S) for t, d in zip(T, dados)])
+    return T, eps
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    import argparse
+
+    ap = argparse.ArgumentParser(description="Emitância total LBL a partir de arquivos κ(η).")
+    ap.add_argument("espectros", nargs="+", metavar="T=ARQUIVO",
+                    help="temperatura [K] e arquivo (nu, kappa), ex.: 1200=kappa_1200K.txt")
+    ap.add_argument("--S", type=float, nargs="+", default=[30.0, 10.0, 1.0, 0.1],
+                    help="comprimentos de percurso [m]")
+    args = ap.parse_args(argv)
+
+    arquivos = {}
+    for item in args.espectros:
+        t, _, arq = item.partition("=")
+        if not arq:
+            ap.error(f"use T=ARQUIVO (recebido '{item}').")
+        arquivos[float(t)] = arq
+
+    T, eps = emitancia_de_arquivos(arquivos, args.S)
+    print(f"{'T [K]':>6} | " + " | ".join(f"S = {s:g} m".rjust(12) for s in args.S))
+    print("-" * (9 + 15 * len(args.S)))
+    for Ti, linha in zip(T, eps):
+        print(f"{Ti:6.0f} | " + " | ".join(f"{e:12.9f}" for e in linha))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# ================================================================
+# Espectro em malha uniforme de número de onda (ex.: κ do HITRAN)
+# Guarda apenas (início, passo, n) + vetor de valores; o eixo ν̃
+# só é materializado quando realmente necessário (ex.: ax.plot)
+# ================================================================
+
+import numpy as np
+
+
+class EspectroUniforme:
+    """
+    Valores y(ν̃) em ν̃_i = inicio + i * passo, i = 0 … n-1.
+
+    Fatias, máscaras e buscas por número de onda são calculadas
+    aritmeticamente, sem construir o eixo com np.arange.
+    """
+
+    def __init__(self, valores: np.ndarray, inicio: float, passo: float):
+        valores = np.asarray(valores)
+        if valores.ndim != 1:
+            raise ValueError("valores deve ser um vetor 1D.")
+        if passo <= 0:
+            raise ValueError("passo deve ser positivo.")
+        self.valores = valores
+        self.inicio = float(inicio)
+        self.passo = float(passo)
+
+    @classmethod
+    def de_malha(cls, valores: np.ndarray, inicio: float, fim: float,
+                 passo: float) -> "EspectroUniforme":
+        """
+        Cria o espectro validando o comprimento contra a malha [inicio, fim].
+        Levanta ValueError se o número de amostras não corresponder à malha
+        (em vez de truncar silenciosamente).
+        """
+        n_esperado = int(round((fim - inicio) / passo)) + 1
+        if len(valores) != n_esperado:
+            raise ValueError(
+                f"{len(valores)} amostras, mas a malha {inicio:g}–{fim:g} "
+                f"cm^-1 com passo {passo:g} tem {n_esperado} pontos."
+            )
+        return cls(valores, inicio, passo)
+
+    # ---------------------- propriedades da malha ----------------------
+
+    def __len__(self) -> int:
+        return self.valores.shape[0]
+
+    @property
+    def n(self) -> int:
+        return len(self)
+
+    @property
+    def fim(self) -> float:
+        """Último número de onda da malha [cm^-1]."""
+        return self.inicio + (self.n - 1) * self.passo
+
+    @property
+    def nu(self) -> np.ndarray:
+        """Eixo ν̃ materializado (aloca n floats a cada chamada)."""
+        return self.inicio + self.passo * np.arange(self.n, dtype=float)
+
+    # ---------------------- buscas aritméticas ----------------------
+
+    def indice(self, nu):
+        """Índice da amostra mais próxima de `nu` (escalar ou vetor), limitado à malha."""
+        i = np.rint((np.asarray(nu, dtype=float) - self.inicio) / self.passo)
+        i = np.clip(i, 0, self.n - 1).astype(np.intp)
+        return i if i.ndim else int(i)
+
+    def fatia(self, nu_min: float, nu_max: float) -> slice:
+        """slice com as amostras em nu_min <= ν̃ <= nu_max."""
+        eps = 1e-9
+        i0 = int(np.ceil((nu_min - self.inicio) / self.passo - eps))
+        i1 = int(np.floor((nu_max - self.inicio) / self.passo + eps)) + 1
+        i0 = min(max(i0, 0), self.n)
+        i1 = min(max(i1, i0), self.n)
+        return slice(i0, i1)
+
+    def mascara(self, nu_min: float, nu_max: float) -> np.ndarray:
+        """Máscara booleana equivalente a (nu >= nu_min) & (nu <= nu_max)."""
+        m = np.zeros(self.n, dtype=bool)
+        m[self.fatia(nu_min, nu_max)] = True
+        return m
+
+    def recorte(self, nu_min: float, nu_max: float) -> "EspectroUniforme":
+        """Sub-espectro em [nu_min, nu_max] (visão dos valores, sem cópia)."""
+        s = self.fatia(nu_min, nu_max)
+        return EspectroUniforme(self.valores[s], self.inicio + s.start * self.passo,
+                                self.passo)
+
+    def valor_em(self, nu):
+        """Interpolação linear de y em `nu` (fora da malha: valor da borda)."""
+        x = (np.asarray(nu, dtype=float) - self.inicio) / self.passo
+        x = np.clip(x, 0, self.n - 1)
+        i = np.minimum(np.floor(x).astype(np.intp), max(self.n - 2, 0))
+        f = x - i
+        y = self.valores
+        if self.n == 1:
+            return y[i]
+        return (1.0 - f) * y[i] + f * y[i + 1]
+
+    def com_valores(self, valores: np.ndarray) -> "EspectroUniforme":
+        """Mesmo eixo, novos valores (ex.: κ → σ)."""
+        if len(valores) != self.n:
+            raise ValueError("valores com comprimento diferente da malha.")
+        return EspectroUniforme(valores, self.inicio, self.passo)
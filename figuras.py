@@ -0,0 +1,340 @@
+# ================================================================
+# Figuras em várias línguas e estilos a partir de uma única leitura
+# Cada figura carrega e pré-processa os seus dados uma vez
+# (Figura.dados) e é desenhada para cada combinação de rótulos
+# (ROTULOS: "en", "pt") e estilo (ESTILOS: "artigo", "tese") no mesmo
+# processo. Os scripts graph_*/emission_* são variantes finas: escolhem
+# figura, língua e estilo e chamam mostrar()
+# ================================================================
+
+import argparse
+import os
+from functools import lru_cache
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.ticker import MultipleLocator
+
+import dados_emissao
+from decimacao import plotar_decimado
+from emitancia_lbl import emitancia_de_arquivos
+from leitura_espectros import ler_xsec
+from metricas_wsgg import calcular_erros, imprimir_tabela
+
+# --------------------- CONFIGURAÇÃO (editar) ---------------------
+ARQ_EXOMOL_1200 = r'C:'     # .xsec ExoMol / CoYuTe, 1200 K, 1 bar
+ARQ_EXOMOL_300 = r'C:'      # .xsec ExoMol / CoYuTe, 300 K, 1 bar
+# {T [K]: arquivo (nu, kappa) gerado por conversao_kappa_ceta.py} para
+# recalcular o LBL das figuras de emissão. Vazio → valores de dados_emissao.py
+ARQUIVOS_KAPPA = {}
+# ---------------------------------------------------------------
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+SAIDA_PADRAO = "figuras"
+FORMATOS = ["png"]
+DPI = 300
+# ---------------------------------------------------------------
+
+# ===================== ESTILOS E RÓTULOS =====================
+
+# tamanhos de fonte: "artigo" = graph_*.py originais; "tese" = versões traduzidas
+# (as figuras de emissão sobrepõem ESTILOS_EMISSAO, abaixo)
+ESTILOS = {
+    "artigo": {"figsize": (8, 4.5), "rotulos": 13, "ticks": 11, "legenda": 11, "titulo": 13},
+    "tese":   {"figsize": (8, 4.5), "rotulos": 18, "ticks": 16, "legenda": 16, "titulo": 18},
+}
+
+ROTULOS = {
+    "en": {
+        "numero_onda": r'Wavenumber (cm$^{-1}$)',
+        "secao_choque": r'Cross-section (cm$^{2}$/molecule)',
+        "comprimento_onda": r'Wavelength ($\mu$m)',
+        "temperatura": "Temperature (K)",
+        "erro_rel_sim": "Symmetric relative error (%)",
+        "titulo_erros": "Symmetric relative error (WSGG vs LBL)",
+        "emitancia": "Emittance",
+        "titulo_emitancias": "Comparison of LBL and WSGG emittances",
+        "decimal": ".",
+    },
+    "pt": {
+        "numero_onda": r'Número de onda (cm$^{-1}$)',
+        "secao_choque": r'Seção transversal de absorção (cm$^{2}$/molécula)',
+        "comprimento_onda": r'Comprimento de onda ($\mu$m)',
+        "temperatura": "Temperatura (K)",
+        "erro_rel_sim": "Erro relativo simétrico (%)",
+        "titulo_erros": "Erro relativo simétrico (WSGG vs LBL)",
+        "emitancia": "Emitância",
+        "titulo_emitancias": "Comparação entre as emitâncias LBL e WSGG",
+        "decimal": ",",
+    },
+}
+
+# figuras de emissão: "artigo" = emission_wsgg.py original (figsize padrão e (10, 6),
+# fontes 14/16/12, eixos e legenda padrão do matplotlib, títulos "para cada percurso");
+# "tese" = emission_*_translate.py, igual a ESTILOS["tese"]
+ESTILOS_EMISSAO = {
+    "artigo": {"figsize": (6.4, 4.8), "figsize_emitancias": (10, 6), "rotulos": 14, "ticks": 10,
+               "legenda": 12, "titulo": 16, "eixos_matplotlib": True, "prefixo_S": ""},
+}
+TEXTOS_EMISSAO = {
+    "artigo": {
+        "en": {"temperatura": "Temperature [K]", "erro_rel_sim": "Symmetric relative error [%]",
+               "titulo_erros": "Symmetric relative error (WSGG vs LBL) for each path length",
+               "titulo_emitancias": "LBL vs WSGG comparison for all path lengths"},
+        "pt": {"temperatura": "Temperatura [K]", "erro_rel_sim": "Erro relativo simétrico [%]",
+               "titulo_erros": "Erro relativo simétrico (WSGG vs LBL) para cada percurso",
+               "titulo_emitancias": "Comparação LBL vs WSGG para todos os percursos"},
+    },
+}
+
+LAMBDA_TICKS = [100, 10, 5, 4, 3, 2.5, 2, 1.5, 1.25, 1, 0.833]
+MARCADORES = ["o", "s", "^", "v", "D", "<", ">", "p"]
+
+
+def num_to_lambda(v): return 1e4 / v
+def lambda_to_num(l): return 1e4 / l
+
+
+def _texto(rotulo, idioma: str) -> str:
+    """Rótulo fixo (str) ou por língua ({"en": ..., "pt": ...})."""
+    return rotulo[idioma] if isinstance(rotulo, dict) else rotulo
+
+
+def _metros(S: float, idioma: str) -> str:
+    return f"{S:g} m".replace(".", ROTULOS[idioma]["decimal"])
+
+
+def _eixos(ax, e: dict) -> None:
+    """Ticks, bordas, grade e fundo comuns a todas as figuras."""
+    ax.tick_params(axis='both', direction='in', length=5, width=0.8, labelsize=e["ticks"])
+    for s in ['top', 'right']:
+        ax.spines[s].set_visible(False)
+    ax.grid(which='major', color='gray', linestyle='--', linewidth=0.4, alpha=0.3)
+    ax.set_facecolor('white')
+
+
+@lru_cache(maxsize=None)
+def _espectro(arq: str):
+    """ler_xsec compartilhado entre figuras do mesmo processo (memmap do cache .npy)."""
+    data = ler_xsec(arq)
+    return data[:, 0], data[:, 1]
+
+# ===================== FIGURAS =====================
+
+class Figura:
+    """
+    Figura com dados carregados uma vez (carregar) e desenhada por variante:
+    desenhar(idioma, estilo) → lista de matplotlib.figure.Figure.
+    """
+
+    def __init__(self):
+        self._dados = None
+
+    def carregar(self):
+        raise NotImplementedError
+
+    @property
+    def dados(self):
+        if self._dados is None:
+            self._dados = self.carregar()
+        return self._dados
+
+    def desenhar(self, idioma: str, estilo: str) -> list:
+        raise NotImplementedError
+
+
+class FiguraEspectros(Figura):
+    """
+    Seções de choque (eixo log) com eixo superior em µm.
+    curvas: [(arquivo .xsec, cor, rótulo)], rótulo fixo ou {"en": ..., "pt": ...}.
+    """
+
+    def __init__(self, curvas, xlim=(50, 12100)):
+        super().__init__()
+        self.curvas = curvas
+        self.xlim = xlim
+
+    def carregar(self):
+        return [_espectro(arq) for arq, _, _ in self.curvas]
+
+    def desenhar(self, idioma: str, estilo: str) -> list:
+        r, e = ROTULOS[idioma], ESTILOS[estilo]
+        fig, ax1 = plt.subplots(figsize=e["figsize"])
+        for (x, y), (_, cor, rotulo) in zip(self.dados, self.curvas):
+            plotar_decimado(ax1, x, y, color=cor, linewidth=1.0, label=_texto(rotulo, idioma))
+
+        ax1.set_yscale('log')
+        ax1.set_xlim(*self.xlim)
+        ax1.set_xlabel(r["numero_onda"], fontsize=e["rotulos"])
+        ax1.set_ylabel(r["secao_choque"], fontsize=e["rotulos"])
+        _eixos(ax1, e)
+
+        secax = ax1.secondary_xaxis('top', functions=(num_to_lambda, lambda_to_num))
+        secax.set_xlabel(r["comprimento_onda"], fontsize=e["rotulos"])
+        secax.set_xticks(LAMBDA_TICKS)
+        secax.set_xticklabels([f'{t:g}' for t in LAMBDA_TICKS])
+        secax.tick_params(axis='x', labelrotation=0, labelsize=e["ticks"])
+
+        ax1.xaxis.set_major_locator(MultipleLocator(2000))
+        ax1.legend(frameon=False, fontsize=e["legenda"], loc='upper right')
+        fig.tight_layout()
+        return [fig]
+
+
+class FiguraEmissao(Figura):
+    """
+    Erro relativo simétrico e emitâncias LBL × WSGG para cada percurso.
+    wsgg: {S [m]: ε_WSGG(T)} (ver dados_emissao.py); com arquivos_kappa o LBL
+    é recalculado dos espectros κ, senão vem de `lbl` ou de dados_emissao.LBL.
+    T e S substituem dados_emissao.T e dados_emissao.PERCURSOS (ex.: tabelas
+    geradas por pipeline_wsgg.py).
+    """
+
+    def __init__(self, wsgg: dict, arquivos_kappa: dict | None = None,
+                 lbl: dict | None = None, T=None, S=None):
+        super().__init__()
+        self.wsgg = wsgg
+        self.arquivos_kappa = arquivos_kappa or {}
+        self.lbl = lbl
+        self.T = T
+        self.S = S
+
+    def carregar(self):
+        T = dados_emissao.T if self.T is None else np.asarray(self.T, dtype=float)
+        S = dados_emissao.PERCURSOS if self.S is None else list(self.S)
+        lbl = dict(dados_emissao.LBL if self.lbl is None else self.lbl)
+        if self.arquivos_kappa:
+            T_lbl, eps_lbl = emitancia_de_arquivos(self.arquivos_kappa, S)
+            if not np.array_equal(T_lbl, T):
+                raise ValueError("ARQUIVOS_KAPPA deve cobrir exatamente as temperaturas de T.")
+            lbl = dict(zip(S, eps_lbl.T))
+        erros = {s: calcular_erros(lbl[s], self.wsgg[s]) for s in S}
+        return T, S, lbl, erros
+
+    def imprimir_tabelas(self) -> None:
+        """Tabelas LBL × WSGG no terminal (metricas_wsgg.imprimir_tabela)."""
+        T, S, lbl, erros = self.dados
+        for s in S:
+            imprimir_tabela(T, lbl[s], lbl[s] + erros[s]["diff"], erros[s],
+                            f"Percurso S = {_metros(s, 'pt')}")
+
+    @staticmethod
+    def _eixos(ax, e: dict) -> None:
+        if e.get("eixos_matplotlib"):
+            ax.tick_params(labelsize=e["ticks"])
+            ax.grid(True)
+        else:
+            _eixos(ax, e)
+
+    def desenhar(self, idioma: str, estilo: str) -> list:
+        r = {**ROTULOS[idioma], **TEXTOS_EMISSAO.get(estilo, {}).get(idioma, {})}
+        e = {**ESTILOS[estilo], **ESTILOS_EMISSAO.get(estilo, {})}
+        simples = e.get("eixos_matplotlib", False)
+        T, S, lbl, erros = self.dados
+
+        fig1, ax = plt.subplots(figsize=e["figsize"])
+        for i, s in enumerate(S):
+            m = MARCADORES[i % len(MARCADORES)]
+            ax.plot(T, erros[s]["rel_sym"] * 100, marker=m,
+                    label=f"{e.get('prefixo_S', 'S = ')}{_metros(s, idioma)}")
+        if simples:
+            ax.axhline(0, linestyle="--")
+        else:
+            ax.axhline(0, linestyle="--", color="gray", linewidth=0.8)
+        ax.set_xlabel(r["temperatura"], fontsize=e["rotulos"])
+        ax.set_ylabel(r["erro_rel_sim"], fontsize=e["rotulos"])
+        ax.set_title(r["titulo_erros"], fontsize=e["titulo"])
+        self._eixos(ax, e)
+        if simples:
+            ax.legend(fontsize=e["legenda"])
+        else:
+            ax.legend(frameon=False, fontsize=e["legenda"], loc='best')
+        fig1.tight_layout()
+
+        fig2, ax = plt.subplots(figsize=e.get("figsize_emitancias", e["figsize"]))
+        for i, s in enumerate(S):
+            m = MARCADORES[i % len(MARCADORES)]
+            ax.plot(T, lbl[s], marker=m, linestyle="-", label=f"LBL {_metros(s, idioma)}")
+            ax.plot(T, self.wsgg[s], marker=m, linestyle="--", label=f"WSGG {_metros(s, idioma)}")
+        ax.set_xlabel(r["temperatura"], fontsize=e["rotulos"])
+        ax.set_ylabel(r["emitancia"], fontsize=e["rotulos"])
+        ax.set_title(r["titulo_emitancias"], fontsize=e["titulo"])
+        ax.set_ylim(0, 1)
+        self._eixos(ax, e)
+        if simples:
+            ax.legend(ncol=2, fontsize=e["legenda"])
+        else:
+            ax.legend(ncol=2, fontsize=e["legenda"], frameon=False, loc='lower left')
+        fig2.tight_layout()
+        return [fig1, fig2]
+
+
+FIGURAS = {
+    "espectro": FiguraEspectros([
+        (ARQ_EXOMOL_1200, '#0072B2', {"en": 'T = 1200 K', "pt": 'ExoMol / CoYuTe, 1200 K'}),
+    ]),
+    "comparacao_exomol": FiguraEspectros([
+        (ARQ_EXOMOL_1200, '#0072B2', {"en": 'T = 1200 K, 1 bar', "pt": 'ExoMol / CoYuTe, 1200 K'}),
+        (ARQ_EXOMOL_300, '#D55E00', {"en": 'T = 300 K, 1 bar', "pt": 'ExoMol / CoYuTe, 300 K'}),
+    ]),
+    "emissao_wsgg": FiguraEmissao(dados_emissao.WSGG_AJUSTADO, ARQUIVOS_KAPPA),
+    "emissao_antes_ajuste": FiguraEmissao(dados_emissao.WSGG_ANTES_AJUSTE, ARQUIVOS_KAPPA),
+}
+
+# ===================== SAÍDA =====================
+
+def mostrar(figura: Figura, idioma: str = "en", estilo: str = "artigo") -> None:
+    """Desenha uma variante e abre as janelas (plt.show)."""
+    figura.desenhar(idioma, estilo)
+    plt.show()
+
+
+def renderizar_variantes(figuras: dict, idiomas=tuple(ROTULOS), estilos=tuple(ESTILOS),
+                         saida: str = SAIDA_PADRAO, formatos=FORMATOS, dpi: int = DPI) -> list:
+    """
+    Grava todas as variantes de cada figura como <nome>_<idioma>_<estilo>[_k].<fmt>.
+    Os dados de cada figura são lidos uma única vez. Retorna os arquivos gravados.
+    """
+    os.makedirs(saida, exist_ok=True)
+    gravados = []
+    for nome, figura in figuras.items():
+        for idioma in idiomas:
+            for estilo in estilos:
+                figs = figura.desenhar(idioma, estilo)
+                for k, fig in enumerate(figs, start=1):
+                    base = f"{nome}_{idioma}_{estilo}" + (f"_{k}" if len(figs) > 1 else "")
+                    for fmt in formatos:
+                        arq = os.path.join(saida, f"{base}.{fmt}")
+                        fig.savefig(arq, dpi=dpi, format=fmt)
+                        gravados.append(arq)
+                    plt.close(fig)
+    return gravados
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Grava as figuras em todas as línguas/estilos com uma leitura por figura.")
+    ap.add_argument("figuras", nargs="*", help=f"figuras a gravar (padrão: todas): {', '.join(FIGURAS)}")
+    ap.add_argument("--idiomas", nargs="+", default=list(ROTULOS), choices=list(ROTULOS))
+    ap.add_argument("--estilos", nargs="+", default=list(ESTILOS), choices=list(ESTILOS))
+    ap.add_argument("--saida", default=SAIDA_PADRAO, help="diretório das figuras")
+    ap.add_argument("--formatos", nargs="+", default=FORMATOS, choices=["png", "pdf", "svg"])
+    ap.add_argument("--dpi", type=int, default=DPI)
+    args = ap.parse_args(argv)
+    desconhecidas = [f for f in args.figuras if f not in FIGURAS]
+    if desconhecidas:
+        ap.error(f"figuras desconhecidas: {', '.join(desconhecidas)}.")
+
+    plt.switch_backend("Agg")
+    for nome in args.figuras or list(FIGURAS):
+        try:
+            gravados = renderizar_variantes({nome: FIGURAS[nome]}, args.idiomas, args.estilos,
+                                            args.saida, args.formatos, args.dpi)
+        except (OSError, ValueError) as erro:
+            print(f"{nome:22s} ERRO: {erro}")
+            continue
+        print(f"{nome:22s} {len(gravados)} arquivos")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator
+from leitura_espectros import ler_xsec, ler_kappa_hitran
+from decimacao import plotar_decimado
 
 # ===================== CONFIGURAÇÕES GERAIS =====================
 #CODIGO FEITO PARA COMPARAR LINHAS ESPECTRAIS CROSSSECTION DO EXOMOL E HITRAN
@@ -37,17 +39,15 @@ def hitran_to_sigma(kappa: np.ndarray, T: float, p_bar: float, Y: float, unit: s
 
 # ===================== LEITURA HITRAN 300 K =====================
 
-kappa = np.loadtxt(FILE_KAPPA_300, dtype=float)                   
-nu_hit = np.arange(NU_START, NU_STOP + NU_STEP/2, NU_STEP)
+# malha implícita (início, passo, n); o comprimento é validado contra NU_STOP
+esp_hit = ler_kappa_hitran(FILE_KAPPA_300, NU_START, NU_STOP, NU_STEP)
 
-n = min(len(nu_hit), len(kappa))
-nu_hit, kappa = nu_hit[:n], kappa[:n]
-
-sigma_hit = hitran_to_sigma(kappa, T_K, P_BAR, Y_ABS, UNIT)
+sigma_hit = hitran_to_sigma(esp_hit.valores, T_K, P_BAR, Y_ABS, UNIT)
+nu_hit = esp_hit.nu                     # eixo ν̃ materializado só para o plot
 
 # ===================== LEITURA EXOMOL 300 K =====================
 
-data_exo = np.loadtxt(FILE_EXOMOL_300, dtype=float)
+data_exo = ler_xsec(FILE_EXOMOL_300)
 nu_exo, sigma_exo = data_exo[:, 0], data_exo[:, 1]
 
 # ========================= PLOT COMPARATIVO =========================
@@ -55,12 +55,12 @@ nu_exo, sigma_exo = data_exo[:, 0], data_exo[:, 1]
 fig, ax1 = plt.subplots(figsize=(8, 4.5))
 
 # ExoMol (azul)
-ax1.plot(nu_exo, sigma_exo, color='#0072B2', lw=1.0,
-         label='ExoMol / CoYuTe, 300 K, 1 bar')
+plotar_decimado(ax1, nu_exo, sigma_exo, color='#0072B2', lw=1.0,
+                label='ExoMol / CoYuTe, 300 K, 1 bar')
 
 # HITRAN (laranja)
-ax1.plot(nu_hit, sigma_hit, color='#D55E00', lw=1.0,
-         label='HITRAN, 300 K, 1 bar')
+plotar_decimado(ax1, nu_hit, sigma_hit, color='#D55E00', lw=1.0,
+                label='HITRAN, 300 K, 1 bar')
 
 ax1.set_yscale('log')
 ax1.set_xlim(50, 10000)
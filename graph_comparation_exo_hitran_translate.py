@@ -1,6 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator
+from leitura_espectros import ler_xsec, ler_kappa_hitran
+from decimacao import plotar_decimado
+from convolucao import alargar
 
 # ===================== CONFIGURAÇÕES GERAIS =====================
 # CÓDIGO FEITO PARA COMPARAR LINHAS ESPECTRAIS (SEÇÃO TRANSVERSAL DE ABSORÇÃO)
@@ -18,6 +21,10 @@ NU_START, NU_STOP, NU_STEP = 50.0, 10000.0, 0.01  # malha fixa do HITRAN
 # --- ExoMol (σ já em cm²/molécula) ---
 FILE_EXOMOL_800 = r'C:'
 
+# --- Resolução instrumental (convolução das duas curvas antes do plot) ---
+FWHM_INSTRUMENTO = None   # cm^-1 (ex.: 0.5); None → curvas sem convolução
+FORMA_INSTRUMENTO = "gauss"   # "gauss", "lorentz", "retangular", "triangular" ou "sinc"
+
 # Constante de Loschmidt a 296 K e 1 atm (moléculas/cm³)
 N0_296 = 2.479e19
 
@@ -38,25 +45,29 @@ def hitran_to_sigma(kappa: np.ndarray, T: float, p_bar: float, Y: float, unit: s
 
 # ===================== LEITURA HITRAN =====================
 
-kappa = np.loadtxt(FILE_KAPPA_800, dtype=float)
-nu_hit = np.arange(NU_START, NU_STOP + NU_STEP/2, NU_STEP)
-
-n = min(len(nu_hit), len(kappa))
-nu_hit, kappa = nu_hit[:n], kappa[:n]
+esp_hit = ler_kappa_hitran(FILE_KAPPA_800, NU_START, NU_STOP, NU_STEP)
 
-sigma_hit = hitran_to_sigma(kappa, T_K, P_BAR, Y_ABS, UNIT)
+sigma_hit = hitran_to_sigma(esp_hit.valores, T_K, P_BAR, Y_ABS, UNIT)
+nu_hit = esp_hit.nu
 
 # ===================== LEITURA EXOMOL =====================
 
-data_exo = np.loadtxt(FILE_EXOMOL_800, dtype=float)
+data_exo = ler_xsec(FILE_EXOMOL_800)
 nu_exo, sigma_exo = data_exo[:, 0], data_exo[:, 1]
 
+# ===================== RESOLUÇÃO INSTRUMENTAL =====================
+
+if FWHM_INSTRUMENTO:
+    sigma_hit = alargar(esp_hit.com_valores(sigma_hit), FORMA_INSTRUMENTO, FWHM_INSTRUMENTO).valores
+    sigma_exo = alargar((nu_exo, sigma_exo), FORMA_INSTRUMENTO, FWHM_INSTRUMENTO)
+
 # ========================= PLOT COMPARATIVO =========================
 
 fig, ax1 = plt.subplots(figsize=(8, 4.5))
 
 # ExoMol
-ax1.plot(
+plotar_decimado(
+    ax1,
     nu_exo,
     sigma_exo,
     color='#0072B2',
@@ -65,7 +76,8 @@ ax1.plot(
 )
 
 # HITRAN
-ax1.plot(
+plotar_decimado(
+    ax1,
     nu_hit,
     sigma_hit,
     color='#D55E00',
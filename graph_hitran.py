@@ -2,6 +2,8 @@
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.ticker import MultipleLocator
+from leitura_espectros import ler_kappa_hitran
+from decimacao import plotar_decimado
 
 # --------------------- CONFIGURAÇÃO (editar) ---------------------
 FILE_KAPPA = r'D:'  # 1 coluna: kappa
@@ -33,22 +35,19 @@ def hitran_to_sigma(kappa: np.ndarray, T: float, p_bar: float, Y: float, unit: s
     else:
         raise ValueError("UNIT deve ser 'cm^-1' ou 'cm^-1 amagat^-1'.")
 
-# ---- leitura da coluna de κ e construção do eixo de número de onda ----
-kappa = np.loadtxt(FILE_KAPPA, dtype=float)                  # κ(ν) em 1D
-nu = np.arange(NU_START, NU_STOP + NU_STEP/2, NU_STEP)       # ν̃ [cm^-1]
-
-# alinhamento de comprimentos (caso difira por 1 amostra)
-n = min(len(nu), len(kappa))
-nu, kappa = nu[:n], kappa[:n]
+# ---- leitura da coluna de κ na malha implícita (início, passo, n) ----
+# o número de linhas é validado contra NU_STOP (erro em vez de truncar)
+esp = ler_kappa_hitran(FILE_KAPPA, NU_START, NU_STOP, NU_STEP)   # κ(ν) em 1D
 
 # ---- conversão para σ(ν) em cm²/molécula ----
-sigma = hitran_to_sigma(kappa, T_K, P_BAR, Y_ABS, UNIT)
+sigma = hitran_to_sigma(esp.valores, T_K, P_BAR, Y_ABS, UNIT)
+nu = esp.nu                                                  # ν̃ [cm^-1], só para o plot
 
 # ========================= PLOT =========================
 fig, ax1 = plt.subplots(figsize=(8, 4.5))
 
-ax1.plot(nu, sigma, color='#0072B2', lw=1.0,
-         label=f' T {int(T_K)} K, {P_BAR:g} bar ')
+plotar_decimado(ax1, nu, sigma, color='#0072B2', lw=1.0,
+                label=f' T {int(T_K)} K, {P_BAR:g} bar ')
 
 ax1.set_yscale('log')
 ax1.set_xlim(50, 10000)
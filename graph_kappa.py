@@ -1,5 +1,7 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from leitura_espectros import ler_xsec
+from decimacao import plotar_decimado
 #CODIGO PARA GERAR GRAFICO COM KAPPA
 # ================= CONFIGURAÇÕES =================
 FILE_KAPPA = r"C:"   # entrada: nu, kappa
@@ -7,13 +9,13 @@ TITLE = "Coeficiente de Absorção κ(ν̃)"
 # ==================================================
 
 # ---- leitura ----
-data = np.loadtxt(FILE_KAPPA)
+data = ler_xsec(FILE_KAPPA)
 nu = data[:, 0]       # número de onda [cm^-1]
 kappa = data[:, 1]    # coeficiente κ [cm^-1]
 
 # ---- plot ----
 plt.figure(figsize=(9, 4))
-plt.plot(nu, kappa, linewidth=1.0)
+plotar_decimado(plt.gca(), nu, kappa, linewidth=1.0)
 
 plt.yscale("log")
 plt.xlabel("Número de onda (cm⁻¹)", fontsize=12)
@@ -0,0 +1,174 @@
+# ================================================================
+# Índice de somas prefixadas para integrais de banda em O(1)
+# F(η) = ∫_{η_0}^{η} y dη' (trapézio, y linear entre amostras) é
+# gravado ao lado do cache do espectro; qualquer ∫_{η1}^{η2} y dη,
+# média de banda ou modelo de banda larga sai de F(η2) − F(η1)
+# ================================================================
+
+import argparse
+
+import numpy as np
+
+from espectro_uniforme import EspectroUniforme
+from leitura_espectros import (abrir_cache, cache_valido, ler_kappa_hitran, ler_xsec,
+                               salvar_cache)
+from reamostragem import eixo_espectro, localizar
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS_POR_BLOCO = 4096     # F = base do bloco + acumulado local (menos cancelamento)
+LARGURA_BANDA = 25.0        # largura padrão dos bins de banda larga [cm^-1]
+SUFIXO_PREFIXO = ".bandas.npy"
+SUFIXO_BASE = ".bandas_base.npy"
+# ---------------------------------------------------------------
+
+
+def somas_prefixadas(y: np.ndarray, malha, bloco: int = PONTOS_POR_BLOCO) -> tuple:
+    """
+    Integral acumulada em dois níveis:
+    local[i] = ∫ de η_{kB} até η_i (k = i // B) e base[k] = ∫ de η_0 até η_{kB}.
+    Bandas dentro de um bloco não sofrem cancelamento com a integral do espectro todo.
+    """
+    y = np.asarray(y, dtype=float)
+    n = y.size
+    nb = -(-n // bloco)
+    h = malha.passo if isinstance(malha, EspectroUniforme) else np.diff(malha)
+    trap = np.zeros(nb * bloco)
+    trap[1:n] = 0.5 * h * (y[1:] + y[:-1])           # trap[i] = ∫ de η_{i−1} a η_i
+    trap = trap.reshape(nb, bloco)
+    cruzamento = trap[1:, 0].copy()                   # segmentos entre blocos vizinhos
+    trap[:, 0] = 0.0
+    local = np.cumsum(trap, axis=1)
+    base = np.zeros(nb)
+    np.cumsum(local[:-1, -1] + cruzamento, out=base[1:])
+    return local.ravel()[:n], base
+
+
+class IndiceBandas:
+    """
+    Integrais e médias de banda de um espectro (EspectroUniforme ou (nu, y)).
+
+    Na malha uniforme (κ do HITRAN) cada consulta é aritmética, O(1); em
+    malhas quaisquer (.xsec) a posição é achada por busca binária. Todas as
+    consultas aceitam vetores de bandas.
+    """
+
+    def __init__(self, espectro, local=None, base=None, bloco: int = PONTOS_POR_BLOCO):
+        self.valores, self.malha = eixo_espectro(espectro)
+        self.bloco = bloco
+        if local is None or base is None:
+            local, base = somas_prefixadas(self.valores, self.malha, bloco)
+        self.local = local
+        self.base = base
+
+    @property
+    def nu_min(self) -> float:
+        m = self.malha
+        return m.inicio if isinstance(m, EspectroUniforme) else float(m[0])
+
+    @property
+    def nu_max(self) -> float:
+        m = self.malha
+        return m.fim if isinstance(m, EspectroUniforme) else float(m[-1])
+
+    def acumulada(self, nu) -> np.ndarray:
+        """F(ν̃) = ∫_{ν̃_0}^{ν̃} y dν̃' (ν̃ limitado à malha)."""
+        nu = np.clip(np.asarray(nu, dtype=float), self.nu_min, self.nu_max)
+        i, f, _ = localizar(self.malha, np.atleast_1d(nu))
+        F = self.base[i // self.bloco] + self.local[i] + self._parcial(i, f)
+        return F.reshape(nu.shape)
+
+    def integral(self, nu1, nu2) -> np.ndarray:
+        """∫_{ν̃1}^{ν̃2} y dν̃ (bandas além da malha são cortadas nas bordas)."""
+        nu1 = np.asarray(nu1, dtype=float)
+        nu2 = np.asarray(nu2, dtype=float)
+        n1 = np.clip(nu1, self.nu_min, self.nu_max)
+        n2 = np.clip(nu2, self.nu_min, self.nu_max)
+        i1, f1, _ = localizar(self.malha, np.atleast_1d(n1))
+        i2, f2, _ = localizar(self.malha, np.atleast_1d(n2))
+        # bases iguais (mesmo bloco) se cancelam exatamente
+        b = self.base[i2 // self.bloco] - self.base[i1 // self.bloco]
+        r = b + (self.local[i2] - self.local[i1]) + self._parcial(i2, f2) - self._parcial(i1, f1)
+        return r.reshape(np.broadcast_shapes(n1.shape, n2.shape))
+
+    def _parcial(self, i, f):
+        """∫ de η_i até η_i + f (η_{i+1} − η_i), com y linear no segmento."""
+        y = self.valores
+        h = self.malha.passo if isinstance(self.malha, EspectroUniforme) \
+            else self.malha[i + 1] - self.malha[i]
+        return h * f * (y[i] + 0.5 * f * (y[i + 1] - y[i]))
+
+    def media(self, nu1, nu2) -> np.ndarray:
+        """Média de y em [ν̃1, ν̃2] (parte dentro da malha; NaN se vazia)."""
+        n1 = np.clip(np.asarray(nu1, dtype=float), self.nu_min, self.nu_max)
+        n2 = np.clip(np.asarray(nu2, dtype=float), self.nu_min, self.nu_max)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(n2 > n1, self.integral(n1, n2) / (n2 - n1), np.nan)
+
+    def medias_em_bins(self, nu_min: float | None = None, nu_max: float | None = None,
+                       largura: float = LARGURA_BANDA) -> tuple:
+        """
+        Modelo de banda larga: médias em bins consecutivos de `largura` cm^-1.
+        Retorna (centros, médias).
+        """
+        nu_min = self.nu_min if nu_min is None else nu_min
+        nu_max = self.nu_max if nu_max is None else nu_max
+        n = int(np.floor((nu_max - nu_min) / largura + 1e-9))
+        bordas = nu_min + largura * np.arange(n + 1)
+        return 0.5 * (bordas[1:] + bordas[:-1]), self.media(bordas[:-1], bordas[1:])
+
+    __call__ = integral
+
+# ===================== ÍNDICE EM DISCO (AO LADO DO CACHE) =====================
+
+def indice_de_arquivo(arq: str, hitran: bool = False, inicio: float = 50.0,
+                      fim: float | None = 10000.0, passo: float = 0.01,
+                      usar_cache: bool = True) -> IndiceBandas:
+    """
+    Índice de bandas do arquivo `arq` (.xsec/κ de 2 colunas, ou κ do HITRAN
+    de 1 coluna com hitran=True). O índice é calculado uma vez e gravado em
+    `<arq>.bandas.npy` / `<arq>.bandas_base.npy`; as aberturas seguintes o
+    leem por np.memmap enquanto o arquivo de origem não mudar.
+    """
+    if hitran:
+        espectro = ler_kappa_hitran(arq, inicio, fim, passo, usar_cache=usar_cache)
+    else:
+        data = ler_xsec(arq, usar_cache=usar_cache)
+        espectro = (data[:, 0], data[:, 1])
+    if usar_cache and cache_valido(arq, SUFIXO_PREFIXO) and cache_valido(arq, SUFIXO_BASE):
+        local = abrir_cache(arq, SUFIXO_PREFIXO)
+        base = np.asarray(abrir_cache(arq, SUFIXO_BASE))
+        if base.size == -(-local.size // PONTOS_POR_BLOCO):
+            return IndiceBandas(espectro, local, base)
+    indice = IndiceBandas(espectro)
+    if usar_cache:
+        try:
+            salvar_cache(arq, indice.local, SUFIXO_PREFIXO)
+            salvar_cache(arq, indice.base, SUFIXO_BASE)
+        except OSError:
+            pass
+    return indice
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Médias de banda (bins de largura fixa) via índice de somas prefixadas.")
+    ap.add_argument("arquivo", help="arquivo (nu, y) ou κ do HITRAN (--hitran)")
+    ap.add_argument("--hitran", action="store_true", help="arquivo de 1 coluna na malha fixa do HITRAN")
+    ap.add_argument("--largura", type=float, default=LARGURA_BANDA, help="largura dos bins [cm^-1]")
+    ap.add_argument("--faixa", type=float, nargs=2, default=None, metavar=("NU_MIN", "NU_MAX"))
+    ap.add_argument("--saida", default=None, help="grava (centro, média) em texto")
+    args = ap.parse_args(argv)
+
+    indice = indice_de_arquivo(args.arquivo, hitran=args.hitran)
+    faixa = args.faixa or (indice.nu_min, indice.nu_max)
+    centros, medias = indice.medias_em_bins(*faixa, largura=args.largura)
+    print(f"{len(centros)} bins de {args.largura:g} cm^-1 entre {faixa[0]:g} e {faixa[1]:g} cm^-1")
+    print(f"Integral na faixa: {float(indice.integral(*faixa)):.6e}")
+    if args.saida:
+        np.savetxt(args.saida, np.column_stack([centros, medias]),
+                   header="nu_centro(cm^-1)    media", fmt="%.8e")
+        print(f"Médias salvas em: {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# ================================================================
+# σ(ν̃, T) e κ(ν̃, T, p, Y) em qualquer T entre as tabelas disponíveis
+# ln σ(T) = (1 − w) ln σ(T_0) + w ln σ(T_1),  w = (1/T − 1/T_0)/(1/T_1 − 1/T_0)
+# Os espectros vizinhos (já em ln σ) ficam num cache LRU e os pesos
+# de cada T são reaproveitados: varreduras em T não voltam ao disco
+# ================================================================
+
+import argparse
+import glob
+import os
+from functools import lru_cache
+
+import numpy as np
+
+from conversao_kappa_ceta import number_density
+from cubo_espectral import CuboEspectral, temperatura_do_nome
+from leitura_espectros import ler_xsec
+from reamostragem import reamostrar
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+ESPECTROS_EM_CACHE = 4        # tabelas (ln σ) mantidas em memória
+SIGMA_MIN = 1e-300            # piso de σ antes do log (σ = 0 → ~0 após exp)
+CABECALHO_SIGMA = "nu(cm^-1)    sigma(cm^2/molecule)"
+CABECALHO_KAPPA = "nu(cm^-1)    kappa(cm^-1)"
+FORMATO = "%.8e"
+# ---------------------------------------------------------------
+
+
+class InterpoladorTemperatura:
+    """
+    Interpolação em temperatura entre espectros tabelados.
+
+    fonte : {T [K]: arquivo (nu, sigma)} ou CuboEspectral (cubo_espectral.py).
+    Os espectros são postos na malha ν̃ da primeira tabela; tabelas com
+    outra malha são reamostradas (interpolação linear) na primeira carga.
+    """
+
+    def __init__(self, fonte, espectros_em_cache: int = ESPECTROS_EM_CACHE):
+        if isinstance(fonte, CuboEspectral):
+            self._cubo, self._arquivos = fonte, None
+            self.temperaturas = np.asarray(fonte.temperaturas, dtype=float)
+            self.nu = np.asarray(fonte.nu)
+        else:
+            if not fonte:
+                raise ValueError("Nenhuma tabela de temperatura fornecida.")
+            self._cubo, self._arquivos = None, {float(T): a for T, a in fonte.items()}
+            self.temperaturas = np.array(sorted(self._arquivos), dtype=float)
+            self.nu = np.array(ler_xsec(self._arquivos[self.temperaturas[0]])[:, 0])
+        self._inv_T = 1.0 / self.temperaturas
+        self._ln_sigma = lru_cache(maxsize=espectros_em_cache)(self._ln_sigma_sem_cache)
+        self.pesos = lru_cache(maxsize=1024)(self._pesos_sem_cache)
+
+    @classmethod
+    def de_diretorio(cls, diretorio: str, padrao: str = "*.xsec", **kw) -> "InterpoladorTemperatura":
+        """Tabelas de um diretório, com a temperatura no nome (ex.: ..._1200K.xsec)."""
+        arquivos = glob.glob(os.path.join(diretorio, padrao))
+        if not arquivos:
+            raise FileNotFoundError(f"Nenhum arquivo '{padrao}' em {diretorio}")
+        return cls({temperatura_do_nome(a): a for a in arquivos}, **kw)
+
+    # ---------------------- tabelas e pesos ----------------------
+
+    def _ln_sigma_sem_cache(self, i: int) -> np.ndarray:
+        T = self.temperaturas[i]
+        if self._cubo is not None:
+            sigma = self._cubo.espectro(T)
+        else:
+            data = ler_xsec(self._arquivos[T])
+            if data.shape[0] == self.nu.size and np.array_equal(data[:, 0], self.nu):
+                sigma = data[:, 1]
+            else:
+                sigma = reamostrar((data[:, 0], data[:, 1]), self.nu, "linear", preencher=0.0)
+        return np.log(np.maximum(sigma, SIGMA_MIN))
+
+    def _pesos_sem_cache(self, T: float) -> tuple:
+        """(i0, i1, w) das tabelas vizinhas de T, com w linear em 1/T."""
+        Ts = self.temperaturas
+        if not Ts[0] <= T <= Ts[-1]:
+            raise ValueError(f"T = {T:g} K fora do intervalo tabelado "
+                             f"[{Ts[0]:g}, {Ts[-1]:g}] K.")
+        i1 = int(np.searchsorted(Ts, T, side="left"))
+        if Ts[i1] == T:
+            return i1, i1, 0.0
+        i0 = i1 - 1
+        w = (1.0 / T - self._inv_T[i0]) / (self._inv_T[i1] - self._inv_T[i0])
+        return i0, i1, float(w)
+
+    # ---------------------- consultas ----------------------
+
+    def sigma(self, T: float, out: np.ndarray | None = None) -> np.ndarray:
+        """σ(ν̃, T) [cm²/molécula] na malha self.nu."""
+        i0, i1, w = self.pesos(float(T))
+        if out is None:
+            out = np.empty(self.nu.size)
+        if i0 == i1:
+            np.exp(self._ln_sigma(i0), out=out)
+        else:
+            np.multiply(self._ln_sigma(i0), 1.0 - w, out=out)
+            out += w * self._ln_sigma(i1)
+            np.exp(out, out=out)
+        out[out < 2.0 * SIGMA_MIN] = 0.0     # σ nulo nas duas tabelas volta a 0
+        return out
+
+    def kappa(self, T: float, p_bar: float, Y: float, out: np.ndarray | None = None) -> np.ndarray:
+        """κ(ν̃, T, p, Y) = N(T, p) · Y · σ(ν̃, T) [cm⁻¹]."""
+        out = self.sigma(T, out)
+        out *= number_density(p_bar, T) * Y
+        return out
+
+    def varrer(self, temperaturas, p_bar: float | None = None, Y: float = 1.0):
+        """
+        Gera (T, espectro) para cada T (σ, ou κ se p_bar for dado), em ordem
+        crescente de T para aproveitar as tabelas vizinhas já carregadas.
+        O vetor devolvido é reutilizado a cada passo (copie se for guardar).
+        """
+        buf = np.empty(self.nu.size)
+        for T in sorted(float(t) for t in np.atleast_1d(temperaturas)):
+            if p_bar is None:
+                yield T, self.sigma(T, buf)
+            else:
+                yield T, self.kappa(T, p_bar, Y, buf)
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="σ/κ interpolados em temperatura entre tabelas.")
+    ap.add_argument("diretorio", help="diretório com um arquivo por temperatura (T no nome, ex.: 1200K)")
+    ap.add_argument("--padrao", default="*.xsec", help="padrão glob dos arquivos")
+    ap.add_argument("--T", type=float, nargs="+", required=True, help="temperaturas pedidas [K]")
+    ap.add_argument("--P", type=float, default=None, help="pressão [bar] (com --P a saída é κ)")
+    ap.add_argument("--Y", type=float, default=1.0, help="fração molar do absorvedor")
+    ap.add_argument("--saida", default="interp_{T:g}K.txt",
+                    help="modelo do nome de saída (campo {T})")
+    args = ap.parse_args(argv)
+
+    interp = InterpoladorTemperatura.de_diretorio(args.diretorio, args.padrao)
+    print(f"Tabelas [K]: {interp.temperaturas.tolist()}  |  pontos de ν̃: {interp.nu.size}")
+    cabecalho = CABECALHO_SIGMA if args.P is None else CABECALHO_KAPPA
+    for T, y in interp.varrer(args.T, args.P, args.Y):
+        arq = args.saida.format(T=T)
+        np.savetxt(arq, np.column_stack([interp.nu, y]), header=cabecalho, fmt=FORMATO)
+        i0, i1, w = interp.pesos(T)
+        print(f"T = {T:g} K  ({interp.temperaturas[i0]:g} K / {interp.temperaturas[i1]:g} K, "
+              f"w = {w:.4f}) → {arq}")
+
+
+if __name__ == "__main__":
+    main()
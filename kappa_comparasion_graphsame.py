@@ -1,5 +1,9 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from leitura_espectros import ler_xsec, ler_kappa_hitran
+from decimacao import plotar_decimado
+from reamostragem import reamostrar, metricas_comparacao, imprimir_metricas
+from indice_bandas import IndiceBandas
 
 # ===================== ARQUIVOS =====================
 FILE_KAPPA_HIT = r'D:'
@@ -8,19 +12,40 @@ FILE_KAPPA_EXO = r'C:'
 # ===================== MALHA DO HITRAN =====================
 NU_START, NU_STOP, NU_STEP = 50.0, 10000.0, 0.01
 
-# ===================== LEITURA HITRAN =====================
-kappa_hit = np.loadtxt(FILE_KAPPA_HIT)
-nu_hit = np.arange(NU_START, NU_STOP + NU_STEP/2, NU_STEP)
+# Comparação ponto a ponto (ExoMol reamostrado na malha do HITRAN)
+MOSTRAR_METRICAS = True
+METODO_REAMOSTRAGEM = "media"   # "media" (conserva a integral) ou "linear"
+
+# κ médio por banda [cm^-1]: (início, fim)
+BANDAS = {
+    "ν2 (950 cm^-1)": (750.0, 1200.0),
+    "estiramentos (3300 cm^-1)": (3100.0, 3600.0),
+}
 
-n = min(len(kappa_hit), len(nu_hit))
-kappa_hit = kappa_hit[:n]
-nu_hit = nu_hit[:n]
+# ===================== LEITURA HITRAN =====================
+esp_hit = ler_kappa_hitran(FILE_KAPPA_HIT, NU_START, NU_STOP, NU_STEP)
+kappa_hit = esp_hit.valores
+nu_hit = esp_hit.nu
 
 # ===================== LEITURA EXOMOL =====================
-data_exo = np.loadtxt(FILE_KAPPA_EXO)
+data_exo = ler_xsec(FILE_KAPPA_EXO)
 nu_exo = data_exo[:, 0]
 kappa_exo = data_exo[:, 1]
 
+# ===================== COMPARAÇÃO NA MALHA COMUM =====================
+if MOSTRAR_METRICAS:
+    kappa_exo_hit = reamostrar((nu_exo, kappa_exo), esp_hit, METODO_REAMOSTRAGEM)
+    imprimir_metricas(metricas_comparacao(kappa_exo_hit, kappa_hit, nu_hit),
+                      "ExoMol × HITRAN (malha do HITRAN)")
+
+if BANDAS:
+    ini, fim = np.array(list(BANDAS.values())).T
+    media_hit = IndiceBandas(esp_hit).media(ini, fim)
+    media_exo = IndiceBandas((nu_exo, kappa_exo)).media(ini, fim)
+    print(f"\n{'banda':>26} | {'κ HITRAN':>12} | {'κ ExoMol':>12} | {'razão':>7}")
+    for nome, kh, ke in zip(BANDAS, media_hit, media_exo):
+        print(f"{nome:>26} | {kh:12.4e} | {ke:12.4e} | {ke / kh:7.3f}")
+
 mask = (nu_exo >= NU_START) & (nu_exo <= NU_STOP)
 nu_exo = nu_exo[mask]
 kappa_exo = kappa_exo[mask]
@@ -31,7 +56,7 @@ fig = plt.figure(figsize=(9, 6))
 
 # HITRAN (em cima)
 ax_top = fig.add_subplot(2, 1, 1)
-ax_top.plot(nu_hit, kappa_hit, color='purple', lw=0.7)
+plotar_decimado(ax_top, nu_hit, kappa_hit, color='purple', lw=0.7)
 ax_top.set_ylabel(r'$\kappa_{\rm HITRAN}$ (cm$^{-1}$)', fontsize=12)
 ax_top.set_xlim(NU_START, NU_STOP)
 ax_top.grid(True, linestyle='--', linewidth=0.4, alpha=0.4)
@@ -39,7 +64,7 @@ ax_top.tick_params(axis='x', labelbottom=False)
 
 # ExoMol (em baixo)
 ax_bottom = fig.add_subplot(2, 1, 2, sharex=ax_top)
-ax_bottom.plot(nu_exo, kappa_exo, color='red', lw=0.7)
+plotar_decimado(ax_bottom, nu_exo, kappa_exo, color='red', lw=0.7)
 ax_bottom.set_xlabel(r'Wavenumber, $\eta$ (cm$^{-1}$)', fontsize=12)
 ax_bottom.set_ylabel(r'$\kappa_{\rm ExoMol}$ (cm$^{-1}$)', fontsize=12)
 ax_bottom.grid(True, linestyle='--', linewidth=0.4, alpha=0.4)
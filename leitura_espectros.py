@@ -0,0 +1,398 @@
+# ================================================================
+# Leitura de espectros ExoMol (.xsec) com cache binário
+# 1ª leitura: texto → arquivo .npy ao lado do original
+# Leituras seguintes: abre o .npy via np.memmap (sem cópia)
+# O cache é invalidado quando o tamanho ou o mtime do .xsec mudam
+# O texto é lido por um conversor vetorizado de largura fixa (formato
+# dos .xsec e dos arquivos gravados com np.savetxt), com retorno ao
+# leitor C do pandas (ou np.loadtxt) para qualquer outro layout
+# ================================================================
+
+import io
+import json
+import os
+
+import numpy as np
+
+from espectro_uniforme import EspectroUniforme
+
+try:
+    import pandas as pd
+except ImportError:  # pandas é opcional: sem ele o retorno é np.loadtxt
+    pd = None
+
+# Sufixos dos arquivos auxiliares gravados ao lado do arquivo de origem
+SUFIXO_CACHE = ".cache.npy"
+SUFIXO_META = ".cache.json"
+
+
+def chave_arquivo(arq: str) -> dict:
+    """Retorna a chave de validade do cache (tamanho em bytes e mtime em ns)."""
+    st = os.stat(arq)
+    return {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def caminho_cache(arq: str, sufixo: str = SUFIXO_CACHE) -> str:
+    """Caminho do arquivo auxiliar (cache) associado a `arq`."""
+    return os.fspath(arq) + sufixo
+
+
+def cache_valido(arq: str, sufixo: str = SUFIXO_CACHE) -> bool:
+    """True se o cache existe e foi gerado a partir da versão atual de `arq`."""
+    arq_cache = caminho_cache(arq, sufixo)
+    arq_meta = caminho_cache(arq, SUFIXO_META)
+    if not (os.path.exists(arq_cache) and os.path.exists(arq_meta)):
+        return False
+    try:
+        with open(arq_meta, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return meta.get(sufixo) == chave_arquivo(arq)
+
+
+def _temporario(arq: str) -> str:
+    """Nome temporário por processo (escritores concorrentes do mesmo cache não se atropelam)."""
+    return f"{arq}.tmp{os.getpid()}"
+
+
+def _registrar_meta(arq: str, sufixo: str) -> None:
+    """Grava no .cache.json a chave de `arq` para o cache de sufixo dado."""
+    arq_meta = caminho_cache(arq, SUFIXO_META)
+    meta = {}
+    if os.path.exists(arq_meta):
+        try:
+            with open(arq_meta, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            meta = {}
+    meta[sufixo] = chave_arquivo(arq)
+    tmp = _temporario(arq_meta)
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    os.replace(tmp, arq_meta)
+
+
+def salvar_cache(arq: str, dados: np.ndarray, sufixo: str = SUFIXO_CACHE) -> str:
+    """
+    Grava `dados` como .npy ao lado de `arq` (escrita atômica) e registra
+    a chave (tamanho, mtime) do arquivo de origem.
+    """
+    arq_cache = caminho_cache(arq, sufixo)
+    tmp = _temporario(arq_cache)
+    with open(tmp, "wb") as f:
+        np.save(f, dados)
+    os.replace(tmp, arq_cache)
+    _registrar_meta(arq, sufixo)
+    return arq_cache
+
+
+def salvar_cache_em_blocos(arq: str, forma: tuple, preencher, sufixo: str,
+                           dtype=np.float64) -> str:
+    """
+    Como salvar_cache, para dados gerados em blocos (maiores que a RAM): o .npy
+    é criado com np.lib.format.open_memmap e `preencher(destino)` o escreve.
+    """
+    arq_cache = caminho_cache(arq, sufixo)
+    tmp = _temporario(arq_cache)
+    destino = np.lib.format.open_memmap(tmp, mode="w+", dtype=dtype, shape=forma)
+    try:
+        preencher(destino)
+        destino.flush()
+    finally:
+        del destino               # fecha o mapeamento antes do os.replace (Windows)
+    os.replace(tmp, arq_cache)
+    _registrar_meta(arq, sufixo)
+    return arq_cache
+
+
+def abrir_cache(arq: str, sufixo: str = SUFIXO_CACHE) -> np.ndarray:
+    """Abre o cache de `arq` como np.memmap somente leitura."""
+    return np.load(caminho_cache(arq, sufixo), mmap_mode="r")
+
+
+# ===================== LEITOR RÁPIDO DE TEXTO NUMÉRICO =====================
+
+LINHAS_POR_BLOCO = 65_536   # linhas convertidas por vez (blocos cabem no cache da CPU)
+
+# Classes de caractere (bits) usadas pelo conversor de largura fixa
+_ESPACO, _DIGITO, _PONTO, _EXPOENTE, _SINAL, _OUTRO = (1 << i for i in range(6))
+_CLASSE = np.full(256, _OUTRO, dtype=np.uint8)
+_CLASSE[[ord(" "), ord("\t"), ord("\r")]] = _ESPACO
+_CLASSE[ord("0"):ord("9") + 1] = _DIGITO
+_CLASSE[ord(".")] = _PONTO
+_CLASSE[[ord("e"), ord("E")]] = _EXPOENTE
+_CLASSE[[ord("+"), ord("-")]] = _SINAL
+# em colunas mistas (ex.: espaço + dígito) só o espaço simples é aceito
+_CLASSE_MISTA = _CLASSE.copy()
+_CLASSE_MISTA[[ord("\t"), ord("\r")]] = _OUTRO
+
+_POT10 = 10.0 ** np.arange(309)   # exatos até 10**22
+
+
+def _classes(col: np.ndarray) -> list:
+    """Bits das classes de caractere presentes em cada coluna de texto (linhas de `col`)."""
+    mn, mx = col.min(axis=1), col.max(axis=1)
+    classes = []
+    for j in range(len(col)):
+        a, b = int(mn[j]), int(mx[j])
+        if a == b:
+            classes.append(int(_CLASSE[a]))
+        elif 48 <= a and b <= 57:
+            classes.append(_DIGITO)
+        else:
+            classes.append(int(np.bitwise_or.reduce(_CLASSE_MISTA[col[j]])))
+    return classes
+
+
+def _campos(classes: list) -> list:
+    """Intervalos de colunas (ini, fim) separados por colunas sempre em branco."""
+    campos, ini = [], None
+    for j, m in enumerate(classes):
+        if m == _ESPACO:
+            if ini is not None:
+                campos.append((ini, j))
+                ini = None
+        elif ini is None:
+            ini = j
+    if ini is not None:
+        campos.append((ini, len(classes)))
+    return campos
+
+
+def _inteiro(col: np.ndarray, colunas: list, classes: list) -> np.ndarray:
+    """Inteiro formado pelos dígitos das `colunas` (espaço à esquerda = 0), em float64."""
+    exato = len(colunas) <= 15   # abaixo de 2**53 a soma em float64 é exata
+    v = np.zeros(col.shape[1], dtype=np.float64 if exato else np.int64)
+    for c in colunas:
+        d = col[c]
+        if classes[c] & _ESPACO:
+            d = np.where(d == 32, np.uint8(48), d)
+        v *= 10
+        v += d
+        v -= 48
+    return v if exato else v.astype(np.float64)
+
+
+def _converter_campo(col: np.ndarray, classes: list, ini: int, fim: int):
+    """
+    Converte as colunas de texto ini:fim (um número por linha, na mesma
+    posição em todas as linhas) em float64. Retorna None se o layout não
+    for [sinal] dígitos [. dígitos] [e sinal dígitos].
+    """
+    m, k, j = classes[ini:fim], fim - ini, 0
+
+    col_sinal = None
+    if j < k and m[j] & _SINAL and not m[j] & ~(_SINAL | _ESPACO):
+        col_sinal, j = ini + j, j + 1
+    col_int = []
+    while j < k and m[j] & _DIGITO and not m[j] & ~(_DIGITO | _ESPACO):
+        col_int.append(ini + j)
+        j += 1
+    col_frac = []
+    if j < k and m[j] == _PONTO:
+        j += 1
+        while j < k and m[j] == _DIGITO:
+            col_frac.append(ini + j)
+            j += 1
+    col_exp_sinal, col_exp = None, []
+    if j < k and m[j] == _EXPOENTE:
+        j += 1
+        if j < k and m[j] == _SINAL:
+            col_exp_sinal, j = ini + j, j + 1
+        while j < k and m[j] == _DIGITO:
+            col_exp.append(ini + j)
+            j += 1
+        if not col_exp:
+            return None
+    n_dig = len(col_int) + len(col_frac)
+    if j != k or n_dig == 0 or n_dig > 18:
+        return None
+
+    # espaços só são aceitos à esquerda da parte inteira ("   50.000000")
+    mistas = [c for c in col_int if classes[c] & _ESPACO]
+    if mistas:
+        if mistas[-1] == col_int[-1]:
+            return None
+        branco = col[mistas] == 32
+        if (branco[1:] & ~branco[:-1]).any():
+            return None
+
+    # mantissa inteira exata e expoente decimal de cada linha
+    mant = _inteiro(col, col_int + col_frac, classes)
+    expo = _inteiro(col, col_exp, classes) if col_exp else np.zeros(col.shape[1])
+    if col_exp_sinal is not None:
+        expo[col[col_exp_sinal] == ord("-")] *= -1.0
+    expo -= len(col_frac)
+    if np.abs(expo).max(initial=0) > 308:
+        return None
+
+    # divisão por 10**|e| (exata até e = 22): arredondamento correto nesse caso
+    e = np.abs(expo).astype(np.intp)
+    v = np.where(expo < 0, mant / _POT10[e], mant * _POT10[e])
+    if col_sinal is not None:
+        v[col[col_sinal] == ord("-")] *= -1.0
+    return v
+
+
+def _ler_largura_fixa(buf: np.ndarray, comprimento: int):
+    """
+    Converte um bloco de linhas de mesmo comprimento (incluindo o '\\n') numa
+    matriz (n, n_colunas). Retorna None se o bloco não tiver esse formato.
+    """
+    L = comprimento
+    if L < 2 or buf.size % L or not np.all(buf[L - 1::L] == 10):
+        return None
+    # transposta: cada coluna de caracteres vira um vetor contíguo
+    col = np.ascontiguousarray(buf.reshape(-1, L)[:, :L - 1].T)
+    classes = _classes(col)
+    if any(m & _OUTRO for m in classes):
+        return None
+    campos = _campos(classes)
+    if not campos:
+        return None
+    out = np.empty((col.shape[1], len(campos)), order="F")
+    for i, (a, b) in enumerate(campos):
+        v = _converter_campo(col, classes, a, b)
+        if v is None:
+            return None
+        out[:, i] = v
+    return out
+
+
+def _ler_geral(fonte) -> np.ndarray:
+    """Leitor genérico (qualquer espaçamento): C do pandas, ou np.loadtxt."""
+    if pd is not None:
+        try:
+            dados = pd.read_csv(fonte, sep=r"\s+", header=None, comment="#",
+                                dtype=np.float64, engine="c",
+                                float_precision="round_trip").to_numpy()
+        except pd.errors.EmptyDataError:
+            return np.empty((0, 1))
+        # o pandas completa linhas curtas com NaN: o np.loadtxt decide se são
+        # "nan" escritos no arquivo ou linhas incompletas (ValueError)
+        if not np.isnan(dados).any():
+            return dados
+        if hasattr(fonte, "seek"):
+            fonte.seek(0)
+    return np.loadtxt(fonte, dtype=float, ndmin=2)
+
+
+def _inicio_dados(buf: np.ndarray) -> int:
+    """Posição do primeiro byte após as linhas de cabeçalho ('#') ou vazias."""
+    pos = 0
+    while pos < buf.size:
+        fim = bytes(buf[pos:pos + 4096]).find(b"\n")
+        linha = bytes(buf[pos:pos + (fim if fim >= 0 else 4096)]).strip()
+        if linha and not linha.startswith(b"#"):
+            return pos
+        if fim < 0:
+            return buf.size
+        pos += fim + 1
+    return pos
+
+
+def ler_texto(texto: bytes) -> np.ndarray:
+    """Converte um bloco de texto numérico (bytes, linhas completas) em matriz (n, n_colunas)."""
+    buf = np.frombuffer(texto, dtype=np.uint8)
+    ini = _inicio_dados(buf)
+    buf = buf[ini:]
+    fim = bytes(buf[:4096]).find(b"\n")
+    if fim > 0:
+        dados = _ler_largura_fixa(buf, fim + 1)
+        if dados is not None:
+            return dados
+    return _ler_geral(io.BytesIO(texto))
+
+
+def ler_colunas(arq: str, linhas_por_bloco: int = LINHAS_POR_BLOCO) -> np.ndarray:
+    """
+    Lê um arquivo texto de colunas numéricas → matriz (n, n_colunas), ordem Fortran.
+
+    Arquivos de largura fixa (caso dos .xsec e dos κ do HITRAN) são
+    convertidos direto dos bytes (np.memmap), em blocos de linhas, com
+    operações vetorizadas; o resultado difere do np.loadtxt em no máximo
+    ~1 ulp quando o expoente decimal passa de 22. Outros formatos usam o
+    leitor C do pandas (ou np.loadtxt, se o pandas não estiver instalado).
+    """
+    if os.path.getsize(arq) == 0:
+        return _ler_geral(arq)
+    buf = np.memmap(arq, dtype=np.uint8, mode="r")
+    ini = _inicio_dados(buf)
+    fim = bytes(buf[ini:ini + 4096]).find(b"\n")
+    if fim <= 0:
+        return _ler_geral(arq)
+    L = fim + 1
+    n, resto = divmod(buf.size - ini, L)
+    if resto == L - 1 and buf[-1] != 10:   # última linha sem '\n'
+        n += 1
+    elif resto:
+        return _ler_geral(arq)
+
+    out = None
+    for r0 in range(0, n, linhas_por_bloco):
+        r1 = min(n, r0 + linhas_por_bloco)
+        bloco = np.asarray(buf[ini + r0 * L: ini + r1 * L])
+        if bloco.size < (r1 - r0) * L:
+            bloco = np.append(bloco, np.uint8(10))
+        v = _ler_largura_fixa(bloco, L)
+        if v is None or (out is not None and v.shape[1] != out.shape[1]):
+            return _ler_geral(arq)
+        if out is None:
+            out = np.empty((n, v.shape[1]), order="F")
+        out[r0:r1] = v
+    return out
+
+# ===================== LEITURA DO ARQUIVO XSEC =====================
+
+def ler_xsec(arq: str, usar_cache: bool = True) -> np.ndarray:
+    """
+    Lê um arquivo de duas colunas (nu [cm^-1], sigma ou kappa).
+
+    Retorna uma matriz (n, 2). Com `usar_cache=True`, a primeira leitura
+    converte o texto para `<arq>.cache.npy` (colunas contíguas, ordem
+    Fortran); as seguintes abrem esse arquivo por np.memmap, sem cópia.
+    Se o diretório não permitir escrita, devolve os dados em memória.
+    """
+    # Espera-se: coluna 0 = nu [cm^-1], coluna 1 = sigma [cm²/molécula]
+    return _ler_com_cache(arq, ndmin=2, usar_cache=usar_cache)
+
+
+def _ler_com_cache(arq: str, ndmin: int, usar_cache: bool) -> np.ndarray:
+    """Lê o texto de `arq` (ou o cache .npy válido) com ler_colunas."""
+    if usar_cache and cache_valido(arq):
+        dados = abrir_cache(arq)
+        # o mesmo sufixo serve aos dois leitores: cache 1D (HITRAN) × 2D (xsec) → relê o texto
+        if dados.ndim == ndmin:
+            return dados
+
+    dados = np.asfortranarray(ler_colunas(arq))
+    if ndmin == 1:
+        if dados.shape[1] != 1:
+            raise ValueError(f"{arq}: esperada 1 coluna, encontradas {dados.shape[1]}.")
+        dados = dados[:, 0]
+    if not usar_cache:
+        return dados
+
+    try:
+        salvar_cache(arq, dados)
+    except OSError:
+        return dados
+    return abrir_cache(arq)
+
+
+# ===================== LEITURA DO κ DO HITRAN =====================
+
+def ler_kappa_hitran(arq: str, inicio: float = 50.0, fim: float | None = 10000.0,
+                     passo: float = 0.01, usar_cache: bool = True) -> EspectroUniforme:
+    """
+    Lê um arquivo de 1 coluna (κ do HITRAN na malha fixa inicio:passo:fim).
+
+    Retorna um EspectroUniforme (sem eixo ν̃ materializado). Se o número
+    de linhas não corresponder à malha, levanta ValueError; com fim=None
+    o fim da malha é deduzido do número de linhas.
+    """
+    kappa = _ler_com_cache(arq, ndmin=1, usar_cache=usar_cache)
+    if fim is None:
+        return EspectroUniforme(kappa, inicio, passo)
+    return EspectroUniforme.de_malha(kappa, inicio, fim, passo)
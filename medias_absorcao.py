@@ -0,0 +1,190 @@
+# ================================================================
+# Coeficientes médios de Planck e de Rosseland a partir de κ(η)
+# κ_P(T)     = ∫ κ_η E_bη dη / (σ T⁴)
+# 1/κ_R(T)   = ∫ (1/κ_η) ∂E_bη/∂T dη / (4 σ T³)
+# Os pesos (trapézio × E_bη e × ∂E_bη/∂T) da malha η comum são
+# calculados uma única vez e reutilizados para todos os espectros
+# ================================================================
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+from emitancia_lbl import C2, SIGMA_SB, pesos_trapezio, poder_emissivo_espectral
+from leitura_espectros import ler_colunas, ler_xsec
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+T_TABELA = np.arange(300.0, 1201.0, 100.0)   # temperaturas da tabela [K]
+CABECALHO = "T(K)    kappa_P(cm^-1)    kappa_R(cm^-1)"
+FORMATO = "%.8e"
+# ---------------------------------------------------------------
+
+
+def derivada_poder_emissivo(eta: np.ndarray, T) -> np.ndarray:
+    """
+    ∂E_bη/∂T [W/(m²·cm⁻¹·K)] = E_bη · x eˣ / ((eˣ − 1) T), x = C2 η / T.
+    Mesmas convenções de forma de poder_emissivo_espectral.
+    """
+    eta = np.asarray(eta, dtype=float)
+    T = np.asarray(T, dtype=float)
+    Tb = T[..., None] if T.ndim else T
+    x = C2 * eta / Tb
+    # eˣ/(eˣ − 1) = 1/(1 − e^{−x}) não transborda para x grande
+    return poder_emissivo_espectral(eta, T) * x / (-np.expm1(-x) * Tb)
+
+# ===================== PESOS PRÉ-CALCULADOS =====================
+
+class PesosMedias:
+    """
+    Pesos de quadratura das médias de Planck e de Rosseland para uma malha η
+    e um conjunto de temperaturas, já normalizados por σT⁴ e 4σT³.
+
+    eta : (n_η,) número de onda [cm⁻¹], comum aos espectros
+    T   : (n_T,) temperaturas [K]
+    Ocupa 2 × n_T × n_η float64 (ex.: 10 T × 1e6 pontos → 160 MB).
+    """
+
+    def __init__(self, eta, T):
+        self.eta = np.asarray(eta, dtype=float)
+        self.T = np.atleast_1d(np.asarray(T, dtype=float))
+        w = pesos_trapezio(self.eta)
+        self.planck = w * poder_emissivo_espectral(self.eta, self.T)
+        self.planck /= (SIGMA_SB * self.T**4)[:, None]
+        self.rosseland = w * derivada_poder_emissivo(self.eta, self.T)
+        self.rosseland /= (4.0 * SIGMA_SB * self.T**3)[:, None]
+
+    def fracao_coberta(self) -> np.ndarray:
+        """Fração de σT⁴ (Planck) contida na malha η, por temperatura."""
+        return self.planck.sum(axis=1)
+
+    def medias(self, kappa) -> tuple:
+        """
+        Médias (κ_P, κ_R) [mesma unidade de κ].
+
+        kappa (n_η,)      → o mesmo espectro ponderado em todas as T (n_T,);
+        kappa (n_T, n_η)  → cada espectro ponderado na sua própria T (n_T,).
+        Pontos com κ = 0 levam κ_R a 0 (janela transparente).
+        """
+        kappa = np.asarray(kappa, dtype=float)
+        with np.errstate(divide="ignore"):
+            inverso = 1.0 / kappa
+        if kappa.ndim == 1:
+            if kappa.size != self.eta.size:
+                raise ValueError(f"kappa deve ter {self.eta.size} pontos; recebido {kappa.size}.")
+            kP = self.planck @ kappa
+            soma_R = self.rosseland @ inverso
+        else:
+            if kappa.shape != self.planck.shape:
+                raise ValueError(f"kappa deve ter forma {self.planck.shape}; recebido {kappa.shape}.")
+            kP = np.einsum("tn,tn->t", self.planck, kappa)
+            soma_R = np.einsum("tn,tn->t", self.rosseland, inverso)
+        with np.errstate(divide="ignore"):
+            kR = 1.0 / soma_R
+        return kP, kR
+
+# ===================== TABELA E CONSULTA =====================
+
+@dataclass
+class TabelaMedias:
+    """
+    Tabela κ_P(T), κ_R(T) com consulta interpolada (linear em ln κ; linear em κ
+    nos intervalos com κ = 0 num extremo, ex.: κ_R com janela transparente).
+    """
+    T: np.ndarray
+    kappa_P: np.ndarray
+    kappa_R: np.ndarray
+
+    @staticmethod
+    def _interp(T, Ttab, valores):
+        valores = np.asarray(valores, dtype=float)
+        positivos = valores > 0
+        ln = np.exp(np.interp(T, Ttab, np.log(np.where(positivos, valores, 1.0))))
+        if positivos.all():
+            return ln
+        # ln 0 = −∞ daria NaN entre duas entradas nulas: nesses intervalos, interpolação linear
+        i = np.clip(np.searchsorted(Ttab, T, side="right"), 1, len(Ttab) - 1)
+        return np.where(positivos[i - 1] & positivos[i], ln, np.interp(T, Ttab, valores))
+
+    def planck(self, T) -> np.ndarray:
+        """κ_P interpolado em T (fora da tabela: valor da extremidade)."""
+        return self._interp(T, self.T, self.kappa_P)
+
+    def rosseland(self, T) -> np.ndarray:
+        """κ_R interpolado em T (fora da tabela: valor da extremidade)."""
+        return self._interp(T, self.T, self.kappa_R)
+
+    def salvar(self, arq: str) -> None:
+        np.savetxt(arq, np.column_stack([self.T, self.kappa_P, self.kappa_R]),
+                   header=CABECALHO, fmt=FORMATO)
+
+    @classmethod
+    def carregar(cls, arq: str) -> "TabelaMedias":
+        d = ler_colunas(arq)
+        return cls(d[:, 0], d[:, 1], d[:, 2])
+
+
+def tabela_de_espectros(eta, kappa, T) -> TabelaMedias:
+    """
+    Tabela a partir de espectros numa malha comum.
+    kappa (n_T, n_η): um espectro por temperatura; (n_η,): um único espectro.
+    """
+    T = np.atleast_1d(np.asarray(T, dtype=float))
+    ordem = np.argsort(T)
+    kappa = np.asarray(kappa)
+    if kappa.ndim == 2:
+        kappa = kappa[ordem]
+    kP, kR = PesosMedias(eta, T[ordem]).medias(kappa)
+    return TabelaMedias(T[ordem], kP, kR)
+
+
+def tabela_de_arquivos(arquivos: dict) -> TabelaMedias:
+    """
+    Tabela a partir de arquivos κ (nu, kappa) de conversao_kappa_ceta.py.
+    arquivos : {T [K]: caminho}. Com malha comum, os pesos são calculados
+    uma vez para todas as temperaturas.
+    """
+    T = np.array(sorted(arquivos), dtype=float)
+    dados = [ler_xsec(arquivos[t]) for t in sorted(arquivos)]
+    eta0 = dados[0][:, 0]
+    if all(d.shape == dados[0].shape and np.array_equal(d[:, 0], eta0) for d in dados):
+        return tabela_de_espectros(eta0, np.stack([d[:, 1] for d in dados]), T)
+    medias = [PesosMedias(d[:, 0], t).medias(d[:, 1]) for t, d in zip(T, dados)]
+    kP, kR = (np.concatenate(m) for m in zip(*medias))
+    return TabelaMedias(T, kP, kR)
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Médias de Planck e de Rosseland a partir de arquivos κ(η).")
+    ap.add_argument("espectros", nargs="+", metavar="ARQUIVO",
+                    help="T=ARQUIVO (um espectro por temperatura) ou um único ARQUIVO "
+                         "ponderado nas temperaturas de --T")
+    ap.add_argument("--T", type=float, nargs="+", default=T_TABELA,
+                    help="temperaturas [K] (com um único arquivo sem T=)")
+    ap.add_argument("--saida", default=None, help="grava a tabela em texto")
+    args = ap.parse_args(argv)
+
+    if len(args.espectros) == 1 and "=" not in args.espectros[0]:
+        data = ler_xsec(args.espectros[0])
+        tabela = tabela_de_espectros(data[:, 0], data[:, 1], args.T)
+    else:
+        arquivos = {}
+        for item in args.espectros:
+            t, _, arq = item.partition("=")
+            if not arq:
+                ap.error(f"use T=ARQUIVO (recebido '{item}').")
+            arquivos[float(t)] = arq
+        tabela = tabela_de_arquivos(arquivos)
+
+    print(f"{'T [K]':>6} | {'κ_P [cm^-1]':>14} | {'κ_R [cm^-1]':>14}")
+    print("-" * 40)
+    for Ti, kP, kR in zip(tabela.T, tabela.kappa_P, tabela.kappa_R):
+        print(f"{Ti:6.0f} | {kP:14.6e} | {kR:14.6e}")
+    if args.saida:
+        tabela.salvar(args.saida)
+        print(f"Tabela salva em: {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+# ================================================================
+# Métricas de erro WSGG × LBL (compartilhadas pelos scripts
+# emission_*.py e pela validação do ajuste em ajuste_wsgg.py)
+# ================================================================
+
+import numpy as np
+
+
+def calcular_erros(lbl, wsgg):
+    """Retorna dicionário com erros ponto a ponto."""
+    diff = wsgg - lbl                          # erro absoluto (diferença)
+    rel = diff / lbl                           # erro relativo em relação ao LBL
+    rel_sym = diff / ((np.abs(wsgg)+np.abs(lbl))/2)  # diferença relativa simétrica
+    rmse = np.sqrt(np.mean(diff**2))
+    mae = np.mean(np.abs(diff))
+    max_abs = np.max(np.abs(diff))
+    return {
+        "diff": diff,
+        "rel": rel,
+        "rel_sym": rel_sym,
+        "RMSE": rmse,
+        "MAE": mae,
+        "MAX_ABS": max_abs
+    }
+
+
+def imprimir_tabela(T, lbl, wsgg, erros, titulo):
+    print("\n" + "="*70)
+    print(titulo)
+    print("="*70)
+    print(f"{'T [K]':>6} | {'LBL':>10} | {'WSGG':>10} | {'Δ = WSGG-LBL':>13} | {'ERRO REL. %':>11}")
+    print("-"*70)
+    for Ti, li, wi, di, ri in zip(T, lbl, wsgg, erros["diff"], erros["rel"]):
+        print(f"{Ti:6.0f} | {li:10.6f} | {wi:10.6f} | {di:13.6f} | {ri*100:11.3f}")
+
+    print("-"*70)
+    print(f"RMSE = {erros['RMSE']:.6e}")
+    print(f"MAE  = {erros['MAE']:.6e}")
+    print(f"MAX |Δ| = {erros['MAX_ABS']:.6e}")
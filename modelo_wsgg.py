@@ -0,0 +1,84 @@
+# ================================================================
+# Modelo WSGG: avaliação vetorizada da emitância
+# ε(T,S,p) = Σ_j a_j(T) (1 − e^{−k_j p S}),  a_j(T) = Σ_i b_{j,i} T^i
+# T, S e p podem ter qualquer forma (broadcasting do NumPy); os
+# polinômios são avaliados por Horner, sem matrizes de potências
+# ================================================================
+
+import numpy as np
+
+
+class ModeloWSGG:
+    """
+    Modelo WSGG a partir dos coeficientes de regression_multiple.py / ajuste_wsgg.py.
+
+    k : (J,) coeficientes de absorção dos gases cinzas [1/(atm·m)]
+    b : (J, grau+1) coeficientes em T bruto, ordem [const, T, T², …]
+    """
+
+    def __init__(self, k, b):
+        self.k = np.asarray(k, dtype=float).ravel()
+        self.b = np.atleast_2d(np.asarray(b, dtype=float))
+        if self.b.shape[0] != self.k.size:
+            raise ValueError(f"b deve ter uma linha por gás cinza ({self.k.size}); "
+                             f"recebido {self.b.shape}.")
+
+    @property
+    def n_cinzas(self) -> int:
+        return self.k.size
+
+    @property
+    def grau(self) -> int:
+        return self.b.shape[1] - 1
+
+    def peso(self, j: int, T, out=None) -> np.ndarray:
+        """a_j(T) por Horner (mesma forma de T)."""
+        T = np.asarray(T, dtype=float)
+        bj = self.b[j]
+        if out is None:
+            out = np.empty(T.shape)
+        out[...] = bj[-1]
+        for c in bj[-2::-1]:
+            out *= T
+            out += c
+        return out
+
+    def pesos(self, T) -> np.ndarray:
+        """a_j(T) de todos os gases → forma T.shape + (J,)."""
+        T = np.asarray(T, dtype=float)
+        out = np.empty(T.shape + (self.n_cinzas,))
+        for j in range(self.n_cinzas):
+            self.peso(j, T, out=out[..., j])
+        return out
+
+    def emitancia(self, T, S, p=1.0, out=None) -> np.ndarray:
+        """
+        ε(T, S, p) num único passe com broadcasting.
+
+        T [K], S [m], p [atm] (pressão parcial) com formas compatíveis;
+        out: vetor pré-alocado com a forma do broadcasting (reutilizável
+        entre chamadas, evita alocar o resultado).
+        """
+        T = np.asarray(T, dtype=float)
+        S = np.asarray(S, dtype=float)
+        p = np.asarray(p, dtype=float)
+        forma = np.broadcast_shapes(T.shape, S.shape, p.shape)
+        if out is None:
+            out = np.zeros(forma)
+        elif out.shape != forma:
+            raise ValueError(f"out deve ter forma {forma}; recebido {out.shape}.")
+        else:
+            out[...] = 0.0
+
+        pS = np.broadcast_to(p * S, forma)
+        a = np.empty(forma)
+        trans = np.empty(forma)
+        for j in range(self.n_cinzas):
+            self.peso(j, np.broadcast_to(T, forma), out=a)
+            np.multiply(pS, -self.k[j], out=trans)
+            np.expm1(trans, out=trans)               # e^{−k p S} − 1
+            a *= trans
+            out -= a                                 # + a_j (1 − e^{−k p S})
+        return out
+
+    __call__ = emitancia
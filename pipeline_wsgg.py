@@ -0,0 +1,212 @@
+# ================================================================
+# Cadeia espectro → κ → emitância LBL → ajuste WSGG → figuras como
+# DAG de etapas com cache de artefatos (artefatos.py)
+#   kappa_<T>K   : σ → κ (conversao_kappa_ceta.converter), por T
+#   lbl_<T>K     : ε_LBL(T, S) (emitancia_lbl.emitancia_total), por T
+#   tabela_lbl   : junta as linhas ε_LBL(T, S) de todas as T
+#   ajuste_wsgg  : k_j e b_{j,i} (ajuste_wsgg.ajustar_wsgg)
+#   figuras_emissao : figuras LBL × WSGG (figuras.FiguraEmissao)
+# Trocar o espectro de um caso recalcula só o κ e a ε desse caso e as
+# etapas agregadas (tabela, ajuste, figuras). O ajuste usa a pressão
+# parcial p_a = P_BAR·Y_ABS dos casos, que deve ser a mesma em todos
+# ================================================================
+
+import argparse
+import os
+
+import numpy as np
+
+from ajuste_wsgg import GRAU, N_CINZAS, ajustar_wsgg
+from artefatos import ARMAZEM_PADRAO, Pipeline
+from conversao_kappa_ceta import P_BAR, Y_ABS, converter
+from emitancia_lbl import emitancia_total
+from leitura_espectros import ler_colunas
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+S_PADRAO = [30.0, 10.0, 1.0, 0.1]   # percursos [m]
+IDIOMAS = ["en", "pt"]
+ESTILOS = ["artigo", "tese"]
+FORMATOS = ["png"]
+DPI = 300
+ARQ_KAPPA = "kappa.npy"
+ARQ_LBL = "lbl.txt"
+ARQ_TABELA = "tabela_lbl.txt"
+ARQ_COEFICIENTES = "coeficientes.npz"
+ARQ_WSGG = "tabela_wsgg.txt"
+BAR_POR_ATM = 1.01325
+TOL_PRESSAO = 1e-9                  # tolerância relativa entre as p_a dos casos
+# ---------------------------------------------------------------
+
+# ===================== ETAPAS =====================
+
+def _cabecalho(S) -> str:
+    return "T_K " + " ".join(f"eps(S={s:g}m)" for s in S)
+
+
+def etapa_kappa(entradas: dict, p: dict, saida: str) -> None:
+    """κ(η) = N(T, p)·Y·σ(η) gravado em kappa.npy (colunas nu, kappa)."""
+    converter(entradas["xsec"], os.path.join(saida, ARQ_KAPPA), p["T_K"], p["P_BAR"], p["Y_ABS"])
+
+
+def etapa_lbl(entradas: dict, p: dict, saida: str) -> None:
+    """Linha (T, ε(S_1), …, ε(S_n)) da emitância LBL de um caso."""
+    d = np.load(os.path.join(entradas["kappa"], ARQ_KAPPA), mmap_mode="r")
+    eps = emitancia_total(d[:, 0], d[:, 1], p["T_K"], p["S"])
+    np.savetxt(os.path.join(saida, ARQ_LBL), np.concatenate([[p["T_K"]], eps])[None, :],
+               fmt="%.10e", header=_cabecalho(p["S"]))
+
+
+def etapa_tabela(entradas: dict, p: dict, saida: str) -> None:
+    """Tabela ε_LBL[T, S] ordenada por T (formato lido por ajuste_wsgg.py)."""
+    linhas = np.vstack([ler_colunas(os.path.join(d, ARQ_LBL)) for d in entradas.values()])
+    linhas = linhas[np.argsort(linhas[:, 0])]
+    np.savetxt(os.path.join(saida, ARQ_TABELA), linhas, fmt="%.10e", header=_cabecalho(p["S"]))
+
+
+def etapa_ajuste(entradas: dict, p: dict, saida: str) -> None:
+    """Ajuste WSGG: coeficientes (k, b, pressao) e a tabela ε_WSGG[T, S]."""
+    tab = ler_colunas(os.path.join(entradas["tabela"], ARQ_TABELA))
+    ajuste = ajustar_wsgg(tab[:, 0], p["S"], tab[:, 1:], p["n_cinzas"], p["grau"],
+                          p["pressao_atm"], relativo=p["relativo"])
+    np.savez(os.path.join(saida, ARQ_COEFICIENTES), k=ajuste.k, b=ajuste.b, pressao=ajuste.pressao)
+    np.savetxt(os.path.join(saida, ARQ_WSGG), np.column_stack([ajuste.T, ajuste.eps_wsgg]),
+               fmt="%.10e", header=_cabecalho(p["S"]))
+
+
+def etapa_figuras(entradas: dict, p: dict, saida: str) -> None:
+    """Figuras LBL × WSGG em todas as línguas/estilos (figuras.renderizar_variantes)."""
+    import matplotlib.pyplot as plt
+    from figuras import FiguraEmissao, renderizar_variantes
+
+    plt.switch_backend("Agg")
+    lbl = ler_colunas(os.path.join(entradas["tabela"], ARQ_TABELA))
+    wsgg = ler_colunas(os.path.join(entradas["ajuste"], ARQ_WSGG))
+    S = p["S"]
+    figura = FiguraEmissao({s: wsgg[:, i + 1] for i, s in enumerate(S)},
+                           lbl={s: lbl[:, i + 1] for i, s in enumerate(S)}, T=lbl[:, 0], S=S)
+    renderizar_variantes({"emissao": figura}, p["idiomas"], p["estilos"], saida,
+                         p["formatos"], p["dpi"])
+
+# ===================== MONTAGEM DO DAG =====================
+
+def _por_caso(valor, T: float) -> float:
+    """Escalar ou {T: valor}."""
+    return float(valor[T]) if isinstance(valor, dict) else float(valor)
+
+
+def pressao_parcial_atm(espectros: dict, p_bar=P_BAR, y_abs=Y_ABS) -> float:
+    """
+    p_a = P_BAR·Y_ABS [atm] comum a todos os casos (a usada no κ de cada T).
+    ValueError se os casos tiverem p_a diferentes: um ajuste WSGG tem uma só p_a.
+    """
+    pa = {float(T): _por_caso(p_bar, T) * _por_caso(y_abs, T) / BAR_POR_ATM for T in espectros}
+    ref = next(iter(pa.values()))
+    if any(abs(v - ref) > TOL_PRESSAO * abs(ref) for v in pa.values()):
+        casos = ", ".join(f"{T:g} K: {v:.6g} atm" for T, v in sorted(pa.items()))
+        raise ValueError(f"pressões parciais P·Y diferentes entre os casos ({casos}); "
+                         "um ajuste WSGG usa uma só p_a: monte um pipeline por pressão.")
+    return ref
+
+
+def montar_pipeline(espectros: dict, S=S_PADRAO, p_bar=P_BAR, y_abs=Y_ABS,
+                    n_cinzas: int | None = None, grau: int = GRAU, relativo: bool = True,
+                    armazem: str = ARMAZEM_PADRAO, figuras: bool = True,
+                    idiomas=IDIOMAS, estilos=ESTILOS, formatos=FORMATOS, dpi: int = DPI) -> Pipeline:
+    """
+    espectros : {T [K]: arquivo .xsec (nu, sigma)}
+    p_bar, y_abs : escalar (todos os casos) ou {T: valor} (por caso); o produto
+                   P·Y deve ser o mesmo em todos (ver pressao_parcial_atm)
+    n_cinzas : padrão min(N_CINZAS, n_S − 1); com n_cinzas >= n_S os k_j ficam
+               indeterminados (ver ajuste_wsgg.ajustar_wsgg) e é recusado
+    """
+    S = [float(s) for s in S]
+    if n_cinzas is None:
+        n_cinzas = min(N_CINZAS, len(S) - 1)
+    if n_cinzas < 1 or n_cinzas >= len(S):
+        raise ValueError(f"n_cinzas deve estar entre 1 e n_S − 1 = {len(S) - 1} "
+                         f"(recebido {n_cinzas} com {len(S)} percursos): use mais percursos.")
+    pressao_atm = pressao_parcial_atm(espectros, p_bar, y_abs)
+    pipe = Pipeline(armazem)
+    lbl = {}
+    for T in sorted(espectros):
+        T = float(T)
+        nome_T = f"{T:g}K"
+        kappa = pipe.etapa(f"kappa_{nome_T}", etapa_kappa, entradas={"xsec": espectros[T]},
+                           parametros={"T_K": T, "P_BAR": _por_caso(p_bar, T),
+                                       "Y_ABS": _por_caso(y_abs, T)},
+                           modulos=["conversao_kappa_ceta"])
+        lbl[nome_T] = pipe.etapa(f"lbl_{nome_T}", etapa_lbl, depende={"kappa": kappa},
+                                 parametros={"T_K": T, "S": S}, modulos=["emitancia_lbl"])
+    tabela = pipe.etapa("tabela_lbl", etapa_tabela, depende=lbl, parametros={"S": S},
+                        modulos=["leitura_espectros"])
+    ajuste = pipe.etapa("ajuste_wsgg", etapa_ajuste, depende={"tabela": tabela},
+                        parametros={"S": S, "n_cinzas": int(n_cinzas), "grau": int(grau),
+                                    "pressao_atm": float(pressao_atm), "relativo": bool(relativo)},
+                        modulos=["ajuste_wsgg"])
+    if figuras:
+        pipe.etapa("figuras_emissao", etapa_figuras, depende={"tabela": tabela, "ajuste": ajuste},
+                   parametros={"S": S, "idiomas": list(idiomas), "estilos": list(estilos),
+                               "formatos": list(formatos), "dpi": int(dpi)},
+                   modulos=["figuras"])
+    return pipe
+
+# ===================== LINHA DE COMANDO =====================
+
+def _pares(itens, ap, rotulo: str) -> dict:
+    pares = {}
+    for item in itens:
+        t, _, v = item.partition("=")
+        if not v:
+            ap.error(f"use {rotulo} (recebido '{item}').")
+        pares[float(t)] = v
+    return pares
+
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Cadeia σ → κ → ε_LBL → WSGG → figuras com cache de artefatos.")
+    ap.add_argument("espectros", nargs="+", metavar="T=ARQUIVO",
+                    help="temperatura [K] e arquivo .xsec (nu, sigma), ex.: 1200=NH3_1200K.xsec")
+    ap.add_argument("--S", type=float, nargs="+", default=S_PADRAO, help="percursos [m]")
+    ap.add_argument("--P", type=float, default=P_BAR, help="pressão total [bar] (todos os casos)")
+    ap.add_argument("--Y", type=float, default=Y_ABS, help="fração molar do absorvedor (todos os casos)")
+    ap.add_argument("--P-caso", action="append", default=[], metavar="T=P",
+                    help="pressão [bar] de um caso (repetível; substitui --P nesse T)")
+    ap.add_argument("--Y-caso", action="append", default=[], metavar="T=Y",
+                    help="fração molar de um caso (repetível; substitui --Y nesse T); "
+                         "P·Y deve dar a mesma pressão parcial em todos os casos")
+    ap.add_argument("--cinzas", type=int, default=None,
+                    help=f"número de gases cinzas (padrão: min({N_CINZAS}, nº de percursos − 1))")
+    ap.add_argument("--grau", type=int, default=GRAU, help="grau dos polinômios a_j(T)")
+    ap.add_argument("--armazem", default=ARMAZEM_PADRAO, help="diretório dos artefatos")
+    ap.add_argument("--alvo", nargs="+", default=None, help="etapas a produzir (padrão: todas)")
+    ap.add_argument("--sem-figuras", action="store_true", help="não inclui a etapa de figuras")
+    ap.add_argument("--forcar", action="store_true", help="recalcula mesmo as etapas atualizadas")
+    args = ap.parse_args(argv)
+
+    espectros = _pares(args.espectros, ap, "T=ARQUIVO")
+    p_bar = {T: args.P for T in espectros}
+    p_bar.update({T: float(v) for T, v in _pares(args.P_caso, ap, "T=P").items()})
+    y_abs = {T: args.Y for T in espectros}
+    y_abs.update({T: float(v) for T, v in _pares(args.Y_caso, ap, "T=Y").items()})
+
+    try:
+        pipe = montar_pipeline(espectros, args.S, p_bar, y_abs, args.cinzas, args.grau,
+                               armazem=args.armazem, figuras=not args.sem_figuras)
+    except ValueError as e:
+        ap.error(str(e))
+    desconhecidas = [a for a in (args.alvo or []) if a not in pipe.etapas]
+    if desconhecidas:
+        ap.error(f"etapas desconhecidas: {', '.join(desconhecidas)} (existentes: {', '.join(pipe.etapas)}).")
+    situacao = pipe.executar(args.alvo, forcar=args.forcar,
+                             aviso=lambda nome, s: print(f"{nome:18s} {s:14s} {pipe.caminho(nome)}"))
+    n = sum(s == "calculada" for s in situacao.values())
+    print(f"\n{n} etapas calculadas, {len(situacao) - n} reaproveitadas.")
+
+    if "ajuste_wsgg" in situacao:
+        c = np.load(os.path.join(pipe.caminho("ajuste_wsgg"), ARQ_COEFICIENTES))
+        print(f"\np_a = {float(c['pressao']):.6g} atm")
+        print("k_j [1/atm·m]: " + " ".join(f"{v:.6e}" for v in c["k"]))
+
+
+if __name__ == "__main__":
+    main()
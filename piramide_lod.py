@@ -0,0 +1,230 @@
+# ================================================================
+# Pirâmide de níveis de detalhe (LOD) para explorar espectros de
+# 10^7 pontos: o nível k guarda (mín, máx) de cada grupo de 2^k
+# amostras; cada nível tem metade da resolução do anterior. A
+# pirâmide é gravada uma vez ao lado do cache do espectro
+# (<arq>.lod.npy) e aberta por np.memmap; o visualizador lê só o
+# nível e a janela necessários para o zoom atual
+# ================================================================
+
+import argparse
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.ticker import MultipleLocator
+
+from decimacao import TracoDecimado, janela
+from espectro_uniforme import EspectroUniforme
+from leitura_espectros import (abrir_cache, cache_valido, ler_kappa_hitran, ler_xsec,
+                               salvar_cache_em_blocos)
+from reamostragem import eixo_espectro
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS_TOPO = 2048          # o nível mais grosso tem no máximo isso de grupos
+PONTOS_POR_BLOCO = 1 << 22  # amostras lidas por vez na construção (par)
+SUFIXO_LOD = ".lod.npy"
+# ---------------------------------------------------------------
+
+# ===================== CONSTRUÇÃO =====================
+
+def niveis(n: int, pontos_topo: int = PONTOS_TOPO) -> list:
+    """(início, tamanho) de cada nível k = 1, 2, … na matriz da pirâmide."""
+    lista, ini, m = [], 0, n
+    while m > pontos_topo:
+        m = -(-m // 2)
+        lista.append((ini, m))
+        ini += m
+    return lista
+
+
+def _reduzir(mn, mx, destino, pontos_por_bloco: int = PONTOS_POR_BLOCO) -> None:
+    """destino[j] = (mín, máx) dos pares (2j, 2j+1) de mn/mx; sobra ímpar copiada."""
+    for i in range(0, mn.size, pontos_por_bloco):
+        a = np.asarray(mn[i:i + pontos_por_bloco])
+        b = np.asarray(mx[i:i + pontos_por_bloco])
+        j, pares = i // 2, a.size // 2
+        destino[j:j + pares, 0] = np.minimum(a[0:2 * pares:2], a[1:2 * pares:2])
+        destino[j:j + pares, 1] = np.maximum(b[0:2 * pares:2], b[1:2 * pares:2])
+        if a.size % 2:
+            destino[j + pares] = a[-1], b[-1]
+
+
+def construir_piramide(y: np.ndarray, destino: np.ndarray | None = None,
+                       pontos_topo: int = PONTOS_TOPO,
+                       pontos_por_bloco: int = PONTOS_POR_BLOCO) -> np.ndarray:
+    """
+    Matriz (Σ tamanhos, 2) com os níveis 1…K empilhados. y pode ser um memmap:
+    é lido em blocos de `pontos_por_bloco`, e cada nível sai do anterior.
+    """
+    lista = niveis(y.size, pontos_topo)
+    total = sum(m for _, m in lista)
+    if destino is None:
+        destino = np.empty((total, 2))
+    mn = mx = y
+    for ini, m in lista:
+        nivel = destino[ini:ini + m]
+        _reduzir(mn, mx, nivel, pontos_por_bloco)
+        mn, mx = nivel[:, 0], nivel[:, 1]
+    return destino
+
+# ===================== CONSULTA =====================
+
+class PiramideLOD:
+    """
+    Espectro (EspectroUniforme ou (nu, y), nu crescente) com a sua pirâmide mín/máx.
+    janela(x0, x1, colunas) devolve o trecho visível no nível mais grosso que
+    ainda tem ≥ `colunas` grupos (nível 0 = amostras originais).
+    """
+
+    def __init__(self, espectro, dados: np.ndarray | None = None,
+                 pontos_topo: int = PONTOS_TOPO):
+        self.valores, self.malha = eixo_espectro(espectro)
+        self.n = self.valores.size
+        self.niveis = niveis(self.n, pontos_topo)
+        if dados is None:
+            dados = construir_piramide(self.valores, pontos_topo=pontos_topo)
+        if dados.shape != (sum(m for _, m in self.niveis), 2):
+            raise ValueError(f"pirâmide de forma {dados.shape} não corresponde a {self.n} pontos.")
+        self.dados = dados
+
+    @property
+    def nu_min(self) -> float:
+        return float(self._nu(np.array([0]))[0])
+
+    @property
+    def nu_max(self) -> float:
+        return float(self._nu(np.array([self.n - 1]))[0])
+
+    def nivel(self, k: int) -> np.ndarray:
+        """(mín, máx) dos grupos de 2^k amostras, k ≥ 1 (visão do memmap)."""
+        ini, m = self.niveis[k - 1]
+        return self.dados[ini:ini + m]
+
+    def _nu(self, i: np.ndarray) -> np.ndarray:
+        if isinstance(self.malha, EspectroUniforme):
+            return self.malha.inicio + self.malha.passo * i
+        return self.malha[i]
+
+    def _indices(self, x0: float, x1: float) -> slice:
+        if isinstance(self.malha, EspectroUniforme):
+            s = self.malha.fatia(x0, x1)
+            return slice(max(s.start - 1, 0), min(s.stop + 1, self.n))
+        return janela(self.malha, x0, x1)
+
+    def nivel_para(self, pontos: int, colunas: int) -> int:
+        """Maior k com ceil(pontos / 2^k) ≥ colunas (0 se nem o nível 1 servir)."""
+        k = 0
+        while k < len(self.niveis) and -(-pontos // (2 << k)) >= colunas:
+            k += 1
+        return k
+
+    def janela(self, x0: float | None = None, x1: float | None = None,
+               colunas: int = PONTOS_TOPO) -> tuple:
+        """(x, y) para desenhar [x0, x1]: amostras no nível 0; (mín, máx) por grupo acima."""
+        s = self._indices(self.nu_min if x0 is None else x0, self.nu_max if x1 is None else x1)
+        if s.stop <= s.start:
+            return np.empty(0), np.empty(0)
+        k = self.nivel_para(s.stop - s.start, colunas)
+        if k == 0:
+            return self._nu(np.arange(s.start, s.stop)), np.asarray(self.valores[s])
+        b0, b1 = s.start >> k, ((s.stop - 1) >> k) + 1
+        grupos = np.arange(b0, b1)
+        # x no centro de cada grupo de amostras [b·2^k, (b+1)·2^k − 1]
+        xc = 0.5 * (self._nu(grupos << k) + self._nu(np.minimum(((grupos + 1) << k) - 1, self.n - 1)))
+        return np.repeat(xc, 2), np.asarray(self.nivel(k)[b0:b1]).ravel()
+
+
+def piramide_de_arquivo(arq: str, hitran: bool = False, inicio: float = 50.0,
+                        fim: float | None = 10000.0, passo: float = 0.01,
+                        usar_cache: bool = True) -> PiramideLOD:
+    """
+    Pirâmide do arquivo `arq` (.xsec/κ de 2 colunas, ou κ do HITRAN de 1 coluna
+    com hitran=True). É construída em blocos direto para `<arq>.lod.npy` e, nas
+    aberturas seguintes, lida por np.memmap enquanto o arquivo de origem não mudar.
+    """
+    if hitran:
+        espectro = ler_kappa_hitran(arq, inicio, fim, passo, usar_cache=usar_cache)
+        y = espectro.valores
+    else:
+        data = ler_xsec(arq, usar_cache=usar_cache)
+        espectro = (data[:, 0], data[:, 1])
+        y = data[:, 1]
+    total = sum(m for _, m in niveis(y.size))
+    if usar_cache and cache_valido(arq, SUFIXO_LOD):
+        dados = abrir_cache(arq, SUFIXO_LOD)
+        if dados.shape == (total, 2):
+            return PiramideLOD(espectro, dados)
+    if usar_cache:
+        try:
+            salvar_cache_em_blocos(arq, (total, 2), lambda d: construir_piramide(y, d), SUFIXO_LOD)
+            return PiramideLOD(espectro, abrir_cache(arq, SUFIXO_LOD))
+        except OSError:
+            pass
+    return PiramideLOD(espectro)
+
+# ===================== VISUALIZADOR =====================
+
+class TracoLOD(TracoDecimado):
+    """Linha do matplotlib alimentada pela pirâmide: cada zoom/pan lê só o nível e a janela visíveis."""
+
+    def __init__(self, ax, piramide: PiramideLOD, *args, colunas: int | None = None, **kw):
+        self.piramide = piramide
+        self._desenhar(ax, colunas, args, kw)
+
+    def dados(self, x0: float | None, x1: float | None, colunas: int) -> tuple:
+        return self.piramide.janela(x0, x1, colunas)
+
+
+def num_to_lambda(v): return 1e4 / v
+def lambda_to_num(l): return 1e4 / l
+
+
+def visualizar(piramide: PiramideLOD, rotulo: str = "", ylabel: str = r'Cross-section (cm$^{2}$/molecule)',
+               faixa=None):
+    """Figura no padrão dos graph_*.py (σ em log, eixo superior em µm) para zoom/pan interativo."""
+    fig, ax1 = plt.subplots(figsize=(8, 4.5))
+    TracoLOD(ax1, piramide, color='#0072B2', lw=1.0, label=rotulo or None)
+
+    ax1.set_yscale('log')
+    ax1.set_xlim(*(faixa or (piramide.nu_min, piramide.nu_max)))
+    ax1.set_xlabel(r'Wavenumber (cm$^{-1}$)', fontsize=13)
+    ax1.set_ylabel(ylabel, fontsize=13)
+    ax1.tick_params(axis='both', direction='in', length=5, width=0.8, labelsize=11)
+    for s in ['top', 'right']:
+        ax1.spines[s].set_visible(False)
+
+    secax = ax1.secondary_xaxis('top', functions=(num_to_lambda, lambda_to_num))
+    secax.set_xlabel(r'Wavelength ($\mu$m)', fontsize=13)
+    secax.tick_params(axis='x', labelsize=11)
+
+    if faixa is None:
+        ax1.xaxis.set_major_locator(MultipleLocator(2000))
+    ax1.grid(which='major', color='gray', linestyle='--', linewidth=0.4, alpha=0.3)
+    ax1.set_facecolor('white')
+    if rotulo:
+        ax1.legend(frameon=False, fontsize=11, loc='upper right')
+    fig.tight_layout()
+    return fig, ax1
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Visualizador interativo de espectros com pirâmide mín/máx (LOD).")
+    ap.add_argument("arquivo", help="arquivo (nu, y) ou κ do HITRAN (--hitran)")
+    ap.add_argument("--hitran", action="store_true", help="arquivo de 1 coluna na malha fixa do HITRAN")
+    ap.add_argument("--faixa", type=float, nargs=2, default=None, metavar=("NU_MIN", "NU_MAX"))
+    ap.add_argument("--rotulo", default="", help="legenda da curva")
+    ap.add_argument("--so-construir", action="store_true", help="só gera o <arq>.lod.npy")
+    args = ap.parse_args(argv)
+
+    piramide = piramide_de_arquivo(args.arquivo, hitran=args.hitran)
+    print(f"{piramide.n} pontos; {len(piramide.niveis)} níveis (topo: {piramide.niveis[-1][1] if piramide.niveis else piramide.n} grupos)")
+    if args.so_construir:
+        return
+    ylabel = r'$\kappa$ (cm$^{-1}$)' if args.hitran else r'Cross-section (cm$^{2}$/molecule)'
+    visualizar(piramide, args.rotulo, ylabel, args.faixa)
+    plt.show()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+# ================================================================
+# Reamostragem de espectros para uma malha comum de número de onda
+# (ex.: ExoMol → malha uniforme do HITRAN) e comparação ponto a ponto
+# - "linear": interpolação linear das amostras
+# - "media":  média por célula que conserva a integral ∫ y dν̃
+# Os eixos são supostos crescentes; malhas uniformes (EspectroUniforme)
+# são localizadas aritmeticamente, sem busca binária. Tudo é feito em
+# blocos de pontos de destino (malhas de 1e6–1e7 pontos)
+# ================================================================
+
+import numpy as np
+
+from espectro_uniforme import EspectroUniforme
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PONTOS_POR_BLOCO = 1 << 20   # pontos de destino processados por vez
+# ---------------------------------------------------------------
+
+# ===================== LOCALIZAÇÃO NA MALHA DE ORIGEM =====================
+
+def eixo_espectro(espectro):
+    """(valores, EspectroUniforme ou eixo ν̃) a partir de EspectroUniforme ou (nu, y)."""
+    if isinstance(espectro, EspectroUniforme):
+        return np.asarray(espectro.valores, dtype=float), espectro
+    nu, y = espectro
+    nu = np.asarray(nu, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if nu.shape != y.shape or nu.ndim != 1:
+        raise ValueError("nu e y devem ser vetores 1D do mesmo tamanho.")
+    if nu.size < 2:
+        raise ValueError("a malha de origem precisa de ao menos 2 pontos.")
+    return y, nu
+
+
+def localizar(malha, x: np.ndarray):
+    """
+    Segmento i e fração f de cada x na malha de origem:
+    x = ν̃_i + f (ν̃_{i+1} − ν̃_i), com i limitado a [0, n−2].
+    Devolve também a máscara de pontos fora da malha.
+    """
+    if isinstance(malha, EspectroUniforme):
+        p = (x - malha.inicio) / malha.passo
+        i = np.clip(np.floor(p), 0, malha.n - 2).astype(np.intp)
+        f = p - i
+        fora = (p < -1e-9) | (p > malha.n - 1 + 1e-9)
+        return i, f, fora
+    i = np.clip(np.searchsorted(malha, x, side="right") - 1, 0, malha.size - 2)
+    f = (x - malha[i]) / (malha[i + 1] - malha[i])
+    fora = (x < malha[0]) | (x > malha[-1])
+    return i, f, fora
+
+
+def _passos(malha, i0: int, i1: int) -> np.ndarray:
+    """Larguras dos segmentos i0 … i1−1 da malha de origem."""
+    if isinstance(malha, EspectroUniforme):
+        return np.full(i1 - i0, malha.passo)
+    return np.diff(malha[i0:i1 + 1])
+
+
+def _destino(destino):
+    """Eixo de destino como EspectroUniforme (só a malha) ou vetor ν̃."""
+    if isinstance(destino, EspectroUniforme):
+        return destino, destino.n
+    x = np.asarray(destino, dtype=float)
+    return x, x.size
+
+
+def _pontos(destino, a: int, b: int) -> np.ndarray:
+    if isinstance(destino, EspectroUniforme):
+        return destino.inicio + destino.passo * np.arange(a, b, dtype=float)
+    return destino[a:b]
+
+
+def _bordas(destino, a: int, b: int) -> np.ndarray:
+    """Bordas das células dos pontos a … b−1 do destino (b − a + 1 valores)."""
+    if isinstance(destino, EspectroUniforme):
+        return destino.inicio + destino.passo * (np.arange(a, b + 1, dtype=float) - 0.5)
+    x = destino
+    n = x.size
+    if n == 1:
+        raise ValueError("média por célula exige ao menos 2 pontos de destino.")
+    # borda k = ponto médio entre x_{k−1} e x_k; nas pontas, meia célula para fora
+    k = np.clip(np.arange(a, b + 1), 1, n - 1)
+    e = 0.5 * (x[k - 1] + x[k])
+    if a == 0:
+        e[0] = x[0] - 0.5 * (x[1] - x[0])
+    if b == n:
+        e[-1] = x[-1] + 0.5 * (x[-1] - x[-2])
+    return e
+
+# ===================== REAMOSTRAGEM =====================
+
+def _interpolar_bloco(y, malha, x, preencher):
+    i, f, fora = localizar(malha, x)
+    r = y[i] + f * (y[i + 1] - y[i])
+    r[fora] = preencher
+    return r
+
+
+def _media_bloco(y, malha, e, preencher):
+    """Média de y (linear por partes) em cada célula [e_k, e_{k+1}]."""
+    i, f, fora = localizar(malha, e)
+    i0, i1 = int(i[0]), int(i[-1]) + 1
+    h = _passos(malha, i0, i1)
+    ys = y[i0:i1 + 1]
+    # integral acumulada local (origem em ν̃_{i0}: evita cancelamento em malhas longas)
+    G = np.empty(i1 - i0 + 1)
+    G[0] = 0.0
+    np.cumsum(0.5 * h * (ys[1:] + ys[:-1]), out=G[1:])
+    j = i - i0
+    parcial = h[j] * f * (y[i] + 0.5 * f * (y[i + 1] - y[i]))
+    F = G[j] + parcial
+    larg = np.diff(e)
+    r = np.diff(F) / larg
+    r[fora[:-1] | fora[1:]] = preencher
+    return r
+
+
+def reamostrar(origem, destino, metodo: str = "media", preencher: float = np.nan,
+               pontos_por_bloco: int = PONTOS_POR_BLOCO) -> np.ndarray:
+    """
+    Reamostra o espectro `origem` na malha `destino`.
+
+    origem    : EspectroUniforme ou tupla (nu, y) com nu crescente
+    destino   : EspectroUniforme (só a malha é usada) ou vetor ν̃ crescente
+    metodo    : "linear" (interpolação das amostras) ou "media" (média por
+                célula, conserva ∫ y dν̃; use quando o destino é mais grosso)
+    preencher : valor dos pontos de destino fora da malha de origem
+    Retorna um vetor com um valor por ponto de destino.
+    """
+    if metodo not in ("linear", "media"):
+        raise ValueError("metodo deve ser 'linear' ou 'media'.")
+    y, malha = eixo_espectro(origem)
+    destino, n = _destino(destino)
+    out = np.empty(n)
+    for a in range(0, n, pontos_por_bloco):
+        b = min(a + pontos_por_bloco, n)
+        if metodo == "linear":
+            out[a:b] = _interpolar_bloco(y, malha, _pontos(destino, a, b), preencher)
+        else:
+            out[a:b] = _media_bloco(y, malha, _bordas(destino, a, b), preencher)
+    return out
+
+# ===================== COMPARAÇÃO ENTRE BASES =====================
+
+def diferenca_e_razao(a: np.ndarray, b: np.ndarray) -> tuple:
+    """Espectros a − b e a / b (b = 0 → NaN) na mesma malha."""
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        razao = np.where(b != 0, a / b, np.nan)
+    return a - b, razao
+
+
+def metricas_comparacao(a: np.ndarray, b: np.ndarray, nu=None) -> dict:
+    """
+    Métricas ponto a ponto entre dois espectros na mesma malha (NaN ignorado):
+    correlação de Pearson (linear e em log10, só pares positivos), diferença
+    RMS, mediana de |a/b − 1| e razão entre as integrais (com `nu`).
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    ok = np.isfinite(a) & np.isfinite(b)
+    a_ok, b_ok = a[ok], b[ok]
+    pos = (a_ok > 0) & (b_ok > 0)
+    m = {
+        "pontos": int(ok.sum()),
+        "correlacao": float(np.corrcoef(a_ok, b_ok)[0, 1]) if ok.sum() > 1 else np.nan,
+        "correlacao_log": (float(np.corrcoef(np.log10(a_ok[pos]), np.log10(b_ok[pos]))[0, 1])
+                           if pos.sum() > 1 else np.nan),
+        "rms_diferenca": float(np.sqrt(np.mean((a_ok - b_ok) ** 2))) if ok.any() else np.nan,
+        "mediana_desvio_relativo": float(np.median(np.abs(a_ok[pos] / b_ok[pos] - 1.0)))
+                                   if pos.any() else np.nan,
+    }
+    if nu is not None:
+        nu_ok = np.asarray(nu, dtype=float)[ok]
+        h = 0.5 * np.diff(nu_ok)
+        m["razao_integrais"] = float(np.sum(h * (a_ok[1:] + a_ok[:-1]))
+                                     / np.sum(h * (b_ok[1:] + b_ok[:-1])))
+    return m
+
+
+def imprimir_metricas(m: dict, titulo: str = "Comparação ponto a ponto") -> None:
+    print(f"\n===== {titulo} =====")
+    for chave, valor in m.items():
+        print(f"{chave:>24}: {valor:.6g}" if isinstance(valor, float) else f"{chave:>24}: {valor}")
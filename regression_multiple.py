@@ -1,9 +1,13 @@
 import pandas as pd
-import statsmodels.api as sm
 import matplotlib.pyplot as plt
 from io import StringIO
+from ajuste_wsgg import ajustar_polinomios
 
 #Codigo gerado para realizar b_js polinomios do WSGG
+# ===================== CONFIGURAÇÃO =====================
+GRAU = 4                    # a_j(T) = b0 + b1 T + … + b4 T⁴
+RESUMO_STATSMODELS = False  # True → também roda sm.OLS e imprime o summary() completo de cada Y
+
 # ===================== DADOS =====================
 # Copie exatamente como está abaixo
 data_txt = """
@@ -29,27 +33,38 @@ df = pd.read_csv(StringIO(data_txt),
 df.columns = ['Y1', 'Y2', 'Y3', 'Y4', 'T', 'T2', 'T3', 'T4']
 
 # ===================== REGRESSÕES MÚLTIPLAS =====================
-# Variáveis independentes (preditoras)
-X = df[['T', 'T2', 'T3', 'T4']]
-X = sm.add_constant(X)  # adiciona termo constante (intercepto)
+# Todos os Y de uma vez: uma única fatoração numa base bem condicionada
+# (Chebyshev em T normalizado), coeficientes devolvidos em T bruto
+alvos = ['Y1', 'Y2', 'Y3', 'Y4']
+coef, ajustados, r2 = ajustar_polinomios(df['T'].to_numpy(), df[alvos].to_numpy(), grau=GRAU)
 
-resultados = {}
+print("\n" + "="*96)
+print("COEFICIENTES b_{j,i}  (a_j(T) = b0 + b1 T + b2 T² + b3 T³ + b4 T⁴)")
+print("="*96)
+print(f"{'':>4} | " + " | ".join(f"{'b' + str(i):>15}" for i in range(GRAU + 1)) + f" | {'R²':>8}")
+print("-"*96)
+for y, c, r in zip(alvos, coef, r2):
+    print(f"{y:>4} | " + " | ".join(f"{v:15.8e}" for v in c) + f" | {r:8.5f}")
 
-for y in ['Y1', 'Y2', 'Y3', 'Y4']:
-    modelo = sm.OLS(df[y], X)
-    ajuste = modelo.fit()
-    resultados[y] = ajuste
-    
-    print(f"\n==============================")
-    print(f"      MODELO PARA {y}")
-    print(f"==============================")
-    print(ajuste.summary())
+if RESUMO_STATSMODELS:
+    import statsmodels.api as sm
+
+    # Variáveis independentes (preditoras)
+    X = df[['T', 'T2', 'T3', 'T4']]
+    X = sm.add_constant(X)  # adiciona termo constante (intercepto)
+
+    for y in alvos:
+        ajuste = sm.OLS(df[y], X).fit()
+
+        print(f"\n==============================")
+        print(f"      MODELO PARA {y}")
+        print(f"==============================")
+        print(ajuste.summary())
 
 # ===================== GRÁFICO OBSERVADO x AJUSTADO =====================
-for y in ['Y1', 'Y2', 'Y3', 'Y4']:
-    ajuste = resultados[y]
+for i, y in enumerate(alvos):
     y_obs = df[y]
-    y_pred = ajuste.fittedvalues
+    y_pred = ajustados[:, i]
     
     plt.figure()
     plt.plot(df['T'], y_obs, 'o', label='Observado')
@@ -0,0 +1,291 @@
+# ================================================================
+# Renderização em lote das figuras (graph_*.py, emission_*.py)
+# Cada script roda num processo próprio do pool com o backend Agg;
+# plt.show() passa a gravar as figuras abertas em PNG/PDF/SVG no
+# diretório de saída. Os arquivos lidos pelo script (dados, módulos
+# locais, o próprio script) são registrados por um audit hook e um
+# manifesto guarda o hash SHA-256 do conteúdo de cada um: figuras
+# com entradas e estilo inalterados são puladas na próxima execução.
+# Caches laterais (leitura_espectros: <arq>.cache.json) contam também
+# o arquivo de origem, que com o cache válido só passa por os.stat
+# ================================================================
+
+import argparse
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+PADROES = ["graph_*.py", "emission_*.py"]   # scripts de figura (relativos ao diretório deste arquivo)
+SAIDA_PADRAO = "figuras"
+FORMATOS = ["png"]
+DPI = 300
+MANIFESTO = ".renderizacao.json"            # gravado dentro do diretório de saída
+BYTES_POR_LEITURA = 1 << 20
+EXTENSOES_IGNORADAS = (".pyc", ".ttf", ".otf", ".afm", ".pfb", ".ttc")
+SUFIXO_META_CACHE = ".cache.json"           # leitura_espectros.SUFIXO_META (todo cache lateral o lê)
+# ---------------------------------------------------------------
+
+# ===================== HASH DE CONTEÚDO =====================
+
+def _chave(arq: str) -> dict:
+    st = os.stat(arq)
+    return {"tamanho": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def hash_arquivo(arq: str) -> str:
+    """SHA-256 do conteúdo de `arq` (lido em blocos)."""
+    h = hashlib.sha256()
+    with open(arq, "rb") as f:
+        for bloco in iter(lambda: f.read(BYTES_POR_LEITURA), b""):
+            h.update(bloco)
+    return h.hexdigest()
+
+
+def hash_com_memoria(arq: str, registro: dict | None) -> str:
+    """Hash de `arq`; reaproveita o do manifesto se tamanho e mtime não mudaram."""
+    chave = _chave(arq)
+    if registro and registro.get("tamanho") == chave["tamanho"] \
+            and registro.get("mtime_ns") == chave["mtime_ns"]:
+        return registro["sha256"]
+    return hash_arquivo(arq)
+
+
+def chave_estilo(formatos, dpi: int, estilo: str | None) -> str:
+    """Hash dos parâmetros de saída (formatos, dpi, folha de estilo, versão do matplotlib)."""
+    import matplotlib
+    partes = {"formatos": sorted(formatos), "dpi": dpi, "matplotlib": matplotlib.__version__,
+              "estilo": None}
+    if estilo:
+        partes["estilo"] = hash_arquivo(estilo) if os.path.isfile(estilo) else estilo
+    return hashlib.sha256(json.dumps(partes, sort_keys=True).encode()).hexdigest()
+
+# ===================== WORKER =====================
+
+def _raizes_ignoradas(saida: str) -> tuple:
+    """Diretórios cujos arquivos não contam como entradas (Python, pacotes, caches do matplotlib)."""
+    import site
+    import zoneinfo
+    import matplotlib
+    raizes = {sys.prefix, sys.base_prefix, sys.exec_prefix, saida,
+              matplotlib.get_cachedir(), matplotlib.get_configdir()}
+    raizes.update(site.getsitepackages() + [site.getusersitepackages()] + list(zoneinfo.TZPATH))
+    return tuple(os.path.join(os.path.realpath(r), "") for r in raizes if r)
+
+
+def _renderizar(tarefa) -> tuple:
+    """
+    Roda um script de figura (processo novo a cada tarefa). Retorna
+    (script, saídas, entradas {caminho: {tamanho, mtime_ns, sha256}}, erro ou None).
+    """
+    script, saida, formatos, dpi, estilo = tarefa
+    os.environ["MPLBACKEND"] = "Agg"
+    import runpy
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    ignorar = _raizes_ignoradas(saida)
+    lidos, escritos = set(), set()
+
+    def gancho(evento, args):
+        if evento != "open" or not isinstance(args[0], (str, bytes, os.PathLike)):
+            return
+        caminho = os.path.realpath(os.fsdecode(args[0]))
+        modo, flags = args[1], args[2]
+        if (modo and any(c in modo for c in "wax+")) or \
+                (not modo and flags & (os.O_WRONLY | os.O_RDWR)):
+            escritos.add(caminho)
+        elif not caminho.startswith(ignorar) and not caminho.endswith(EXTENSOES_IGNORADAS):
+            lidos.add(caminho)
+
+    if estilo:
+        plt.style.use(estilo)
+    nome = os.path.splitext(os.path.basename(script))[0]
+    saidas = []
+
+    def gravar_figuras(*args, **kw):
+        """Substitui plt.show(): grava e fecha todas as figuras abertas."""
+        for num in plt.get_fignums():
+            fig = plt.figure(num)
+            n = len(saidas) // len(formatos) + 1
+            base = os.path.join(saida, nome if n == 1 else f"{nome}_{n}")
+            for fmt in formatos:
+                fig.savefig(f"{base}.{fmt}", dpi=dpi, format=fmt)
+                saidas.append(f"{base}.{fmt}")
+        plt.close("all")
+
+    plt.show = gravar_figuras
+    pasta = os.path.dirname(script)
+    sys.path.insert(0, pasta)
+    sys.argv = [script]
+    os.chdir(pasta)
+    sys.addaudithook(gancho)
+    erro = None
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):   # tabelas impressas pelos scripts
+            runpy.run_path(script, run_name="__main__")
+            gravar_figuras()             # figuras deixadas abertas sem plt.show()
+    except BaseException:                # inclui SystemExit dos scripts
+        erro = traceback.format_exc(limit=-3)
+    # módulos locais importados do __pycache__ não abrem o .py: entram pelo __file__
+    for mod in list(sys.modules.values()):
+        arq = getattr(mod, "__file__", None)
+        if arq and arq.endswith(".py"):
+            arq = os.path.realpath(arq)
+            if not arq.startswith(ignorar):
+                lidos.add(arq)
+    # com o cache lateral válido o script não abre a origem (só os.stat, sem evento de
+    # auditoria): o .cache.json de cada cache consultado leva de volta ao arquivo de origem
+    lidos.update(a[:-len(SUFIXO_META_CACHE)] for a in lidos | escritos if a.endswith(SUFIXO_META_CACHE))
+    entradas = {}
+    for arq in sorted(lidos - escritos - {os.path.realpath(__file__)}):
+        if os.path.isfile(arq):
+            entradas[arq] = dict(_chave(arq), sha256=hash_arquivo(arq))
+    return script, saidas, entradas, erro
+
+# ===================== LOTE =====================
+
+def _ler_manifesto(arq: str) -> dict:
+    try:
+        with open(arq, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _gravar_manifesto(arq: str, manifesto: dict) -> None:
+    tmp = arq + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifesto, f, indent=1, sort_keys=True)
+    os.replace(tmp, arq)
+
+
+def atualizado(registro: dict | None, estilo: str) -> bool:
+    """True se o registro do manifesto tem o mesmo estilo, saídas presentes e entradas inalteradas."""
+    if not registro or registro.get("estilo") != estilo:
+        return False
+    if not registro.get("saidas") or not all(os.path.exists(s) for s in registro["saidas"]):
+        return False
+    for arq, reg in registro.get("entradas", {}).items():
+        if not os.path.isfile(arq) or hash_com_memoria(arq, reg) != reg.get("sha256"):
+            return False
+    return True
+
+
+def scripts_padrao(diretorio: str | None = None) -> list:
+    diretorio = diretorio or os.path.dirname(os.path.abspath(__file__))
+    return sorted({a for p in PADROES for a in glob.glob(os.path.join(diretorio, p))})
+
+
+def renderizar(scripts, saida: str = SAIDA_PADRAO, formatos=FORMATOS, dpi: int = DPI,
+               estilo: str | None = None, processos: int | None = None,
+               forcar: bool = False) -> dict:
+    """
+    Renderiza os scripts (em paralelo) e grava o manifesto em `saida`.
+    Retorna {script: "pulado" | "ok" | mensagem de erro}.
+    """
+    saida = os.path.abspath(saida)
+    os.makedirs(saida, exist_ok=True)
+    arq_manifesto = os.path.join(saida, MANIFESTO)
+    manifesto = _ler_manifesto(arq_manifesto)
+    ch_estilo = chave_estilo(formatos, dpi, estilo)
+    estilo = os.path.abspath(estilo) if estilo and os.path.isfile(estilo) else estilo
+
+    situacao, pendentes = {}, []
+    for script in (os.path.abspath(s) for s in scripts):
+        if not forcar and atualizado(manifesto.get(script), ch_estilo):
+            situacao[script] = "pulado"
+        else:
+            pendentes.append((script, saida, list(formatos), dpi, estilo))
+    if not pendentes:
+        return situacao
+
+    # um processo novo por script: rcParams e módulos importados não vazam entre figuras,
+    # e todo import local passa pelo audit hook (vira entrada do hash)
+    with ProcessPoolExecutor(max_workers=processos, max_tasks_per_child=1) as pool:
+        futuros = [pool.submit(_renderizar, t) for t in pendentes]
+        for fut in as_completed(futuros):
+            script, saidas, entradas, erro = fut.result()
+            if erro is None:
+                manifesto[script] = {"estilo": ch_estilo, "saidas": saidas, "entradas": entradas}
+                situacao[script] = "ok"
+            else:
+                manifesto.pop(script, None)
+                situacao[script] = erro
+            _gravar_manifesto(arq_manifesto, manifesto)
+    return situacao
+
+
+def verificar_cache_lateral() -> None:
+    """
+    Regressão: com o cache lateral do .xsec já existente, mudar o .xsec
+    deve refazer a figura (e não pulá-la pelo manifesto).
+    """
+    import tempfile
+    import numpy as np
+    from leitura_espectros import ler_xsec
+
+    with tempfile.TemporaryDirectory() as d:
+        dados = os.path.join(d, "dados.xsec")
+        script = os.path.join(d, "graph_teste.py")
+        np.savetxt(dados, np.column_stack([np.arange(10.0), np.arange(10.0)]))
+        ler_xsec(dados)                                  # cache criado antes da 1ª renderização
+        with open(script, "w", encoding="utf-8") as f:
+            f.write("import sys\n"
+                    f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})\n"
+                    "import matplotlib.pyplot as plt\n"
+                    "from leitura_espectros import ler_xsec\n"
+                    "d = ler_xsec('dados.xsec')\n"
+                    "plt.plot(d[:, 0], d[:, 1])\n"
+                    "plt.show()\n")
+        saida = os.path.join(d, "saida")
+        assert renderizar([script], saida, processos=1) == {script: "ok"}
+        assert renderizar([script], saida, processos=1) == {script: "pulado"}
+        np.savetxt(dados, np.column_stack([np.arange(10.0), np.arange(10.0) ** 2]))
+        situacao = renderizar([script], saida, processos=1)
+        assert situacao == {script: "ok"}, f"origem alterada com cache presente: {situacao}"
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Renderiza em lote as figuras dos scripts graph_*/emission_* (Agg).")
+    ap.add_argument("scripts", nargs="*", help=f"scripts de figura (padrão: {' '.join(PADROES)})")
+    ap.add_argument("--saida", default=SAIDA_PADRAO, help="diretório das figuras")
+    ap.add_argument("--formatos", nargs="+", default=FORMATOS, choices=["png", "pdf", "svg"])
+    ap.add_argument("--dpi", type=int, default=DPI)
+    ap.add_argument("--estilo", default=None, help="folha de estilo do matplotlib (.mplstyle ou nome)")
+    ap.add_argument("--processos", type=int, default=None, help="processos no pool (padrão: nº de núcleos)")
+    ap.add_argument("--forcar", action="store_true", help="ignora o manifesto e refaz tudo")
+    ap.add_argument("--verificar", action="store_true",
+                    help="só roda a verificação de regressão do cache lateral e sai")
+    args = ap.parse_args(argv)
+
+    if args.verificar:
+        verificar_cache_lateral()
+        print("verificação do cache lateral: ok")
+        return
+
+    scripts = args.scripts or scripts_padrao()
+    situacao = renderizar(scripts, args.saida, args.formatos, args.dpi, args.estilo,
+                          args.processos, args.forcar)
+    for script in sorted(situacao):
+        s = situacao[script]
+        nome = os.path.basename(script)
+        if s in ("ok", "pulado"):
+            print(f"{nome:45s} {s}")
+        else:
+            print(f"{nome:45s} ERRO: {s.strip().splitlines()[-1]}")
+    n_ok = sum(s == "ok" for s in situacao.values())
+    n_pul = sum(s == "pulado" for s in situacao.values())
+    print(f"\n{n_ok} renderizados, {n_pul} pulados, {len(situacao) - n_ok - n_pul} com erro → {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
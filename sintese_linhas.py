@@ -0,0 +1,293 @@
+# ================================================================
+# Síntese de seções de choque a partir de listas de linhas ExoMol
+# (.states + .trans) → σ(ν̃, T) [cm²/molécula] numa malha uniforme
+# As transições são lidas em blocos (texto ou .bz2), as intensidades
+# em T vêm da função de partição e cada linha é alargada por um
+# perfil de Voigt truncado (corte nas asas) e somada à malha
+# ================================================================
+
+import argparse
+import bz2
+import os
+
+import numpy as np
+
+from espectro_uniforme import EspectroUniforme
+from leitura_espectros import ler_texto, ler_xsec
+from perfil_voigt import voigt
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+NU_MIN, NU_MAX, PASSO = 50.0, 10000.0, 0.01   # malha de saída [cm^-1]
+T_K = 1200.0             # temperatura [K]
+P_ATM = 1.0              # pressão total [atm] (alargamento de Lorentz)
+MASSA_UMA = 17.02655     # massa molecular do 14NH3 [u]
+GAMMA_REF = 0.0700       # meia-largura de Lorentz a T_REF e 1 atm [cm^-1/atm]
+N_TEMP = 0.5             # expoente de temperatura de γ (γ ∝ (T_REF/T)^n)
+T_REF = 296.0
+CORTE_CM = 25.0          # corte máximo das asas [cm^-1]
+CORTE_LARGURAS = 100.0   # corte em meias-larguras de Voigt (o menor dos dois vale)
+INTENSIDADE_MIN = 0.0    # linhas com S < INTENSIDADE_MIN [cm/molécula] são ignoradas
+METODO_VOIGT = "weideman"        # perfil_voigt.py: "weideman", "humlicek" ou "referencia"
+BYTES_POR_BLOCO = 1 << 24        # bytes do .trans lidos por vez
+ELEMENTOS_POR_BLOCO = 1 << 21    # pontos de perfil avaliados por lote de linhas
+FORMATO = "%12.6f %13.6E"        # mesmo layout dos .xsec do ExoMol
+# ---------------------------------------------------------------
+
+# ---------------------- CONSTANTES ----------------------
+C2 = 1.438776877          # hc/k [cm·K]
+C_CM = 2.99792458e10      # velocidade da luz [cm/s]
+K_B = 1.380649e-23        # Boltzmann [J/K]
+UMA = 1.66053906660e-27   # unidade de massa atômica [kg]
+# -------------------------------------------------------
+
+
+def _abrir(arq: str):
+    """Abre texto puro ou comprimido (.bz2) em modo binário."""
+    return bz2.open(arq, "rb") if arq.endswith(".bz2") else open(arq, "rb")
+
+# ===================== ESTADOS E FUNÇÃO DE PARTIÇÃO =====================
+
+def ler_estados(arq_states: str) -> tuple:
+    """
+    Lê as três primeiras colunas do .states (ID, energia [cm^-1], g_tot).
+    Retorna (E, g) indexados pelo ID do estado (posições sem estado: g = 0).
+    """
+    with _abrir(arq_states) as f:
+        d = np.loadtxt(f, usecols=(0, 1, 2), ndmin=2)
+    ids = d[:, 0].astype(np.int64)
+    E = np.zeros(ids.max() + 1)
+    g = np.zeros(ids.max() + 1)
+    E[ids], g[ids] = d[:, 1], d[:, 2]
+    return E, g
+
+
+def funcao_particao(E: np.ndarray, g: np.ndarray, T) -> np.ndarray:
+    """Q(T) = Σ g_i exp(−c2 E_i / T), somada sobre os estados."""
+    T = np.asarray(T, dtype=float)
+    return np.sum(g * np.exp(-C2 * E / T[..., None]), axis=-1) if T.ndim \
+        else float(np.sum(g * np.exp(-C2 * E / T)))
+
+
+def ler_funcao_particao(arq_pf: str, T: float) -> float:
+    """Q(T) interpolado no arquivo .pf do ExoMol (colunas T, Q)."""
+    d = ler_xsec(arq_pf)
+    return float(np.interp(T, d[:, 0], d[:, 1]))
+
+# ===================== TRANSIÇÕES (EM BLOCOS) =====================
+
+def blocos_transicoes(arq_trans: str, bytes_por_bloco: int = BYTES_POR_BLOCO):
+    """Gera (i_sup, i_inf, A [s^-1]) por bloco de linhas completas do .trans."""
+    resto = b""
+    with _abrir(arq_trans) as f:
+        while True:
+            dados = f.read(bytes_por_bloco)
+            if not dados:
+                break
+            dados = resto + dados
+            corte = dados.rfind(b"\n") + 1
+            resto = dados[corte:]
+            if corte:
+                yield _colunas_trans(ler_texto(dados[:corte]))
+    if resto.strip():
+        yield _colunas_trans(ler_texto(resto + b"\n"))
+
+
+def _colunas_trans(m: np.ndarray) -> tuple:
+    return m[:, 0].astype(np.int64), m[:, 1].astype(np.int64), m[:, 2]
+
+
+def intensidades(nu: np.ndarray, A: np.ndarray, g_sup: np.ndarray, E_inf: np.ndarray,
+                 T: float, Q: float) -> np.ndarray:
+    """
+    Intensidade integrada S [cm/molécula]:
+    S = g' A / (8π c ν̃²) · e^{−c2 E''/T} (1 − e^{−c2 ν̃/T}) / Q(T)
+    """
+    return (g_sup * A / (8.0 * np.pi * C_CM * nu**2)
+            * np.exp(-C2 * E_inf / T) * -np.expm1(-C2 * nu / T) / Q)
+
+# ===================== PERFIL DE VOIGT =====================
+
+def larguras(nu: np.ndarray, T: float, p_atm: float, massa_uma: float = MASSA_UMA,
+             gamma_ref: float = GAMMA_REF, n_temp: float = N_TEMP) -> tuple:
+    """(σ_G desvio-padrão Doppler, γ_L meia-largura de Lorentz) [cm^-1]."""
+    sigma = nu * np.sqrt(K_B * T / (massa_uma * UMA)) / (C_CM / 100.0)
+    gamma = gamma_ref * p_atm * (T_REF / T) ** n_temp
+    return sigma, np.broadcast_to(gamma, np.shape(nu))
+
+
+def meia_largura_voigt(sigma, gamma):
+    """Meia-largura do Voigt (aproximação de Olivero–Longbothum)."""
+    f_G = sigma * np.sqrt(2.0 * np.log(2.0))
+    return 0.5346 * gamma + np.sqrt(0.2166 * gamma**2 + f_G**2)
+
+
+def _somar(sigma_out: np.ndarray, idx: np.ndarray, pesos: np.ndarray) -> None:
+    """sigma_out[idx] += pesos (índices repetidos somados) só no trecho [min(idx), max(idx)]."""
+    if idx.size == 0:
+        return
+    i_min, i_max = int(idx.min()), int(idx.max())
+    sigma_out[i_min:i_max + 1] += np.bincount(idx - i_min, weights=pesos, minlength=i_max - i_min + 1)
+
+
+def acumular_linhas(sigma_out: np.ndarray, inicio: float, passo: float, nu0: np.ndarray,
+                    S: np.ndarray, sig: np.ndarray, gam: np.ndarray,
+                    corte_cm: float = CORTE_CM, corte_larguras: float = CORTE_LARGURAS,
+                    elementos_por_bloco: int = ELEMENTOS_POR_BLOCO,
+                    metodo_voigt: str = METODO_VOIGT) -> None:
+    """
+    Soma S · Voigt(ν̃ − ν̃_0) de cada linha em `sigma_out` (malha inicio + i·passo),
+    só nos pontos a menos de min(corte_cm, corte_larguras · HWHM) do centro.
+    As linhas são agrupadas pela janela comum de K pontos (potência de 2; no
+    máximo o dobro da necessária) e, em cada grupo, ordenadas por ν̃_0: cada
+    lote cobre um trecho contíguo da malha e só esse trecho é somado.
+    Linhas mais estreitas que o passo (forma não resolvida pela malha) têm a
+    intensidade dividida linearmente entre os dois pontos vizinhos, o que
+    conserva ∫ σ dν̃ (amostrar o perfil as faria sumir entre os pontos).
+    """
+    n = sigma_out.size
+    hwhm = meia_largura_voigt(sig, gam)
+    estreita = hwhm < passo
+    if estreita.any():
+        p = (nu0[estreita] - inicio) / passo
+        i0 = np.floor(p).astype(np.int64)
+        f = p - i0
+        for idx, w in ((i0, 1.0 - f), (i0 + 1, f)):
+            ok = (idx >= 0) & (idx < n)
+            _somar(sigma_out, idx[ok], S[estreita][ok] * w[ok] / passo)
+        larga = ~estreita
+        nu0, S, sig, gam, hwhm = nu0[larga], S[larga], sig[larga], gam[larga], hwhm[larga]
+
+    corte = np.minimum(corte_cm, corte_larguras * hwhm)
+    janela = 2 * np.ceil(corte / passo).astype(np.int64) + 2
+    # K = menor potência de 2 >= janela (frexp dá o expoente exato para inteiros)
+    K_linha = np.left_shift(1, np.frexp((janela - 1).astype(np.float64))[1]).astype(np.int64)
+    ordem = np.lexsort((nu0, K_linha))
+    nu0, S, sig, gam, corte, K_linha = (v[ordem] for v in (nu0, S, sig, gam, corte, K_linha))
+    i = 0
+    while i < nu0.size:
+        K = int(K_linha[i])
+        fim = int(np.searchsorted(K_linha, K, side="right"))
+        m = min(fim - i, max(1, elementos_por_bloco // K))
+        b = slice(i, i + m)
+        i0 = np.floor((nu0[b] - corte[b] - inicio) / passo).astype(np.int64) + 1
+        idx = i0[:, None] + np.arange(K)
+        x = inicio + passo * idx - nu0[b, None]
+        valido = (idx >= 0) & (idx < n) & (np.abs(x) <= corte[b, None])
+        perfil = voigt(x[valido], np.broadcast_to(sig[b, None], x.shape)[valido],
+                       np.broadcast_to(gam[b, None], x.shape)[valido], metodo_voigt)
+        pesos = perfil * np.broadcast_to(S[b, None], x.shape)[valido]
+        _somar(sigma_out, idx[valido], pesos)
+        i += m
+
+
+def sintetizar(arq_states: str, arqs_trans, T: float = T_K, p_atm: float = P_ATM,
+               inicio: float = NU_MIN, fim: float = NU_MAX, passo: float = PASSO,
+               arq_pf: str | None = None, massa_uma: float = MASSA_UMA,
+               gamma_ref: float = GAMMA_REF, n_temp: float = N_TEMP,
+               corte_cm: float = CORTE_CM, corte_larguras: float = CORTE_LARGURAS,
+               intensidade_min: float = INTENSIDADE_MIN,
+               bytes_por_bloco: int = BYTES_POR_BLOCO,
+               metodo_voigt: str = METODO_VOIGT) -> EspectroUniforme:
+    """
+    σ(ν̃, T) [cm²/molécula] na malha inicio:passo:fim a partir da lista de linhas.
+
+    arqs_trans : um ou mais arquivos .trans (texto ou .bz2), lidos em blocos.
+    Q(T) vem de arq_pf (.pf do ExoMol) ou da soma sobre os estados.
+    """
+    if isinstance(arqs_trans, (str, os.PathLike)):
+        arqs_trans = [arqs_trans]
+    E, g = ler_estados(arq_states)
+    Q = ler_funcao_particao(arq_pf, T) if arq_pf else funcao_particao(E, g, T)
+    n = int(round((fim - inicio) / passo)) + 1
+    sigma = np.zeros(n)
+    for arq in arqs_trans:
+        for i_sup, i_inf, A in blocos_transicoes(arq, bytes_por_bloco):
+            nu = E[i_sup] - E[i_inf]
+            ok = (nu > 0) & (nu >= inicio - corte_cm) & (nu <= fim + corte_cm)
+            nu, A, i_sup, i_inf = nu[ok], A[ok], i_sup[ok], i_inf[ok]
+            S = intensidades(nu, A, g[i_sup], E[i_inf], T, Q)
+            forte = S >= intensidade_min
+            if not forte.any():
+                continue
+            sig, gam = larguras(nu[forte], T, p_atm, massa_uma, gamma_ref, n_temp)
+            acumular_linhas(sigma, inicio, passo, nu[forte], S[forte], sig, np.array(gam),
+                            corte_cm, corte_larguras, metodo_voigt=metodo_voigt)
+    return EspectroUniforme(sigma, inicio, passo)
+
+
+def gerar_lista_sintetica(diretorio: str, n_estados: int = 2000, n_transicoes: int = 200_000,
+                          E_max: float = 6000.0, semente: int = 0) -> tuple:
+    """
+    Grava uma lista de linhas sintética (sintetico.states / sintetico.trans, no
+    layout do ExoMol) para verificar a síntese sem baixar dados.
+    Retorna (arq_states, arq_trans).
+    """
+    rng = np.random.default_rng(semente)
+    E = np.sort(rng.uniform(0.0, E_max, n_estados))
+    E[0] = 0.0
+    g = rng.integers(1, 30, n_estados)
+    sup = rng.integers(1, n_estados + 1, n_transicoes)
+    inf = rng.integers(1, n_estados + 1, n_transicoes)
+    troca = E[sup - 1] < E[inf - 1]
+    sup[troca], inf[troca] = inf[troca], sup[troca]
+    A = 10.0 ** rng.uniform(-3.0, 2.0, n_transicoes)
+
+    os.makedirs(diretorio, exist_ok=True)
+    arq_states = os.path.join(diretorio, "sintetico.states")
+    arq_trans = os.path.join(diretorio, "sintetico.trans")
+    with open(arq_states, "w", encoding="utf-8") as f:
+        for i in range(n_estados):
+            f.write(f"{i + 1:12d} {E[i]:12.6f} {g[i]:6d} {i % 20:7d}  A1' Inf\n")
+    np.savetxt(arq_trans, np.column_stack([sup, inf, A]), fmt="%12d %12d %10.4E")
+    return arq_states, arq_trans
+
+
+def salvar_xsec(arq: str, espectro: EspectroUniforme) -> None:
+    """Grava (nu, sigma) no formato de 2 colunas dos .xsec (.npy → binário)."""
+    dados = np.column_stack([espectro.nu, espectro.valores])
+    if arq.endswith(".npy"):
+        np.save(arq, dados)
+    else:
+        np.savetxt(arq, dados, fmt=FORMATO)
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="σ(ν̃, T) a partir de listas de linhas ExoMol (.states/.trans).")
+    ap.add_argument("states", nargs="?", help="arquivo .states (ou .states.bz2)")
+    ap.add_argument("trans", nargs="*", help="arquivo(s) .trans (ou .trans.bz2)")
+    ap.add_argument("--sintetico", metavar="DIR", default=None,
+                    help="gera e usa uma lista de linhas sintética em DIR (teste offline)")
+    ap.add_argument("--saida", required=True, help="arquivo (nu, sigma) de saída (.npy → binário)")
+    ap.add_argument("--T", type=float, default=T_K, help="temperatura [K]")
+    ap.add_argument("--P", type=float, default=P_ATM, help="pressão [atm]")
+    ap.add_argument("--pf", default=None, help="arquivo .pf com Q(T) (padrão: soma nos estados)")
+    ap.add_argument("--malha", type=float, nargs=3, default=[NU_MIN, NU_MAX, PASSO],
+                    metavar=("INICIO", "FIM", "PASSO"))
+    ap.add_argument("--massa", type=float, default=MASSA_UMA, help="massa molecular [u]")
+    ap.add_argument("--gamma", type=float, default=GAMMA_REF, help="γ_ref [cm^-1/atm]")
+    ap.add_argument("--n", type=float, default=N_TEMP, help="expoente de temperatura de γ")
+    ap.add_argument("--corte", type=float, default=CORTE_CM, help="corte das asas [cm^-1]")
+    ap.add_argument("--corte-larguras", type=float, default=CORTE_LARGURAS,
+                    help="corte das asas em meias-larguras de Voigt")
+    ap.add_argument("--smin", type=float, default=INTENSIDADE_MIN, help="intensidade mínima [cm/molécula]")
+    ap.add_argument("--voigt", default=METODO_VOIGT, choices=["weideman", "humlicek", "referencia"],
+                    help="aproximação do perfil de Voigt (perfil_voigt.py)")
+    args = ap.parse_args(argv)
+
+    if args.sintetico:
+        args.states, trans = gerar_lista_sintetica(args.sintetico)
+        args.trans = [trans]
+    elif not args.states or not args.trans:
+        ap.error("informe os arquivos .states e .trans (ou --sintetico DIR).")
+
+    inicio, fim, passo = args.malha
+    esp = sintetizar(args.states, args.trans, args.T, args.P, inicio, fim, passo, args.pf,
+                     args.massa, args.gamma, args.n, args.corte, args.corte_larguras, args.smin,
+                     metodo_voigt=args.voigt)
+    salvar_xsec(args.saida, esp)
+    print(f"σ sintetizado a T = {args.T:g} K, p = {args.P:g} atm: {esp.n} pontos → {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+# ================================================================
+# Varredura da emitância LBL em (T, S, p) num pool de processos
+# Os espectros κ(η) são compartilhados por np.memmap (cache .npy do
+# ler_xsec) em vez de serem serializados para cada processo; cada
+# fragmento (T, bloco de casos) é gravado na tabela CSV assim que
+# termina, e uma execução interrompida continua de onde parou
+# ================================================================
+
+import argparse
+import csv
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from emitancia_lbl import emitancia_total
+from leitura_espectros import ler_texto, ler_xsec
+
+# --------------------- CONFIGURAÇÕES PADRÃO ---------------------
+S_PADRAO = [30.0, 10.0, 1.0, 0.1]   # percursos [m] (os das planilhas de emissão)
+P_PADRAO = [1.0]                    # pressões parciais do absorvedor [bar]
+P_REF = 1.0                         # pressão dos arquivos κ [bar]
+CASOS_POR_FRAGMENTO = 64            # pares (S, p) calculados por tarefa
+COLUNAS = ["T_K", "S_m", "p_bar", "emitancia"]
+# ---------------------------------------------------------------
+
+
+def _chave(T: float, S: float, p: float) -> tuple:
+    return float(T), float(S), float(p)
+
+
+def _processar_fragmento(tarefa):
+    """Worker: abre o κ por memmap e calcula ε para os comprimentos efetivos do fragmento."""
+    arq, T, S_eff = tarefa
+    data = ler_xsec(arq)
+    return emitancia_total(data[:, 0], data[:, 1], T, S_eff)
+
+
+def casos_concluidos(arq_saida: str) -> set:
+    """
+    Chaves (T, S, p) já gravadas em `arq_saida`. Uma última linha incompleta
+    (execução interrompida no meio da escrita) é descartada do arquivo.
+    """
+    if not os.path.exists(arq_saida):
+        return set()
+    with open(arq_saida, "rb+") as f:
+        conteudo = f.read()
+        if conteudo and not conteudo.endswith(b"\n"):
+            f.truncate(conteudo.rfind(b"\n") + 1)
+    feitos = set()
+    with open(arq_saida, "r", encoding="utf-8", newline="") as f:
+        for linha in csv.reader(f):
+            try:
+                T, S, p, _ = (float(v) for v in linha)
+            except ValueError:
+                continue        # cabeçalho ou linha inválida
+            feitos.add(_chave(T, S, p))
+    return feitos
+
+
+def varrer(arquivos: dict, S, p, arq_saida: str, p_ref: float = P_REF,
+           processos: int | None = None,
+           casos_por_fragmento: int = CASOS_POR_FRAGMENTO) -> int:
+    """
+    Calcula ε(T, S, p) para todas as combinações e grava em `arq_saida` (CSV).
+
+    arquivos : {T [K]: arquivo κ (nu, kappa) na pressão p_ref}
+    S, p     : percursos [m] e pressões parciais [bar]
+    Como κ ∝ p (mesma forma de linha), ε(T, S, p) = ε(T, S·p/p_ref, p_ref):
+    cada fragmento é um único passe de emitancia_total com comprimentos efetivos.
+    Casos já presentes em `arq_saida` são pulados. Retorna o nº de casos calculados.
+    """
+    S = np.atleast_1d(np.asarray(S, dtype=float))
+    p = np.atleast_1d(np.asarray(p, dtype=float))
+    for T in arquivos:
+        ler_xsec(arquivos[T])          # gera os caches .npy antes de abrir o pool
+
+    feitos = casos_concluidos(arq_saida)
+    tarefas = []
+    for T in sorted(arquivos):
+        pendentes = [(s, pi) for pi in p.tolist() for s in S.tolist() if _chave(T, s, pi) not in feitos]
+        for i in range(0, len(pendentes), casos_por_fragmento):
+            casos = pendentes[i:i + casos_por_fragmento]
+            tarefas.append((float(T), casos))
+    if not tarefas:
+        return 0
+
+    novo = not os.path.exists(arq_saida) or os.path.getsize(arq_saida) == 0
+    n = 0
+    with ProcessPoolExecutor(max_workers=processos) as pool, \
+            open(arq_saida, "a", encoding="utf-8", newline="") as f:
+        escritor = csv.writer(f)
+        if novo:
+            escritor.writerow(COLUNAS)
+        futuros = {}
+        for T, casos in tarefas:
+            S_eff = np.array([s * pi / p_ref for s, pi in casos])
+            futuros[pool.submit(_processar_fragmento, (arquivos[T], T, S_eff))] = (T, casos)
+        for fut in as_completed(futuros):
+            T, casos = futuros[fut]
+            eps = fut.result()
+            escritor.writerows([repr(T), repr(s), repr(pi), repr(float(e))]
+                               for (s, pi), e in zip(casos, eps))
+            f.flush()
+            n += len(casos)
+    return n
+
+
+def carregar_resultados(arq_saida: str, T=None, S=None, p=None) -> tuple:
+    """
+    Lê a tabela e monta a grade ε[T, S, p] (NaN nos casos ausentes).
+    Sem T/S/p, usa os valores distintos presentes no arquivo.
+    Retorna (T, S, p, eps).
+    """
+    with open(arq_saida, "rb") as f:
+        f.readline()                                   # cabeçalho T,S,p,eps
+        d = ler_texto(f.read().replace(b",", b" "))
+    T = np.unique(d[:, 0]) if T is None else np.asarray(T, dtype=float)
+    S = np.unique(d[:, 1]) if S is None else np.asarray(S, dtype=float)
+    p = np.unique(d[:, 2]) if p is None else np.asarray(p, dtype=float)
+    eps = np.full((T.size, S.size, p.size), np.nan)
+    iT = {v: i for i, v in enumerate(T.tolist())}
+    iS = {v: i for i, v in enumerate(S.tolist())}
+    ip = {v: i for i, v in enumerate(p.tolist())}
+    for t, s, pi, e in d:
+        if t in iT and s in iS and pi in ip:
+            eps[iT[t], iS[s], ip[pi]] = e
+    return T, S, p, eps
+
+# ===================== LINHA DE COMANDO =====================
+
+def main(argv=None) -> None:
+    ap = argparse.ArgumentParser(description="Varredura paralela da emitância LBL em (T, S, p).")
+    ap.add_argument("espectros", nargs="+", metavar="T=ARQUIVO",
+                    help="temperatura [K] e arquivo (nu, kappa), ex.: 1200=kappa_1200K.txt")
+    ap.add_argument("--S", type=float, nargs="+", default=S_PADRAO, help="percursos [m]")
+    ap.add_argument("--S-log", type=float, nargs=3, default=None, metavar=("S_MIN", "S_MAX", "N"),
+                    help="N percursos log-espaçados entre S_MIN e S_MAX (substitui --S)")
+    ap.add_argument("--p", type=float, nargs="+", default=P_PADRAO, help="pressões parciais [bar]")
+    ap.add_argument("--p-ref", type=float, default=P_REF, help="pressão dos arquivos κ [bar]")
+    ap.add_argument("--saida", default="varredura_lbl.csv", help="tabela de resultados (CSV)")
+    ap.add_argument("--processos", type=int, default=None, help="processos no pool (padrão: nº de núcleos)")
+    ap.add_argument("--casos", type=int, default=CASOS_POR_FRAGMENTO, help="pares (S, p) por fragmento")
+    args = ap.parse_args(argv)
+
+    arquivos = {}
+    for item in args.espectros:
+        t, _, arq = item.partition("=")
+        if not arq:
+            ap.error(f"use T=ARQUIVO (recebido '{item}').")
+        arquivos[float(t)] = arq
+    S = args.S if args.S_log is None else np.geomspace(args.S_log[0], args.S_log[1], int(args.S_log[2]))
+
+    n = varrer(arquivos, S, args.p, args.saida, args.p_ref, args.processos, args.casos)
+    total = len(arquivos) * len(S) * len(args.p)
+    print(f"{n} casos calculados ({total - n} já estavam em {args.saida}); total {total}.")
+
+
+if __name__ == "__main__":
+    main()